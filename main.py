@@ -172,11 +172,12 @@ def main():
     print("[1] Processar coleta de dados (e-mails e telefones)")
     print("[2] Enriquecer endereços (ViaCEP)")
     print("[3] Processar geolocalização (Nominatim)")
-    print("[4] Sair")
+    print("[4] Pipeline completo (coleta + CEP + geolocalização em paralelo)")
+    print("[5] Sair")
     print("\n📊 Para gerar planilha Excel, use o dashboard web durante o processamento")
 
     while True:
-        opcao = input("\nEscolha uma opção (1-4): ").strip()
+        opcao = input("\nEscolha uma opção (1-5): ").strip()
 
         if opcao == '1':
             # Verificar se precisa resetar ou continuar APENAS para coleta
@@ -285,10 +286,32 @@ def main():
                 print(f"\n[OK] Processamento concluído: {result['geocodificadas']}/{result['total']} geocodificadas")
             break
         elif opcao == '4':
+            if not _handle_reset_option(db_service):
+                break
+            print("\n[INFO] Iniciando pipeline: coleta, CEP e geolocalização simultâneos...")
+            from src.application.services.pipeline_application_service import PipelineApplicationService
+            pipeline_service = PipelineApplicationService()
+
+            try:
+                print("[INFO] Iniciando dashboard web...")
+                dashboard = start_dashboard()
+                if dashboard:
+                    try:
+                        webbrowser.open('http://127.0.0.1:5000')
+                        print("[OK] Dashboard aberto no navegador")
+                    except:
+                        print("[AVISO] Não foi possível abrir o navegador automaticamente")
+                        print("[INFO] Acesse manualmente: http://127.0.0.1:5000")
+            except Exception as e:
+                print(f"[AVISO] Dashboard web não disponível: {e}")
+
+            success = pipeline_service.execute()
+            break
+        elif opcao == '5':
             print("\n[INFO] Saindo...")
             return 0
         else:
-            print("[ERRO] Opção inválida. Digite 1, 2, 3 ou 4.")
+            print("[ERRO] Opção inválida. Digite 1, 2, 3, 4 ou 5.")
 
     try:
         # Mostrar estatísticas finais
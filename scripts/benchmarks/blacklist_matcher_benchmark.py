@@ -0,0 +1,108 @@
+"""
+Benchmark do matcher de blacklist - compara busca ingênua com matcher pré-compilado
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path (config.settings depende do diretório atual)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+import tldextract
+
+from config.settings import BLACKLIST_HOSTS
+from src.infrastructure.utils.domain_matcher import get_blacklist_matcher
+
+TOTAL_URLS = 1_000_000
+UNIQUE_HOSTS = 50_000
+BLACKLISTED_RATIO = 0.2
+SEED = 42
+
+PATHS = ["", "/", "/contato", "/sobre-nos", "/servicos/manutencao", "/produtos/elevador-residencial",
+         "/blog/noticias", "/index.php?id=10", "/fale-conosco?utm_source=google"]
+TLDS = ["com.br", "com", "net.br", "ind.br", "eng.br"]
+
+
+def generate_urls(total: int) -> list:
+    """Gera URLs sintéticas (mistura de sites comerciais e hosts da blacklist)"""
+    rng = random.Random(SEED)
+    hosts = [f"elevadores{i}.{rng.choice(TLDS)}" for i in range(UNIQUE_HOSTS)]
+    blacklisted = [p for p in BLACKLIST_HOSTS if '.' in p]
+
+    urls = []
+    for _ in range(total):
+        scheme = rng.choice(["https://", "http://"])
+        prefix = rng.choice(["", "www."])
+        if rng.random() < BLACKLISTED_RATIO:
+            host = rng.choice(blacklisted)
+        else:
+            host = rng.choice(hosts)
+        urls.append(f"{scheme}{prefix}{host}{rng.choice(PATHS)}")
+    return urls
+
+
+# Mesmo algoritmo do tldextract.extract() usado antes, sem buscar a lista de sufixos na rede
+_legacy_extractor = tldextract.TLDExtract(suffix_list_urls=())
+
+
+def naive_is_blacklisted(url: str) -> bool:
+    """Implementação anterior (substring de cada padrão na URL)"""
+    url_lower = url.lower()
+    return any(host in url_lower for host in BLACKLIST_HOSTS)
+
+
+def naive_classify(url: str) -> tuple:
+    """Fluxo anterior por URL: blacklist por substring + extract_domain_from_url"""
+    ext = _legacy_extractor(url.strip())
+    domain = f"{ext.domain}.{ext.suffix}" if ext.domain and ext.suffix else url
+    return domain, naive_is_blacklisted(url)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(total: int = TOTAL_URLS):
+    """Executa benchmark e imprime resultados"""
+    print(f"[BENCH] Gerando {total:,} URLs sintéticas...")
+    urls = generate_urls(total)
+
+    print("[BENCH] Fluxo anterior (any(pattern in url) + tldextract por URL)...")
+    naive_results, naive_time = _timed(lambda: [naive_classify(url) for url in urls])
+    _, naive_check_time = _timed(lambda: [naive_is_blacklisted(url) for url in urls])
+
+    print("[BENCH] Matcher pré-compilado (trie de sufixos + Aho-Corasick)...")
+    matcher, build_time = _timed(lambda: get_blacklist_matcher(BLACKLIST_HOSTS))
+    classifications, matcher_time = _timed(lambda: matcher.classify_batch(urls))
+    _, matcher_check_time = _timed(lambda: [matcher.is_blacklisted(url) for url in urls])
+
+    divergences = sum(1 for (_, naive), result in zip(naive_results, classifications)
+                      if naive != result.blacklisted)
+
+    def per_url(seconds: float) -> str:
+        return f"{seconds:8.2f}s ({seconds / total * 1e6:6.2f} µs/URL)"
+
+    print("=" * 68)
+    print(f"   URLs:                          {total:,}")
+    print(f"   Compilação do matcher:         {build_time * 1000:8.2f}ms")
+    print("   --- Classificação completa (domínio + blacklist) ---")
+    print(f"   Anterior:                      {per_url(naive_time)}")
+    print(f"   classify_batch:                {per_url(matcher_time)}")
+    print(f"   Speedup:                       {naive_time / max(matcher_time, 1e-9):8.2f}x")
+    print("   --- Apenas blacklist ---")
+    print(f"   any(pattern in url):           {per_url(naive_check_time)}")
+    print(f"   is_blacklisted:                {per_url(matcher_check_time)}")
+    print(f"   Speedup:                       {naive_check_time / max(matcher_check_time, 1e-9):8.2f}x")
+    print(f"   Bloqueadas (matcher):          {sum(1 for c in classifications if c.blacklisted):,}")
+    print(f"   Divergências:                  {divergences:,} (falsos positivos de substring, ex: 'x.com')")
+    print("=" * 68)
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL_URLS)
@@ -0,0 +1,101 @@
+"""
+Benchmark do perfil lean fetch - tempo de carregamento e bytes por site (normal x bloqueio de recursos)
+
+Uso: python scripts/benchmarks/lean_fetch_benchmark.py [arquivo_com_urls.txt]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path (config.settings depende do diretório atual)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+from src.infrastructure.drivers.lean_fetch import LeanFetchProfile
+from src.infrastructure.drivers.web_driver import WebDriverManager
+
+PAGE_LOAD_TIMEOUT = 15
+DEFAULT_URLS = [
+    "https://www.atlas.schindler.com/pt/br/",
+    "https://www.otis.com/pt/br/",
+    "https://www.tkelevator.com/br-pt/",
+    "https://www.elevadoresvillarta.com.br/",
+    "https://www.orona.com.br/",
+]
+
+
+def load_urls() -> list:
+    """URLs do arquivo informado (uma por linha) ou lista padrão"""
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip().startswith('http')]
+    return DEFAULT_URLS
+
+
+def measure(driver, profile: LeanFetchProfile, url: str) -> dict:
+    """Abre URL em nova aba com o perfil informado e mede tempo/bytes"""
+    start = time.perf_counter()
+    profile.open_tab(driver, url, page_load_timeout=PAGE_LOAD_TIMEOUT)
+    if not profile.enabled:
+        # window.open não bloqueia: aguarda carregamento completo para comparar igual
+        deadline = start + PAGE_LOAD_TIMEOUT
+        while time.perf_counter() < deadline and \
+                driver.execute_script("return document.readyState") != "complete":
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    weight = LeanFetchProfile.page_weight(driver)
+
+    driver.close()
+    driver.switch_to.window(driver.window_handles[0])
+    return {'seconds': elapsed, 'bytes': weight.get('bytes', 0), 'resources': weight.get('resources', 0)}
+
+
+def run_benchmark():
+    """Executa benchmark e imprime resultados"""
+    urls = load_urls()
+    manager = WebDriverManager()
+    if not manager.start_driver():
+        print("[ERRO] Falha ao iniciar driver")
+        return
+
+    normal = LeanFetchProfile()
+    normal.enabled = False
+    lean = LeanFetchProfile()
+    lean.enabled = True
+
+    results = {'normal': [], 'lean': []}
+    try:
+        for i, url in enumerate(urls, 1):
+            # Alterna a ordem para não favorecer um perfil com cache HTTP/DNS
+            order = [('normal', normal), ('lean', lean)] if i % 2 else [('lean', lean), ('normal', normal)]
+            for name, profile in order:
+                try:
+                    result = measure(manager.driver, profile, url)
+                    results[name].append(result)
+                    print(f"[BENCH] {i}/{len(urls)} {name:6} {result['seconds']:6.2f}s "
+                          f"{result['bytes'] / 1024:8.1f}KB {result['resources']:4} recursos  {url}")
+                except Exception as e:
+                    print(f"[BENCH] {i}/{len(urls)} {name:6} erro: {str(e)[:60]}")
+    finally:
+        manager.close_driver()
+
+    def average(name: str, key: str) -> float:
+        values = [r[key] for r in results[name]]
+        return sum(values) / len(values) if values else 0.0
+
+    print("=" * 60)
+    print(f"   Sites:                    {len(urls)}")
+    for name in ('normal', 'lean'):
+        print(f"   {name:6} tempo médio:      {average(name, 'seconds'):8.2f}s")
+        print(f"   {name:6} bytes médios:     {average(name, 'bytes') / 1024:8.1f}KB")
+    if average('lean', 'seconds'):
+        print(f"   Speedup tempo:            {average('normal', 'seconds') / average('lean', 'seconds'):8.2f}x")
+    if average('normal', 'bytes'):
+        print(f"   Redução de bytes:         {(1 - average('lean', 'bytes') / average('normal', 'bytes')) * 100:8.1f}%")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+"""
+Script de migração para endereço canônico - chave única na TB_ENDERECOS e fusão de duplicados
+"""
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.domain.models.address_model import AddressModel
+from src.infrastructure.repositories.access_repository import AccessRepository
+from src.infrastructure.utils.address_canonicalizer import AddressCanonicalizer
+
+
+def migrate_endereco_canonico():
+    """Adiciona CHAVE_CANONICA, funde endereços equivalentes e cria índice único"""
+
+    print("[MIGRAÇÃO] Canonicalizando endereços...")
+
+    try:
+        repo = AccessRepository()
+
+        try:
+            repo.execute_query("ALTER TABLE TB_ENDERECOS ADD COLUMN CHAVE_CANONICA TEXT(40)")
+            print("[MIGRAÇÃO] ✅ Coluna CHAVE_CANONICA adicionada")
+        except Exception:
+            print("[MIGRAÇÃO] ℹ️  Coluna CHAVE_CANONICA já existe")
+
+        rows = repo.fetch_all("""
+            SELECT ID_ENDERECO, LOGRADOURO, NUMERO, COMPLEMENTO, BAIRRO, CIDADE, ESTADO, CEP
+            FROM TB_ENDERECOS ORDER BY ID_ENDERECO
+        """)
+        groups = {}
+        unkeyed = 0
+        for row in rows:
+            address = AddressModel(logradouro=row[1] or "", numero=row[2] or "", complemento=row[3] or "",
+                                   bairro=row[4] or "", cidade=row[5] or "", estado=row[6] or "", cep=row[7] or "")
+            chave = AddressCanonicalizer.canonical_key(address)
+            if chave is None:
+                unkeyed += 1  # Sem logradouro: CHAVE_CANONICA fica NULL e não é fundido
+                continue
+            groups.setdefault(chave, []).append(row[0])
+
+        merged = 0
+        for chave, ids in groups.items():
+            survivor, duplicates = ids[0], ids[1:]
+            repo.execute_query("UPDATE TB_ENDERECOS SET CHAVE_CANONICA = ? WHERE ID_ENDERECO = ?", [chave, survivor])
+            if not duplicates:
+                continue
+
+            repo.merge_enderecos(survivor, duplicates)
+            merged += len(duplicates)
+
+        try:
+            repo.execute_query("CREATE UNIQUE INDEX UX_ENDERECOS_CHAVE ON TB_ENDERECOS (CHAVE_CANONICA)")
+            print("[MIGRAÇÃO] ✅ Índice único UX_ENDERECOS_CHAVE criado")
+        except Exception:
+            print("[MIGRAÇÃO] ℹ️  Índice UX_ENDERECOS_CHAVE já existe")
+
+        print(f"[MIGRAÇÃO] 🎯 Concluída - {len(rows)} endereços, {len(groups)} únicos, "
+              f"{merged} duplicados fundidos, {unkeyed} sem logradouro")
+
+    except Exception as e:
+        print(f"[MIGRAÇÃO] ❌ Erro na migração: {e}")
+
+
+if __name__ == "__main__":
+    migrate_endereco_canonico()
+    input("\n[INFO] Pressione ENTER para sair...")
@@ -0,0 +1,37 @@
+"""
+Script de migração para adicionar fingerprint SimHash às empresas (detecção de quase-duplicatas)
+"""
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.repositories.access_repository import AccessRepository
+
+
+def migrate_fingerprint():
+    """Adiciona coluna FINGERPRINT na TB_EMPRESAS"""
+
+    print("[MIGRAÇÃO] Adicionando fingerprint de conteúdo...")
+
+    try:
+        repo = AccessRepository()
+
+        try:
+            repo.execute_query("ALTER TABLE TB_EMPRESAS ADD COLUMN FINGERPRINT TEXT(16)")
+            print("[MIGRAÇÃO] ✅ Coluna FINGERPRINT adicionada")
+        except Exception:
+            print("[MIGRAÇÃO] ℹ️  Coluna FINGERPRINT já existe")
+
+        total = repo.fetch_one("SELECT COUNT(*) FROM TB_EMPRESAS")[0]
+        print(f"[MIGRAÇÃO] 🎯 Concluída - {total} empresas existentes (fingerprint preenchido nas próximas visitas)")
+
+    except Exception as e:
+        print(f"[MIGRAÇÃO] ❌ Erro na migração: {e}")
+
+
+if __name__ == "__main__":
+    migrate_fingerprint()
+    input("\n[INFO] Pressione ENTER para sair...")
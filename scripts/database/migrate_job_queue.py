@@ -0,0 +1,55 @@
+"""
+Script de migração para as filas de tarefas (TB_CEP_ENRICHMENT, TB_GEOLOCALIZACAO)
+"""
+import os
+import sys
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path (configuração é lida do diretório atual)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+from src.infrastructure.config.config_manager import ConfigManager
+from src.infrastructure.repositories.access_repository import AccessRepository
+
+TABLES = ['TB_CEP_ENRICHMENT', 'TB_GEOLOCALIZACAO']
+
+
+def migrate_job_queue():
+    """Adiciona PROXIMA_TENTATIVA/VISIVEL_ATE e converte tarefas com status ERRO"""
+
+    print("[MIGRAÇÃO] Preparando filas de tarefas...")
+
+    try:
+        repo = AccessRepository()
+        max_attempts = ConfigManager().job_queue_max_attempts
+
+        for table in TABLES:
+            for column in ('PROXIMA_TENTATIVA', 'VISIVEL_ATE'):
+                try:
+                    repo.execute_query(f"ALTER TABLE {table} ADD COLUMN {column} DATE")
+                    print(f"[MIGRAÇÃO] ✅ {table}.{column} adicionada")
+                except Exception:
+                    print(f"[MIGRAÇÃO] ℹ️  {table}.{column} já existe")
+
+            # ERRO antigo: volta para a fila se ainda tem tentativas, senão vai para dead letter
+            retried = repo.execute_query(f"""
+                UPDATE {table} SET STATUS_PROCESSAMENTO = 'PENDENTE', PROXIMA_TENTATIVA = NULL
+                WHERE STATUS_PROCESSAMENTO = 'ERRO' AND (TENTATIVAS IS NULL OR TENTATIVAS < ?)
+            """, [max_attempts])
+            dead = repo.execute_query(f"""
+                UPDATE {table} SET STATUS_PROCESSAMENTO = 'DESCARTADO'
+                WHERE STATUS_PROCESSAMENTO = 'ERRO'
+            """)
+            print(f"[MIGRAÇÃO] {table}: {retried} tarefas reenfileiradas, {dead} em dead letter")
+
+        print("[MIGRAÇÃO] 🎯 Concluída")
+
+    except Exception as e:
+        print(f"[MIGRAÇÃO] ❌ Erro na migração: {e}")
+
+
+if __name__ == "__main__":
+    migrate_job_queue()
+    input("\n[INFO] Pressione ENTER para sair...")
@@ -2,7 +2,7 @@
 Application Service para enriquecimento de endereços via CEP (separado)
 """
 import time
-from typing import Dict
+from typing import Dict, List
 
 from ...domain.services.address_enrichment_service import AddressEnrichmentService
 from ...infrastructure.repositories.access_repository import AccessRepository
@@ -19,95 +19,151 @@ class CepEnrichmentApplicationService:
         """
         Processa apenas enriquecimento via CEP (sem geolocalização)
         
+        Tarefas são reservadas em lotes e agrupadas por CEP normalizado: uma consulta ao ViaCEP por CEP único,
+        resultado aplicado a todos os endereços do grupo com uma única atualização em lote.
+        
         Returns:
             Dict com estatísticas do processamento
         """
         print("[CEP] 🔍 Iniciando enriquecimento via ViaCEP...")
         
-        # Obter tarefas pendentes
+        # Obter tarefas pendentes (reservadas em lotes de job_queue.claim_batch_size)
         tasks = self.repository.get_pending_cep_enrichment_tasks()
         
         if not tasks:
             print("[CEP] ℹ️  Nenhuma tarefa de enriquecimento CEP pendente")
             return {'total': 0, 'processadas': 0, 'enriquecidas': 0}
         
-        print(f"[CEP] 📋 {len(tasks)} tarefas encontradas")
-        
+        total = 0
+        ceps_unicos = 0
         processadas = 0
         enriquecidas = 0
         
-        for task in tasks:
-            processadas += 1
-            id_cep_enrichment = task['id_cep_enrichment']
-            empresa_id = task['id_empresa']
-            endereco_id = task['id_endereco']
-            address_model = task['address_model']
-            site_url = task['site_url']
+        # Próximo lote só é reservado quando o atual termina: o prazo de visibilidade cobre apenas o lote
+        while tasks:
+            groups = self._group_by_cep(tasks)
+            total += len(tasks)
+            ceps_unicos += len(groups)
+            print(f"[CEP] 📋 Lote com {len(tasks)} tarefas | {len(groups)} CEPs únicos "
+                  f"(dedup {round(len(tasks) / max(len(groups), 1), 2)}x)")
             
-            print(f"[CEP] 🔄 Processando {processadas}/{len(tasks)} | Empresa: {empresa_id}")
-            print(f"      📍 Endereço: {address_model.to_full_address()}")
-            print(f"      🏠 CEP: {address_model.cep}")
-            
-            # Emitir atualização WebSocket em tempo real
-            self._emit_progress_update(processadas, len(tasks), enriquecidas)
-            
-            try:
-                # Validar CEP antes de processar
-                if not address_model.cep or address_model.cep.strip() == '':
-                    print(f"      ⚠️ CEP vazio ou nulo")
-                    self.repository.update_cep_enrichment_error(id_cep_enrichment, "CEP vazio ou nulo")
-                    continue
+            for cep, group in groups.items():
+                processadas += len(group)
+                print(f"[CEP] 🔄 CEP {cep or '(vazio)'} | {len(group)} empresas | {processadas}/{total}")
                 
-                # Enriquecer com dados do CEP
-                if len(address_model.cep.strip()) >= 8:
-                    print(f"      🔍 Consultando ViaCEP...")
-                    enriched_address = self.domain_service.enrich_address_with_cep(address_model)
-                    
-                    # Debug: comparar endereços
-                    print(f"      🔍 ANTES: {address_model.to_full_address()}")
-                    print(f"      🔍 DEPOIS: {enriched_address.to_full_address()}")
-                    
-                    # Verificar se houve enriquecimento
-                    if self.domain_service.address_was_enriched(address_model, enriched_address):
-                        print(f"      ✨ Enriquecido: {enriched_address.to_full_address()}")
-                        print(f"      💾 Atualizando TB_ENDERECOS...")
-                        
-                        # Atualizar endereço na TB_ENDERECOS
-                        self.repository.update_endereco_corrected(endereco_id, enriched_address)
-                        
-                        # Marcar como concluído
-                        self.repository.update_cep_enrichment_success(id_cep_enrichment)
-                        enriquecidas += 1
-                        
-                        print(f"      ✅ Empresa {empresa_id} enriquecida com sucesso")
-                        
-                        # Emitir atualização WebSocket após enriquecimento
-                        self._emit_progress_update(processadas, len(tasks), enriquecidas)
-                    else:
-                        print(f"      ⚠️ CEP não melhorou o endereço (sem diferenças significativas)")
-                        self.repository.update_cep_enrichment_error(id_cep_enrichment, "CEP não melhorou o endereço")
-                else:
-                    print(f"      ⚠️ CEP inválido")
-                    self.repository.update_cep_enrichment_error(id_cep_enrichment, "CEP inválido ou ausente")
+                # Emitir atualização WebSocket em tempo real
+                self._emit_progress_update(processadas, total, enriquecidas)
+                
+                group_enriched = self._process_cep_group(cep, group)
+                if group_enriched:
+                    enriquecidas += group_enriched
                     
-            except Exception as e:
-                print(f"      ❌ Erro: {e}")
-                self.repository.update_cep_enrichment_error(id_cep_enrichment, str(e)[:255])
+                    # Emitir atualização WebSocket após enriquecimento
+                    self._emit_progress_update(processadas, total, enriquecidas)
+                
+                # Pequena pausa entre consultas para não sobrecarregar o ViaCEP
+                if cep:
+                    time.sleep(0.1)
             
-            # Pequena pausa para não sobrecarregar
-            time.sleep(0.1)
+            self.repository.flush_job_acknowledgements()
+            tasks = self.repository.get_pending_cep_enrichment_tasks()
         
+        dedup_ratio = round(total / max(ceps_unicos, 1), 2)
+        lookups = self.domain_service.get_cep_lookup_stats()
         print(f"[CEP] 🎯 Processamento concluído:")
         print(f"      📋 {processadas} tarefas processadas")
         print(f"      ✨ {enriquecidas} endereços enriquecidos")
+        print(f"      🔁 {ceps_unicos} CEPs únicos para {total} tarefas (dedup {dedup_ratio}x) | "
+              f"{lookups['lookups']} consultas ViaCEP no processo")
         print(f"[CEP] ✅ TB_ENDERECOS atualizada com dados do ViaCEP")
         
         return {
-            'total': len(tasks),
+            'total': total,
             'processadas': processadas,
-            'enriquecidas': enriquecidas
+            'enriquecidas': enriquecidas,
+            'ceps_unicos': ceps_unicos,
+            'dedup_ratio': dedup_ratio
         }
     
+    def _group_by_cep(self, tasks: List[Dict]) -> Dict[str, List[Dict]]:
+        """Agrupa tarefas por CEP normalizado ('' = CEP vazio ou inválido)"""
+        groups: Dict[str, List[Dict]] = {}
+        for task in tasks:
+            cep = self.domain_service.normalize_cep(task['address_model'].cep) or ''
+            groups.setdefault(cep, []).append(task)
+        return groups
+    
+    def _process_cep_group(self, cep: str, group: List[Dict]) -> int:
+        """Uma consulta para o CEP, aplicada a todas as tarefas do grupo; retorna quantas foram enriquecidas"""
+        if not cep:
+            for task in group:
+                print(f"      ⚠️ CEP vazio ou inválido (empresa {task['id_empresa']})")
+                self.repository.update_cep_enrichment_error(
+                    task['id_cep_enrichment'], "CEP vazio ou nulo", permanent=True)
+            return 0
+        
+        resolved = set()  # Tarefas com desfecho gravado (ack ou erro definitivo): não voltam à fila
+        try:
+            print(f"      🔍 Consultando ViaCEP...")
+            cep_data = self.domain_service.fetch_cep_data(cep)
+            if not cep_data:
+                # Resposta definitiva do ViaCEP: CEP inexistente vale para todo o grupo
+                print(f"      ⚠️ CEP inexistente no ViaCEP")
+                for task in group:
+                    self.repository.update_cep_enrichment_error(
+                        task['id_cep_enrichment'], "CEP inexistente", permanent=True)
+                    resolved.add(task['id_cep_enrichment'])
+                return 0
+            
+            corrected, acked = [], []
+            for task in group:
+                if self._apply_cep_data(task, cep_data):
+                    corrected.append((task['id_endereco'], task['enriched_address']))
+                    acked.append(task['id_cep_enrichment'])
+                else:
+                    resolved.add(task['id_cep_enrichment'])  # Erro definitivo já registrado
+            
+            # Endereços antes do ack: se cair entre os dois, a tarefa é refeita (idempotente)
+            self.repository.update_enderecos_corrected(corrected)
+            for id_cep_enrichment in acked:
+                self.repository.update_cep_enrichment_success(id_cep_enrichment)
+                resolved.add(id_cep_enrichment)
+            return len(acked)
+        
+        except Exception as e:
+            # Falha transitória (timeout/conexão/5xx do ViaCEP, banco): só tarefas ainda sem desfecho voltam à fila
+            print(f"      ❌ Erro: {e}")
+            for task in group:
+                if task['id_cep_enrichment'] not in resolved:
+                    self.repository.update_cep_enrichment_error(task['id_cep_enrichment'], str(e)[:255])
+            return 0
+    
+    def _apply_cep_data(self, task: Dict, cep_data: dict) -> bool:
+        """Combina endereço da tarefa com os dados do CEP; sem melhoria registra erro definitivo"""
+        address_model = task['address_model']
+        enriched_address = self.domain_service.enrich_address_with_cep_data(address_model, cep_data)
+        
+        print(f"      📍 Empresa {task['id_empresa']}: {address_model.to_full_address()}")
+        if self.domain_service.address_was_enriched(address_model, enriched_address):
+            print(f"      ✨ Enriquecido: {enriched_address.to_full_address()}")
+            task['enriched_address'] = enriched_address
+            return True
+        
+        print(f"      ⚠️ CEP não melhorou o endereço (sem diferenças significativas)")
+        self.repository.update_cep_enrichment_error(
+            task['id_cep_enrichment'], "CEP não melhorou o endereço", permanent=True)
+        return False
+    
+    def process_cep_task(self, task: Dict) -> bool:
+        """Enriquece o endereço de uma tarefa da TB_CEP_ENRICHMENT; True se o endereço foi enriquecido"""
+        print(f"      🏠 CEP: {task['address_model'].cep}")
+        # Consulta compartilhada (single-flight + resultados do processo): empresas do mesmo CEP não repetem a consulta
+        cep = self.domain_service.normalize_cep(task['address_model'].cep) or ''
+        enriched = self._process_cep_group(cep, [task]) > 0
+        if enriched:
+            print(f"      ✅ Empresa {task['id_empresa']} enriquecida com sucesso")
+        return enriched
+    
     def create_cep_enrichment_tasks(self) -> int:
         """Cria tarefas de enriquecimento CEP para empresas com CEP"""
         print("[CEP] 🔧 Criando tarefas de enriquecimento CEP...")
@@ -121,7 +177,7 @@ class CepEnrichmentApplicationService:
             AND en.CEP <> ''
             AND NOT EXISTS (
                 SELECT 1 FROM TB_CEP_ENRICHMENT c 
-                WHERE c.ID_EMPRESA = e.ID_EMPRESA
+                WHERE c.ID_ENDERECO = e.ID_ENDERECO
             )
         """)
         
@@ -3,6 +3,7 @@ Serviço de aplicação para gerenciamento do banco de dados
 """
 import logging
 from pathlib import Path
+from typing import Optional
 
 from ...domain.services.database_domain_service import DatabaseDomainService
 
@@ -92,38 +93,25 @@ class DatabaseService:
                 print("[INFO] Modo PRODUÇÃO ativado - usando base completa")
                 base_busca = BASE_BUSCA
             
-            terms = []
-            term_id = 1
-            
-            # Gerar termos para cidades
-            for city in locations.get('cities', []):
-                for categoria in base_busca:
-                    termo = f"{categoria} {city['name']}"
-                    terms.append({
-                        'id': term_id,
-                        'termo': termo,
-                        'localizacao': city['name'],
-                        'tipo_localizacao': 'CIDADE',
-                        'distancia_km': city['distance_km'],
-                        'status': 'PENDENTE'
-                    })
-                    term_id += 1
-            
-            # Gerar termos para bairros
-            for neighborhood in locations.get('neighborhoods', []):
-                for categoria in base_busca:
-                    termo = f"{categoria} {neighborhood['name']}"
-                    terms.append({
-                        'id': term_id,
-                        'termo': termo,
-                        'localizacao': neighborhood['name'],
-                        'tipo_localizacao': 'BAIRRO',
-                        'cidade_pai': neighborhood.get('city'),
-                        'distancia_km': neighborhood['distance_km'],
-                        'status': 'PENDENTE'
-                    })
-                    term_id += 1
-            
+            # Distâncias das localizações para o agendador de termos por rendimento
+            from ...infrastructure.storage.term_yield_scheduler import TermYieldScheduler
+            scheduler = TermYieldScheduler(base_busca, config=config)
+            scheduler.register_distances({c['name']: c['distance_km'] for c in locations.get('cities', [])})
+            scheduler.register_distances({n['name']: n['distance_km'] for n in locations.get('neighborhoods', [])})
+            scheduler.save()
+
+            # Plano em anéis de distância: só o anel mais próximo vira termo agora
+            from ...infrastructure.storage.term_ring_planner import TermRingPlanner
+            planner = TermRingPlanner(config=config)
+            planner.build(locations, base_busca)
+            if planner.enabled:
+                radius_km, terms = planner.next_ring()
+                print(f"[INFO] Anel {planner.rings_emitted}/{planner.rings_total} (até {radius_km:.0f} km) - demais anéis sob demanda")
+            else:
+                terms = []
+                while not planner.exhausted:
+                    terms.extend(planner.next_ring()[1])
+
             # Salvar termos no banco
             count = self.domain_service.save_dynamic_search_terms(terms)
             return count
@@ -132,6 +120,27 @@ class DatabaseService:
             self.logger.error(f"Erro ao gerar termos dinâmicos: {e}")
             return 0
 
+    def expand_search_ring(self) -> int:
+        """Gera termos do próximo anel de distância (0 = plano esgotado ou meta de empresas atingida)"""
+        from ...infrastructure.config.config_manager import ConfigManager
+        from ...infrastructure.storage.term_ring_planner import TermRingPlanner
+
+        config = ConfigManager()
+        planner = TermRingPlanner(config=config)
+        if not planner.enabled or planner.exhausted:
+            return 0
+
+        nearby = self.domain_service.count_companies_within(config.term_rings_target_radius_km)
+        if nearby >= config.term_rings_target_companies:
+            print(f"[INFO] Meta atingida: {nearby} empresas até {config.term_rings_target_radius_km} km "
+                  f"- anéis mais distantes não serão buscados")
+            return 0
+
+        radius_km, terms = planner.next_ring()
+        count = self.domain_service.save_dynamic_search_terms(terms)
+        print(f"[INFO] Anel {planner.rings_emitted}/{planner.rings_total} (até {radius_km:.0f} km): {count} novos termos")
+        return count
+
     def get_search_terms(self) -> list:
         """Obtém lista de termos para processamento"""
         return self.domain_service.get_pending_terms()
@@ -147,13 +156,12 @@ class DatabaseService:
     def save_company_data(self, termo_id: int, site_url: str, domain: str,
                           motor_busca: str, emails: list, telefones: list,
                           nome_empresa: str = None, html_content: str = None,
-                          termo_busca: str = None) -> bool:
-        """Salva dados completos da empresa"""
+                          termo_busca: str = None, fingerprint: str = None,
+                          address_model=None) -> Optional[int]:
+        """Salva dados completos da empresa; retorna ID_EMPRESA (None em caso de erro)"""
         try:
-            # Extrair endereço estruturado do HTML
-            address_model = None
-
-            if html_content:
+            # Extrair endereço estruturado do HTML (se o scraper ainda não extraiu)
+            if address_model is None and html_content:
                 try:
                     from src.infrastructure.utils.address_extractor import AddressExtractor
                     address_model = AddressExtractor.extract_from_html(html_content)
@@ -171,11 +179,16 @@ class DatabaseService:
             latitude, longitude, distancia_km = None, None, None
             # Usar Domain Service para salvar empresa
             return self.domain_service.save_company_data(termo_id, site_url, domain, motor_busca,
-                                                         emails, telefones, nome_empresa, html_content)
+                                                         emails, telefones, nome_empresa, html_content,
+                                                         fingerprint, address_model)
 
         except Exception as e:
             self.logger.error(f"Erro ao salvar empresa: {e}")
-            return False
+            return None
+
+    def get_company_fingerprints(self) -> list:
+        """Obtém fingerprints das empresas já extraídas (índice de quase-duplicatas)"""
+        return self.domain_service.get_company_fingerprints()
 
     def update_term_status(self, termo_id: int, status: str):
         """Atualiza status do termo processado"""
@@ -3,29 +3,48 @@ Camada de Aplicação - Serviço principal do robô coletor (refatorado)
 """
 import random
 import time
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 
 from config.settings import (
-    BLACKLIST_HOSTS, MAX_EMAILS_PER_SITE,
+    BASE_BUSCA, BASE_TESTES, BLACKLIST_HOSTS, MAX_EMAILS_PER_SITE,
     RESULTS_PER_TERM_LIMIT, SEARCH_DWELL, COMPLETE_MODE_THRESHOLD
 )
 from .database_service import DatabaseService
 from .user_config_service import UserConfigService
+from ...domain.models.address_model import AddressModel
+from ...domain.models.collection_checkpoint_model import CollectionCheckpointModel
 from ...domain.models.collection_result_model import CollectionResultModel
 from ...domain.models.collection_stats_model import CollectionStatsModel
 from ...domain.models.company_model import CompanyModel
+from ...domain.models.fingerprint_model import FingerprintModel
 from ...domain.models.search_term_model import SearchTermModel
 from ...domain.models.term_result_model import TermResultModel
+from ...domain.models.term_yield_model import TermYieldModel
 from ...domain.protocols.scraper_protocol import ScraperProtocol
 from ...domain.services.email_domain_service import (
     EmailCollectorInterface, EmailValidationService
 )
 from ...infrastructure.config.config_manager import ConfigManager
+from ...infrastructure.drivers.driver_supervisor import DriverSupervisor
 from ...infrastructure.drivers.web_driver import WebDriverManager
 from ...infrastructure.logging.structured_logger import StructuredLogger
 from ...infrastructure.metrics.performance_tracker import PerformanceTracker
+from ...infrastructure.network.circuit_breaker import CircuitBreaker
+from ...infrastructure.network.url_preflight import UrlPreflight
 from ...infrastructure.scrapers.duckduckgo_scraper import DuckDuckGoScraper
+from ...infrastructure.scrapers.federated_search import FederatedSearch
 from ...infrastructure.scrapers.google_scraper import GoogleScraper
+from ...infrastructure.scrapers.serp_health import SerpHealthDetector
+from ...infrastructure.storage.collection_checkpoint import CollectionCheckpoint
+from ...infrastructure.storage.host_latency_tracker import HostLatencyTracker
+from ...infrastructure.storage.serp_cache import SerpCache
+from ...infrastructure.storage.term_yield_scheduler import TermYieldScheduler
+from ...infrastructure.utils.domain_matcher import DomainNormalizer
+from ...infrastructure.utils.graceful_shutdown import GracefulShutdown
+from ...infrastructure.utils.pagination_cutoff import PaginationCutoff
+from ...infrastructure.utils.simhash import SimHasher, SimHashIndex
+from ...infrastructure.utils.structured_data_extractor import StructuredDataStats
+from ...infrastructure.utils.url_canonicalizer import UrlCanonicalizer
 
 
 class EmailApplicationService(EmailCollectorInterface):
@@ -47,6 +66,12 @@ class EmailApplicationService(EmailCollectorInterface):
 
         # Inicialização de componentes DEPOIS dos inputs
         self.driver_manager: WebDriverManager = WebDriverManager()
+        self.driver_supervisor: DriverSupervisor = DriverSupervisor(self.driver_manager, self.config)
+        # Busca federada: DuckDuckGo roda em um segundo navegador, em paralelo ao Google
+        self.secondary_driver_manager: Optional[WebDriverManager] = (
+            WebDriverManager() if self.search_engine == "FEDERATED" else None)
+        self.secondary_supervisor: Optional[DriverSupervisor] = (
+            DriverSupervisor(self.secondary_driver_manager, self.config) if self.secondary_driver_manager else None)
         self.scraper: ScraperProtocol = self._setup_scraper()
         self._setup_services()
 
@@ -59,43 +84,119 @@ class EmailApplicationService(EmailCollectorInterface):
         else:
             self.driver_manager.browser = "chrome"
             browser_name = "Chrome"
+        if self.secondary_driver_manager:
+            self.secondary_driver_manager.browser = self.driver_manager.browser
 
         # Configurar motor de busca
-        if self.search_engine == "GOOGLE":
+        if self.search_engine == "FEDERATED":
+            self.logger.info(f"Usando busca federada (Google + DuckDuckGo) com {browser_name}",
+                             engine="Federado", browser=browser_name)
+        elif self.search_engine == "GOOGLE":
             self.logger.info(f"Usando Google com {browser_name}", engine="Google", browser=browser_name)
-            return GoogleScraper(None)
         else:
             self.logger.info(f"Usando DuckDuckGo com {browser_name}", engine="DuckDuckGo", browser=browser_name)
-            return DuckDuckGoScraper(self.driver_manager)
+        return self._create_scraper(self.search_engine)
+
+    def _create_scraper(self, engine: str) -> ScraperProtocol:
+        """Instancia scraper do motor no navegador atual"""
+        if engine == "GOOGLE":
+            return GoogleScraper(self.driver_manager.driver)
+        if engine == "FEDERATED":
+            return FederatedSearch(
+                {"GOOGLE": GoogleScraper(self.driver_manager.driver),
+                 "DUCKDUCKGO": DuckDuckGoScraper(self.secondary_driver_manager)},
+                canonical_key=lambda url: (self.url_canonicalizer.canonical_key(url)
+                                           or self.validation_service.extract_domain_from_url(url)))
+        return DuckDuckGoScraper(self.driver_manager)
 
     def _setup_services(self) -> None:
         """Configura serviços de domínio"""
         self.validation_service: EmailValidationService = EmailValidationService()
+        self.url_canonicalizer: UrlCanonicalizer = UrlCanonicalizer()
+        self.fingerprint_index: SimHashIndex = self._load_fingerprint_index()
+        self.near_duplicates: int = 0
+        self.latency_tracker: HostLatencyTracker = HostLatencyTracker(config=self.config)
+        self._attach_scraper_services(self.scraper)
+        self.url_preflight: UrlPreflight = UrlPreflight(BLACKLIST_HOSTS, self.config)
+        self.term_scheduler: TermYieldScheduler = TermYieldScheduler(BASE_BUSCA + BASE_TESTES, config=self.config)
+        self.term_yield: TermYieldModel = TermYieldModel()  # Rendimento do termo em andamento
+        self.pagination: PaginationCutoff = PaginationCutoff(self.config)
+        self.serp_cache: SerpCache = SerpCache(config=self.config)
+        self.link_sources: Dict[str, str] = {}  # Motor de origem dos links vindos do cache/checkpoint
+        self.checkpoint: CollectionCheckpoint = CollectionCheckpoint()
+        # Pipeline: recebe ID_EMPRESA das empresas com endereço (CEP/geolocalização em paralelo)
+        self.company_sink: Optional[Callable[[int], None]] = None
+        self.shutdown: GracefulShutdown = GracefulShutdown(on_request=lambda name: self.logger.warning(
+            "Encerramento solicitado - concluindo sites em andamento (repita para forçar)", signal=name))
+
+        # Circuit breaker por motor: motor escolhido primeiro, demais habilitados como alternativa
+        self.scrapers: Dict[str, ScraperProtocol] = {self.search_engine: self.scraper}
+        engines = [self.search_engine] + [e for e in ("GOOGLE", "DUCKDUCKGO")
+                                          if e != self.search_engine and self.config.engine_enabled(e)]
+        self.engine_breakers: Dict[str, CircuitBreaker] = {e: CircuitBreaker(e, self.config) for e in engines}
+
+    def _attach_scraper_services(self, scraper: ScraperProtocol) -> None:
+        """Compartilha índices e históricos da coleta com o scraper"""
+        scraper.fingerprint_index = self.fingerprint_index
+        scraper.latency_tracker = self.latency_tracker
+
+    def _load_fingerprint_index(self) -> SimHashIndex:
+        """Carrega fingerprints das empresas já extraídas (detecção de quase-duplicatas)"""
+        index = SimHashIndex()
+        for row in self.db_service.get_company_fingerprints():
+            index.add(FingerprintModel(
+                domain=row['dominio'],
+                fingerprint=SimHasher.from_hex(row['fingerprint']),
+                emails=row['emails'],
+                phones=row['telefones'],
+                name=row['nome_empresa'],
+                address=row['address_model']
+            ))
+        self.logger.info("Índice de fingerprints carregado", fingerprints=len(index))
+        return index
 
     def execute(self) -> bool:
         """Executa coleta completa de e-mails"""
+        self.shutdown.install()
         try:
-            if not self.driver_manager.start_driver():
+            if not self.driver_supervisor.start():
                 self.logger.error("Falha ao iniciar driver")
                 return False
+            if self.secondary_supervisor and not self.secondary_supervisor.start():
+                self.logger.error("Falha ao iniciar driver secundário (busca federada)")
+                return False
 
-            if self.search_engine == "GOOGLE":
-                self.scraper.driver = self.driver_manager.driver
+            self._sync_scraper_driver()
 
-            # Obter termos do banco
+            # Obter termos do banco (sem pendentes: gera o próximo anel de distância)
             terms_data = self.db_service.get_search_terms()
+            if not terms_data and self.db_service.expand_search_ring():
+                terms_data = self.db_service.get_search_terms()
             if not terms_data:
+                if self.checkpoint.deferred:
+                    # Todos os termos concluídos: resta visitar os sites adiados da execução anterior
+                    self._process_deferred_sites()
+                    return True
                 self.logger.error("Nenhum termo de busca encontrado")
                 return False
 
-            # Converter para SearchTermModel
-            terms = [SearchTermModel(query=t['termo'], location='São Paulo', category='elevadores', pages=3) for t in
-                     terms_data]
+            terms = self._to_search_terms(terms_data)
             result = self.collect_emails(terms, terms_data)
             return result.success
 
         finally:
-            self.driver_manager.close_driver()
+            self.shutdown.restore()
+            for supervisor in self._supervisors():
+                supervisor.close()
+            for scraper in self.scrapers.values():
+                if isinstance(scraper, FederatedSearch):
+                    scraper.close()
+
+    @staticmethod
+    def _to_search_terms(terms_data: List[Dict]) -> List[SearchTermModel]:
+        """Converte termos do banco para SearchTermModel"""
+        return [SearchTermModel(query=t['termo'], location='São Paulo', category='elevadores', pages=3)
+                for t in terms_data]
 
     def collect_emails(self, terms: List[SearchTermModel], terms_data: List[Dict]) -> CollectionResultModel:
         """Coleta e-mails usando termos de busca"""
@@ -106,26 +207,143 @@ class EmailApplicationService(EmailCollectorInterface):
                          terms_count=len(terms),
                          mode="completo")
 
-        for i, (term, term_data) in enumerate(zip(terms, terms_data), 1):
-            if not self._execute_search_for_term(term, i, len(terms)):
+        queue = self._resume_first(self._schedule_terms(list(zip(terms, terms_data))))
+        i = 0
+        while not self.shutdown.requested:
+            if not queue:
+                # Anel atual esgotado: próximo anel de distância (até a meta de empresas próximas)
+                queue = self._next_ring_queue(terms)
+                if not queue:
+                    break
+            term, term_data = queue.pop(0)
+            resume = self.checkpoint.resume_point(term_data['id'])
+            i += 1
+            term_start = time.time()
+            self.term_yield = TermYieldModel(runs=1)
+
+            # Termo com resultados em cache válidos: links reaproveitados sem abrir o motor de busca
+            replay_engine = self.serp_cache.find_engine(term.query, self.engine_breakers)
+            if replay_engine:
+                self.logger.info("Resultados em cache - busca no navegador dispensada",
+                                 term=self.logger._sanitize_input(term.query),
+                                 engine=replay_engine, progress=f"{i}/{len(terms)}")
+                outcome = 'ok'
+            else:
+                outcome = self._search_with_failover(term, i, len(terms))
+            if outcome == 'halted':
+                self.logger.error("Coleta interrompida - todos os motores bloqueados",
+                                  pending_terms=len(queue) + 1)
+                break
+            if outcome == 'blocked':
+                # Bloqueio não é erro do termo: continua PENDENTE para a próxima execução
+                self.logger.warning("Termo mantido PENDENTE (motor bloqueado)",
+                                    term=self.logger._sanitize_input(term.query))
+                continue
+            if outcome != 'ok':
                 self.db_service.update_term_status(term_data['id'], 'ERRO')
                 continue
 
-            term_result = self._process_single_term(term, term_data, stats, i, len(terms))
+            self.checkpoint.start_term(term_data['id'], term.query, replay_engine or self.search_engine)
+            term_result = self._process_single_term(term, term_data, stats, i, len(terms), replay_engine, resume)
             stats.update(term_result)
+            if self.shutdown.requested:
+                # Termo interrompido continua PENDENTE; checkpoint guarda página e links já tratados
+                self.logger.warning("Coleta interrompida - retomada no mesmo ponto na próxima execução",
+                                    term=self.logger._sanitize_input(term.query))
+                break
+            self.checkpoint.finish_term()
 
             # Atualizar status do termo no banco
             self.db_service.update_term_status(term_data['id'], 'CONCLUIDO')
 
+            # Rendimento do termo reordena os pendentes (e pode aposentar combinações fracas)
+            self.term_yield.seconds = round(time.time() - term_start, 1)
+            self.term_scheduler.record(term_data['termo'], term_data.get('tipo'), self.term_yield)
+            self.term_scheduler.save()
+            queue = self._schedule_terms(queue)
+
+        if not self.shutdown.requested:
+            stats.total_saved += self._process_deferred_sites()
         return self._finalize_collection(stats, start_time)
 
+    def _schedule_terms(self, queue: List[Tuple[SearchTermModel, Dict]]) -> List[Tuple[SearchTermModel, Dict]]:
+        """Ordena termos por rendimento esperado; combinações aposentadas saem da fila (BAIXO_RENDIMENTO)"""
+        ordered, retired = self.term_scheduler.order([term_data for _, term_data in queue])
+        by_id = {term_data['id']: (term, term_data) for term, term_data in queue}
+        for term_data in retired:
+            self.db_service.update_term_status(term_data['id'], 'BAIXO_RENDIMENTO')
+            self.logger.info("Termo aposentado por baixo rendimento",
+                             term=self.logger._sanitize_input(term_data['termo']))
+        return [by_id[term_data['id']] for term_data in ordered]
+
+    def _resume_first(self, queue: List[Tuple[SearchTermModel, Dict]]) -> List[Tuple[SearchTermModel, Dict]]:
+        """Termo interrompido na execução anterior volta para o início da fila"""
+        resumed = self.checkpoint.resumed
+        if not resumed:
+            return queue
+        first = [item for item in queue if item[1]['id'] == resumed.termo_id]
+        if first:
+            self.logger.info("Retomando coleta interrompida", term=self.logger._sanitize_input(resumed.term),
+                             page=resumed.page + 1, last_rank=resumed.last_rank, links_done=len(resumed.done))
+        return first + [item for item in queue if item[1]['id'] != resumed.termo_id]
+
+    def _next_ring_queue(self, terms: List[SearchTermModel]) -> List[Tuple[SearchTermModel, Dict]]:
+        """Termos do próximo anel de distância, já ordenados (vazio = plano esgotado ou meta atingida)"""
+        if not self.db_service.expand_search_ring():
+            return []
+        ring_data = self.db_service.get_search_terms()
+        ring_terms = self._to_search_terms(ring_data)
+        terms.extend(ring_terms)  # Total exibido no progresso
+        return self._schedule_terms(list(zip(ring_terms, ring_data)))
+
     def _initialize_collection_stats(self, terms: List[SearchTermModel]) -> CollectionStatsModel:
         """Inicializa estatísticas da coleta"""
         total_expected = len(terms) * RESULTS_PER_TERM_LIMIT
         return CollectionStatsModel(start_time=time.time())
 
-    def _execute_search_for_term(self, term: SearchTermModel, current: int, total: int) -> bool:
-        """Executa busca para um termo específico"""
+    def _search_with_failover(self, term: SearchTermModel, current: int, total: int) -> str:
+        """Busca no motor disponível; bloqueio abre o circuito e o termo segue para o próximo motor"""
+        for _ in range(len(self.engine_breakers)):
+            if not self._select_engine():
+                return 'halted'
+            outcome = self._execute_search_for_term(term, current, total)
+            if outcome != 'blocked':
+                return outcome
+        return 'blocked'
+
+    def _select_engine(self) -> Optional[str]:
+        """Motor com circuito fechado (primário preferido); todos pausados: aguarda o menor resfriamento"""
+        for engine, breaker in self.engine_breakers.items():
+            if breaker.allow():
+                self._switch_engine(engine)
+                return engine
+
+        engine = min(self.engine_breakers, key=lambda e: self.engine_breakers[e].remaining_cooldown())
+        wait = self.engine_breakers[engine].remaining_cooldown()
+        if wait > self.config.breaker_max_wait:
+            return None
+        self.logger.warning("Todos os motores pausados - aguardando resfriamento", seconds=round(wait))
+        self.scraper.pacer.pace(wait)  # Tarefas pendentes rodam durante a espera
+        self.engine_breakers[engine].allow()
+        self._switch_engine(engine)
+        return engine
+
+    def _switch_engine(self, engine: str) -> None:
+        """Troca o scraper ativo (mesmo navegador e mesmo agendador de ritmo)"""
+        if engine == self.search_engine:
+            return
+        if engine not in self.scrapers:
+            scraper = self._create_scraper(engine)
+            self._attach_scraper_services(scraper)
+            scraper.pacer = self.scraper.pacer
+            self.scrapers[engine] = scraper
+        self.logger.warning("Alternando motor de busca", from_engine=self.search_engine, to_engine=engine)
+        self.search_engine = engine
+        self.scraper = self.scrapers[engine]
+        self._sync_scraper_driver()
+
+    def _execute_search_for_term(self, term: SearchTermModel, current: int, total: int) -> str:
+        """Executa busca para um termo específico ('ok', 'error' ou 'blocked')"""
         self.logger.info("Processando termo",
                          term=self.logger._sanitize_input(term.query),
                          progress=f"{current}/{total}",
@@ -136,7 +354,14 @@ class EmailApplicationService(EmailCollectorInterface):
             self.logger.warning("Driver inativo - reiniciando")
             if not self._restart_driver():
                 self.logger.error("Falha ao reiniciar driver")
-                return False
+                return 'error'
+
+        # Reciclagem preventiva entre termos (memória/abas do navegador cresceram demais)
+        for supervisor in self._supervisors():
+            recycle_reason = supervisor.recycle_if_needed()
+            if recycle_reason:
+                self._sync_scraper_driver()
+                self.logger.info("Navegador reciclado", reason=recycle_reason)
 
         if self.performance_tracker:
             with self.performance_tracker.track_operation(f"search_term_{term.query}"):
@@ -144,17 +369,33 @@ class EmailApplicationService(EmailCollectorInterface):
         else:
             search_result = self.scraper.search(term.query)
 
+        # Saúde da SERP: CAPTCHA/429 abrem o circuito do motor; só bloqueio e erro contam como falha
+        health = (self.scraper.last_health if isinstance(self.scraper, FederatedSearch)
+                  else SerpHealthDetector.check(self.driver_manager.driver, self.search_engine))
+        breaker = self.engine_breakers[self.search_engine]
+        if health.blocked:
+            breaker.record_failure(hard=True)
+            self.logger.warning("Motor bloqueado", engine=self.search_engine,
+                                status=health.status, detail=self.logger._sanitize_input(health.detail))
+            return 'blocked'
+
         if not search_result:
+            breaker.record_failure()
             self.logger.error("Busca falhou", term=self.logger._sanitize_input(term.query))
-            return False
-        return True
+            return 'error'
+
+        # SERP vazia sem marcador de bloqueio é resposta legítima (termo sem resultados)
+        if health.status in ('ok', 'empty'):
+            breaker.record_success()
+        return 'ok'
 
     def _process_single_term(self, term: SearchTermModel, term_data: Dict, stats: CollectionStatsModel, current: int,
-                             total: int) -> TermResultModel:
+                             total: int, replay_engine: Optional[str] = None,
+                             resume: Optional[CollectionCheckpointModel] = None) -> TermResultModel:
         """Processa um único termo e retorna resultado"""
         term_saved = self._process_term_results(term, term_data,
                                                 stats.total_expected if hasattr(stats, 'total_expected') else 1000,
-                                                stats.total_processed)
+                                                stats.total_processed, replay_engine, resume)
 
         self.logger.info("Termo concluído",
                          term=self.logger._sanitize_input(term.query),
@@ -171,12 +412,44 @@ class EmailApplicationService(EmailCollectorInterface):
     def _finalize_collection(self, stats: CollectionStatsModel, start_time: float) -> CollectionResultModel:
         """Finaliza coleta e retorna resultado"""
         duration = time.time() - start_time
+        stats.near_duplicates = self.near_duplicates
 
         self.logger.info("Coleta finalizada",
                          total_saved=stats.total_saved,
                          terms_completed=stats.terms_completed,
+                         near_duplicates=stats.near_duplicates,
                          duration_seconds=round(duration, 2))
 
+        # Frequência em que o caminho rápido (dados estruturados) foi suficiente
+        structured_stats = StructuredDataStats.get_stats()
+        if structured_stats['pages']:
+            self.logger.info("Dados estruturados", **structured_stats)
+
+        # Links descartados antes do navegador (documentos, hosts mortos, marketplaces...)
+        preflight_stats = self.url_preflight.get_stats()
+        if preflight_stats:
+            self.logger.info("Pré-verificação de URLs", **preflight_stats)
+
+        self.logger.info("Supervisor do navegador", **self.driver_supervisor.get_stats())
+        if self.secondary_supervisor:
+            self.logger.info("Supervisor do navegador secundário", **self.secondary_supervisor.get_stats())
+        for engine, breaker in self.engine_breakers.items():
+            self.logger.info("Circuit breaker", engine=engine, **breaker.get_stats())
+        self.logger.info("Ritmo humano (pausas aproveitadas)", **self.scraper.pacer.get_stats())
+        self.logger.info("Rendimento dos termos", **self.term_scheduler.report())
+        self.logger.info("Paginação adaptativa", **self.pagination.get_stats())
+        self.logger.info("Cache de resultados", **self.serp_cache.get_stats())
+        federated = self.scrapers.get("FEDERATED")
+        if federated:
+            totals = federated.totals
+            self.logger.info("Sobreposição Google x DuckDuckGo (total)",
+                             google=totals.google, duckduckgo=totals.duckduckgo, both=totals.both,
+                             google_only=totals.google_only, duckduckgo_only=totals.duckduckgo_only,
+                             overlap_pct=totals.overlap_pct, report=str(federated.report_path))
+
+        # Tempo perdido com timeouts de carregamento (execução atual e histórico por host)
+        self.logger.info("Timeouts de carregamento", **self.latency_tracker.report())
+
         # Log de métricas de performance se habilitado
         if self.performance_tracker:
             perf_stats = self.performance_tracker.get_stats()
@@ -193,60 +466,234 @@ class EmailApplicationService(EmailCollectorInterface):
         )
 
     def _process_term_results(self, term: SearchTermModel, term_data: Dict, total_expected: int,
-                              global_processed: int) -> int:
-        """Processa resultados de um termo específico"""
+                              global_processed: int, replay_engine: Optional[str] = None,
+                              resume: Optional[CollectionCheckpointModel] = None) -> int:
+        """Processa resultados de um termo específico
+
+        replay_engine: páginas vêm do cache de resultados; resume: retomada a partir do checkpoint
+        """
         term_saved = 0
         results_processed = 0
+        resume_page = resume.page if resume else 0
 
+        self.pagination.start_term(term.pages - resume_page)
         for page in range(term.pages):
-            links = self.scraper.get_result_links(BLACKLIST_HOSTS)
-            if not links:
+            if self.shutdown.requested:
                 break
+            if page < resume_page:
+                # Páginas concluídas antes da interrupção: só avança o navegador
+                if not replay_engine and not self.scraper.go_to_next_page():
+                    break
+                continue
 
+            if resume and page == resume_page:
+                harvested = resume.links  # Mesma lista colhida antes da interrupção
+                links = resume.pending_links()
+                self.checkpoint.start_page(page, harvested, resume.done)
+                self.link_sources.update(
+                    self.serp_cache.get_sources(replay_engine or self.search_engine, term.query, page + 1))
+            else:
+                if replay_engine:
+                    harvested = self.serp_cache.get(replay_engine, term.query, page + 1)
+                    self.link_sources.update(self.serp_cache.get_sources(replay_engine, term.query, page + 1))
+                else:
+                    harvested = self.scraper.get_result_links(BLACKLIST_HOSTS) or []
+                    sources = {link: (self.scraper.source_engine(link) if isinstance(self.scraper, FederatedSearch)
+                                      else self.search_engine) for link in harvested}
+                    self.link_sources.update(sources)
+                    self.serp_cache.put(self.search_engine, term.query, page + 1, harvested, sources)
+                links = harvested
+                if harvested:
+                    self.checkpoint.start_page(page, harvested)
+            if not harvested:
+                break
+            # Taxa de domínios novos decide se vale buscar a próxima página
+            keep_paginating = self.pagination.should_continue(
+                (self.url_canonicalizer.canonical_key(link) or self.validation_service.extract_domain_from_url(link)
+                 for link in harvested),
+                lambda domain: not self.db_service.is_domain_visited(domain))
+            links = self._preflight_links(links)
+
+            sites = []  # (link, domínio) a visitar nesta página
             for link in links:
 
                 results_processed += 1
                 global_processed += 1
-                domain = self.validation_service.extract_domain_from_url(link)
+                # Chave canônica: domínio registrável resolvido pelo cache de redirecionamentos
+                domain = (self.url_canonicalizer.canonical_key(link)
+                          or self.validation_service.extract_domain_from_url(link))
 
-                # Verificar se domínio já foi visitado (banco)
-                if self.db_service.is_domain_visited(domain):
+                # Verificar se domínio já foi visitado (banco ou nesta mesma página)
+                if self.db_service.is_domain_visited(domain) or any(domain == d for _, d in sites):
                     self.logger.debug("Site já visitado", domain=self.logger._sanitize_input(domain))
                     continue
 
+                # Host que vem estourando o timeout: fica para o final (não segura o fluxo principal)
+                if self.latency_tracker.should_defer(DomainNormalizer.extract_host(link)):
+                    # Gravado em disco: sobrevive ao CONCLUIDO do termo e a uma interrupção da coleta
+                    self.checkpoint.add_deferred({'link': link, 'domain': domain,
+                                                  'term': term.query, 'termo_id': term_data['id']})
+                    self.logger.info("Site lento adiado", domain=self.logger._sanitize_input(domain))
+                    continue
+
                 self.logger.info("Acessando site",
                                  domain=self.logger._sanitize_input(domain),
                                  progress=f"{global_processed}/{total_expected}")
+                sites.append((link, domain))
 
-                if self.performance_tracker:
-                    with self.performance_tracker.track_operation(f"extract_data_{domain}"):
-                        company = self.scraper.extract_company_data(link, MAX_EMAILS_PER_SITE)
-                else:
-                    company = self.scraper.extract_company_data(link, MAX_EMAILS_PER_SITE)
-
-                company.search_term = term.query
+            # Descartados (pré-verificação, já visitados) e adiados não precisam ser revistos numa retomada
+            pending = {link for link, _ in sites}
+            self.checkpoint.mark_done([link for link in harvested if link not in pending])
 
-                if self._save_company_to_database(company, domain, term_data['id']):
-                    term_saved += 1
+            term_saved += self._process_sites(sites, term.query, term_data['id'])
+            self.term_yield.pages += 1
+            self.term_yield.visits += len(sites)
 
-                time.sleep(random.uniform(*SEARCH_DWELL))
+            self.url_canonicalizer.save()
+            self.latency_tracker.save()
+            self.serp_cache.save()
 
             # Próxima página
             if page < term.pages - 1:
+                if not keep_paginating:
+                    self.logger.info("Paginação encerrada - páginas sem domínios novos",
+                                     term=self.logger._sanitize_input(term.query), pages_read=page + 1)
+                    break
+                if replay_engine:
+                    continue  # Próxima página vem do cache
                 if hasattr(self.scraper, 'go_to_next_page'):
                     if not self.scraper.go_to_next_page():
                         self.logger.info("Não há mais páginas", term=self.logger._sanitize_input(term.query))
                         break
 
+        if isinstance(self.scraper, FederatedSearch) and not replay_engine:
+            overlap = self.scraper.finish_term(term.query)
+            self.logger.info("Sobreposição Google x DuckDuckGo",
+                             term=self.logger._sanitize_input(term.query),
+                             google=overlap.google, duckduckgo=overlap.duckduckgo, both=overlap.both,
+                             google_only=overlap.google_only, duckduckgo_only=overlap.duckduckgo_only,
+                             overlap_pct=overlap.overlap_pct)
         return term_saved
 
+    def _preflight_links(self, links: List[str]) -> List[str]:
+        """Pré-verificação HTTP: só páginas HTML de hosts ativos seguem para o navegador"""
+        pending = [link for link in links if not self.db_service.is_domain_visited(
+            self.url_canonicalizer.canonical_key(link) or self.validation_service.extract_domain_from_url(link))]
+        allowed = []
+        for triage in self.url_preflight.triage(pending):
+            if triage.final_url and triage.final_url != triage.url:
+                self.url_canonicalizer.record_redirect(triage.url, triage.final_url)
+            if triage.should_visit:
+                allowed.append(triage.url)
+            else:
+                self.logger.debug("Link descartado na pré-verificação",
+                                  url=self.logger._sanitize_input(triage.url),
+                                  verdict=triage.verdict, reason=triage.reason)
+        return allowed
+
+    def _process_sites(self, sites: List[Tuple[str, str]], search_term: str, termo_id: int) -> int:
+        """Extrai sites (pool de abas: na ordem em que ficam prontos) e salva; retorna quantos foram salvos"""
+        if not sites:
+            return 0
+
+        domains = dict(sites)
+        results: List[bool] = []
+        pacer = self.scraper.pacer
+        last = time.time()
+        for company in self.scraper.extract_companies([link for link, _ in sites], MAX_EMAILS_PER_SITE):
+            domain = domains.get(company.url) or self.validation_service.extract_domain_from_url(company.url)
+            if self.performance_tracker:
+                self.performance_tracker.add_metric(f"extract_data_{domain}", time.time() - last)
+
+            # Gravação no banco (CEP, geocodificação) roda durante a pausa antes da próxima ação do navegador
+            pacer.submit(lambda c=company, d=domain: self._handle_and_checkpoint(c, d, search_term, termo_id, results),
+                         name=domain)
+            if self.shutdown.requested:
+                break  # Abas restantes são fechadas; gravações pendentes rodam no drain
+            pacer.schedule(random.uniform(*SEARCH_DWELL))
+            pacer.wait()
+            last = time.time()
+
+        pacer.drain()
+        return sum(results)
+
+    def _handle_and_checkpoint(self, company: CompanyModel, domain: str, search_term: str, termo_id: int,
+                               results: List[bool]) -> None:
+        """Salva empresa e marca o link como tratado no checkpoint"""
+        results.append(self._handle_company(company, domain, search_term, termo_id))
+        self.checkpoint.mark_done([company.url])
+
+    def _handle_company(self, company: CompanyModel, domain: str, search_term: str, termo_id: int) -> bool:
+        """Deduplica e salva empresa extraída; retorna True se foi salva"""
+        link = company.url
+        company.search_term = search_term
+
+        # Redirecionou para outro domínio: registrar e deduplicar pelo domínio final
+        final_domain = self.url_canonicalizer.record_redirect(link, company.final_url)
+        if final_domain and final_domain != domain:
+            if self.db_service.is_domain_visited(final_domain):
+                self.logger.debug("Redirecionado para site já visitado",
+                                  domain=self.logger._sanitize_input(domain),
+                                  final_domain=self.logger._sanitize_input(final_domain))
+                return False
+            domain = final_domain
+
+        if company.duplicate_of:
+            self.near_duplicates += 1
+            self.logger.info("Conteúdo quase duplicado - contatos reaproveitados",
+                             domain=self.logger._sanitize_input(domain),
+                             duplicate_of=self.logger._sanitize_input(company.duplicate_of))
+
+        if not self._save_company_to_database(company, domain, termo_id):
+            return False
+        if company.fingerprint is not None and not company.duplicate_of:
+            self.fingerprint_index.add(FingerprintModel(
+                domain=domain,
+                fingerprint=company.fingerprint,
+                emails=company.emails,
+                phones=company.phone,
+                name=company.name,
+                address=company.address if isinstance(company.address, AddressModel) else None
+            ))
+        return True
+
+    def _process_deferred_sites(self) -> int:
+        """Processa sites lentos adiados (timeout máximo do host) após os termos, inclusive os da execução anterior"""
+        if not self.checkpoint.deferred:
+            return 0
+
+        self.logger.info("Processando sites lentos adiados", count=len(self.checkpoint.deferred))
+        by_term: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}
+        for site in self.checkpoint.deferred:
+            if self.db_service.is_domain_visited(site['domain']):
+                continue
+            self.logger.info("Acessando site adiado", domain=self.logger._sanitize_input(site['domain']))
+            by_term.setdefault((site['term'], site['termo_id']), []).append((site['link'], site['domain']))
+
+        saved = 0
+        for (term, termo_id), sites in by_term.items():
+            if self.shutdown.requested:
+                break
+            saved += self._process_sites(sites, term, termo_id)
+
+        # Interrompido: arquivo mantido (sites já salvos saem pelo filtro de domínio visitado)
+        if not self.shutdown.requested:
+            self.checkpoint.clear_deferred()
+        self.url_canonicalizer.save()
+        self.latency_tracker.save()
+        return saved
+
     def _save_company_to_database(self, company: CompanyModel, domain: str, termo_id: int) -> bool:
         """Salva empresa no banco Access (sempre salva, mesmo sem dados)"""
         # Processar e-mails
         new_emails = []
         if company.emails and company.emails.strip():
             email_list = [e.strip() for e in company.emails.split(';') if e.strip()]
-            new_emails = [e for e in email_list if not self.db_service.is_email_collected(e)]
+            if company.duplicate_of:
+                # Contatos reaproveitados da quase-duplicata já estão no banco: gravados também para esta empresa
+                new_emails = list(dict.fromkeys(email_list))
+            else:
+                new_emails = [e for e in email_list if not self.db_service.is_email_collected(e)]
 
         # Processar telefones
         telefones_data = []
@@ -260,20 +707,30 @@ class EmailApplicationService(EmailCollectorInterface):
                     'tipo': 'CELULAR' if len(phone) == 11 else 'FIXO'
                 })
 
+        # Endereço já extraído pelo scraper (dados estruturados, regex ou página de contato)
+        address_model = company.address if isinstance(company.address, AddressModel) else None
+
         # Salvar no banco (sempre salva, mesmo sem e-mails/telefones)
-        success = self.db_service.save_company_data(
+        empresa_id = self.db_service.save_company_data(
             termo_id=termo_id,
             site_url=company.url,
             domain=domain,
-            motor_busca=self.search_engine,
+            motor_busca=self._source_engine(company.url),
             emails=new_emails,
             telefones=telefones_data,
             nome_empresa=getattr(company, 'name', None),
             html_content=getattr(company, 'html_content', None),
-            termo_busca=company.search_term
+            termo_busca=company.search_term,
+            fingerprint=SimHasher.to_hex(company.fingerprint),
+            address_model=address_model
         )
+        success = empresa_id is not None
 
         if success:
+            self.term_yield.new_companies += 1
+            if not company.duplicate_of:
+                self.term_yield.emails += len(new_emails)  # Reaproveitados não são e-mails novos do termo
+
             # TB_EMPRESAS sempre é salva
             tables_saved = ["TB_EMPRESAS"]
             
@@ -282,15 +739,8 @@ class EmailApplicationService(EmailCollectorInterface):
                 tables_saved.append("TB_EMAILS")
             if telefones_data:
                 tables_saved.append("TB_TELEFONES")
-            if company.html_content:
-                # Verificar se endereço foi extraído
-                try:
-                    from src.infrastructure.utils.address_extractor import AddressExtractor
-                    address_model = AddressExtractor.extract_from_html(company.html_content)
-                    if address_model and address_model.is_valid():
-                        tables_saved.extend(["TB_ENDERECOS", "TB_CEP_ENRICHMENT", "TB_GEOLOCALIZACAO"])
-                except Exception:
-                    pass
+            if address_model and address_model.is_valid():
+                tables_saved.extend(["TB_ENDERECOS", "TB_CEP_ENRICHMENT", "TB_GEOLOCALIZACAO"])
             
             # TB_PLANILHA só se houver dados coletados
             if new_emails or telefones_data:
@@ -305,27 +755,55 @@ class EmailApplicationService(EmailCollectorInterface):
                              phones_count=len(telefones_data),
                              tables=" | ".join(tables_saved))
 
+            # Empresa entra no pipeline (bloqueia se as etapas seguintes estiverem cheias)
+            if self.company_sink:
+                self.company_sink(empresa_id)
+
         return success
 
+    def _source_engine(self, url: str) -> str:
+        """Motor de origem do site (na busca federada: GOOGLE, DUCKDUCKGO ou GOOGLE+DUCKDUCKGO)"""
+        if url in self.link_sources:
+            return self.link_sources[url]  # Origem registrada ao colher a página (também em replay do cache)
+        if isinstance(self.scraper, FederatedSearch):
+            return self.scraper.source_engine(url)
+        return self.search_engine
+
+    def _supervisors(self) -> List[DriverSupervisor]:
+        """Supervisores dos navegadores em uso (principal e, na busca federada, o secundário)"""
+        return [s for s in (self.driver_supervisor, self.secondary_supervisor) if s]
+
     def _check_driver_health(self) -> bool:
-        """Verifica se o driver ainda está ativo"""
+        """Verifica se os drivers ainda estão ativos"""
+        return all(self._is_driver_alive(supervisor.manager) for supervisor in self._supervisors())
+
+    @staticmethod
+    def _is_driver_alive(driver_manager: WebDriverManager) -> bool:
         try:
-            if not self.driver_manager.driver:
+            if not driver_manager.driver:
                 return False
             # Tenta executar comando simples
-            self.driver_manager.driver.current_url
+            driver_manager.driver.current_url
             return True
         except Exception:
             return False
 
     def _restart_driver(self) -> bool:
-        """Reinicia o driver"""
+        """Troca cada driver inativo pelo reserva pré-aquecido (reinício a frio se não houver reserva)"""
         try:
-            self.driver_manager.close_driver()
-            if self.driver_manager.start_driver():
-                if self.search_engine == "GOOGLE":
-                    self.scraper.driver = self.driver_manager.driver
-                return True
-            return False
+            for supervisor in self._supervisors():
+                if not self._is_driver_alive(supervisor.manager) and not supervisor.failover():
+                    return False
+            self._sync_scraper_driver()
+            return True
         except Exception:
             return False
+
+    def _sync_scraper_driver(self) -> None:
+        """GoogleScraper guarda referência direta ao driver (DuckDuckGo usa o WebDriverManager)"""
+        scraper = self.scrapers.get("GOOGLE")
+        if scraper:
+            scraper.driver = self.driver_manager.driver
+        federated = self.scrapers.get("FEDERATED")
+        if federated:
+            federated.sync_driver(self.driver_manager.driver)
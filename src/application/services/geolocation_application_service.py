@@ -43,41 +43,49 @@ class GeolocationApplicationService:
 
             processadas = 0
             geocodificadas = 0
-
-            for tarefa in tarefas:
-                processadas += 1
-                id_geo = tarefa['id_geo']
-                empresa_id = tarefa['id_empresa']
-                address_model = tarefa['address_model']
-                site_url = tarefa['site_url']
-
-                print(f"[GEO] 🔄 Processando {processadas}/{len(tarefas)} | Tarefa ID: {id_geo} | Empresa: {empresa_id}")
-                print(f"      📍 Endereço: {address_model.to_full_address()}")
+            total = 0
+
+            # Reserva em lotes (job_queue.claim_batch_size): o prazo de visibilidade vale só para o lote atual
+            while tarefas:
+                total += len(tarefas)
+                for tarefa in tarefas:
+                    processadas += 1
+                    id_geo = tarefa['id_geo']
+                    empresa_id = tarefa['id_empresa']
+                    address_model = tarefa['address_model']
+                    site_url = tarefa['site_url']
+
+                    print(f"[GEO] 🔄 Processando {processadas}/{total} | Tarefa ID: {id_geo} | Empresa: {empresa_id}")
+                    print(f"      📍 Endereço: {address_model.to_full_address()}")
                 
-                # Emitir atualização WebSocket em tempo real
-                self._emit_progress_update(processadas, len(tarefas), geocodificadas)
+                    # Emitir atualização WebSocket em tempo real
+                    self._emit_progress_update(processadas, total, geocodificadas)
 
-                # Processar geocodificação via Domain Service
-                result = self.domain_service.process_single_geolocation(tarefa)
+                    # Processar geocodificação via Domain Service
+                    result = self.domain_service.process_single_geolocation(tarefa)
                 
-                if result['success']:
-                    geocodificadas += 1
-                    print(f"[GEO] ✅ Sucesso: {result['latitude']}, {result['longitude']} - {result['distancia_km']}km")
-                    if result.get('address_corrected'):
-                        print(f"      🔧 Endereço foi corrigido durante o processo")
+                    if result['success']:
+                        geocodificadas += 1
+                        print(f"[GEO] ✅ Sucesso: {result['latitude']}, {result['longitude']} - {result['distancia_km']}km")
+                        if result.get('address_corrected'):
+                            print(f"      🔧 Endereço foi corrigido durante o processo")
                     
-                    # Emitir atualização WebSocket após geocodificação
-                    self._emit_progress_update(processadas, len(tarefas), geocodificadas)
-                else:
-                    print(f"[GEO] ❌ Falha: {result['error']}")
+                        # Emitir atualização WebSocket após geocodificação
+                        self._emit_progress_update(processadas, total, geocodificadas)
+                    else:
+                        print(f"[GEO] ❌ Falha: {result['error']}")
                 
-                # Pequena pausa para não sobrecarregar
-                time.sleep(0.1)
+                    # Pequena pausa para não sobrecarregar
+                    time.sleep(0.1)
+
+                tarefas = self.domain_service.get_pending_geolocation_tasks()
+                if tarefas:
+                    print(f"[GEO] 📋 Próximo lote: {len(tarefas)} tarefas")
 
             self.logger.info(f"🎯 Geolocalização concluída: {geocodificadas}/{processadas} tarefas processadas")
 
             return {
-                'total': len(tarefas),
+                'total': total,
                 'processadas': processadas,
                 'geocodificadas': geocodificadas
             }
@@ -99,7 +107,7 @@ class GeolocationApplicationService:
                 WHERE e.ID_ENDERECO IS NOT NULL 
                 AND NOT EXISTS (
                     SELECT 1 FROM TB_GEOLOCALIZACAO g 
-                    WHERE g.ID_EMPRESA = e.ID_EMPRESA
+                    WHERE g.ID_ENDERECO = e.ID_ENDERECO
                 )
             """)
             
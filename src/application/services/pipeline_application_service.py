@@ -0,0 +1,162 @@
+"""
+Serviço de aplicação - pipeline com coleta, enriquecimento CEP e geolocalização simultâneos
+"""
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from .cep_enrichment_application_service import CepEnrichmentApplicationService
+from .email_application_service import EmailApplicationService
+from .geolocation_application_service import GeolocationApplicationService
+from ...infrastructure.config.config_manager import ConfigManager
+from ...infrastructure.logging.structured_logger import StructuredLogger
+
+END_OF_STREAM = None  # Sentinela: etapa anterior terminou
+BACKLOG_RETRY_SECONDS = 60  # Sem pendências antigas: nova consulta só depois deste intervalo
+
+
+class PipelineStage:
+    """Etapa com fila limitada: put bloqueia quando cheia (contrapressão na etapa anterior)"""
+
+    def __init__(self, name: str, queue_size: int,
+                 fetch_tasks: Callable[[Optional[int], Optional[int]], List[Dict]],
+                 process_task: Callable[[Dict], bool], downstream: Optional['PipelineStage'] = None,
+                 idle_poll: float = 0.5, backlog_batch: int = 10):
+        self.name = name
+        self.queue: "queue.Queue[Optional[int]]" = queue.Queue(maxsize=queue_size)
+        self.fetch_tasks = fetch_tasks  # (empresa_id, limite) -> tarefas reservadas (empresa_id None = qualquer)
+        self.process_task = process_task
+        self.downstream = downstream
+        self.idle_poll = idle_poll
+        self.backlog_batch = max(1, backlog_batch)
+        self.processed = 0
+        self.succeeded = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0  # Tempo que a etapa anterior esperou por espaço na fila
+        self.max_depth = 0
+        self._backlog: List[Dict] = []  # Lote reservado de pendências antigas
+        self._backlog_retry_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, empresa_id: Optional[int]) -> None:
+        start = time.perf_counter()
+        self.queue.put(empresa_id)
+        self.blocked_seconds += time.perf_counter() - start
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}", daemon=True)
+        self._thread.start()
+
+    def join(self) -> None:
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        finished = False
+        while not finished:
+            try:
+                empresa_id = self.queue.get(timeout=self.idle_poll)
+            except queue.Empty:
+                task = self._next_backlog_task()
+                if task:
+                    self._process(task)
+                continue
+
+            if empresa_id is END_OF_STREAM:
+                finished = True
+                continue
+            # Empresa nova tem prioridade sobre as pendências antigas (tarefas dela já reservadas no lote incluídas)
+            own = [task for task in self._backlog if task['id_empresa'] == empresa_id]
+            self._backlog = [task for task in self._backlog if task['id_empresa'] != empresa_id]
+            for task in own + self._fetch(empresa_id):
+                self._process(task)
+            if self.downstream:
+                self.downstream.put(empresa_id)
+
+        # Etapa anterior terminou: conclui pendências antigas antes de liberar a próxima etapa
+        task = self._next_backlog_task(force=True)
+        while task:
+            self._process(task)
+            task = self._next_backlog_task(force=True)
+        if self.downstream:
+            self.downstream.put(END_OF_STREAM)
+
+    def _next_backlog_task(self, force: bool = False) -> Optional[Dict]:
+        """Próxima pendência antiga; o lote seguinte só é reservado quando o atual esvazia"""
+        if not self._backlog and (force or time.monotonic() >= self._backlog_retry_at):
+            self._backlog = self._fetch(None, self.backlog_batch)
+            if not self._backlog:
+                self._backlog_retry_at = time.monotonic() + BACKLOG_RETRY_SECONDS
+        return self._backlog.pop(0) if self._backlog else None
+
+    def _fetch(self, empresa_id: Optional[int], limit: Optional[int] = None) -> List[Dict]:
+        try:
+            return self.fetch_tasks(empresa_id, limit)
+        except Exception as e:
+            print(f"[PIPELINE] {self.name}: erro ao buscar tarefas: {str(e)[:80]}")
+            return []
+
+    def _process(self, task: Dict) -> None:
+        start = time.perf_counter()
+        try:
+            if self.process_task(task):
+                self.succeeded += 1
+        except Exception as e:
+            self.errors += 1
+            print(f"[PIPELINE] {self.name}: erro na empresa {task.get('id_empresa')}: {str(e)[:80]}")
+        self.processed += 1
+        self.busy_seconds += time.perf_counter() - start
+
+    def get_stats(self) -> Dict:
+        return {'processed': self.processed, 'succeeded': self.succeeded, 'errors': self.errors,
+                'busy_seconds': round(self.busy_seconds, 1), 'upstream_blocked_seconds': round(self.blocked_seconds, 1),
+                'max_queue_depth': self.max_depth}
+
+
+class PipelineApplicationService:
+    """Coleta (navegador) alimenta CEP, que alimenta geolocalização - as três etapas rodam ao mesmo tempo"""
+
+    def __init__(self) -> None:
+        self.logger = StructuredLogger("pipeline")
+        self.config = ConfigManager()
+        self.collector = EmailApplicationService()
+        self.cep_service = CepEnrichmentApplicationService()
+        self.geo_service = GeolocationApplicationService()
+
+        queue_size = self.config.pipeline_queue_size
+        backlog_batch = self.config.pipeline_backlog_batch_size
+        self.geo_stage = PipelineStage(
+            "geolocalizacao", queue_size,
+            fetch_tasks=self.geo_service.domain_service.get_pending_geolocation_tasks,
+            process_task=lambda task: self.geo_service.domain_service.process_single_geolocation(task)['success'],
+            backlog_batch=backlog_batch)
+        self.cep_stage = PipelineStage(
+            "cep", queue_size,
+            fetch_tasks=self.cep_service.repository.get_pending_cep_enrichment_tasks,
+            process_task=self.cep_service.process_cep_task,
+            downstream=self.geo_stage, backlog_batch=backlog_batch)
+
+    def execute(self) -> bool:
+        """Executa coleta com CEP e geolocalização em paralelo; aguarda as etapas esvaziarem"""
+        start = time.time()
+        self.geo_stage.start()
+        self.cep_stage.start()
+        self.collector.company_sink = self.cep_stage.put
+        try:
+            success = self.collector.execute()
+        finally:
+            # Fim da coleta: sentinela percorre as etapas depois das empresas já enfileiradas
+            self.cep_stage.put(END_OF_STREAM)
+            self.logger.info("Coleta encerrada - aguardando CEP e geolocalização",
+                             cep_queue=self.cep_stage.queue.qsize(), geo_queue=self.geo_stage.queue.qsize())
+            self.cep_stage.join()
+            self.geo_stage.join()
+            self.cep_service.repository.flush_job_acknowledgements()
+
+        for stage in (self.cep_stage, self.geo_stage):
+            self.logger.info("Etapa do pipeline", stage=stage.name, **stage.get_stats())
+        self.logger.info("Pipeline concluído", duration_seconds=round(time.time() - start, 1))
+        return success
@@ -69,14 +69,17 @@ class UserConfigService:
                 print("\n🔍 Escolha o motor de busca:")
                 print("1. Google")
                 print("2. DuckDuckGo")
-                option = input("Digite sua opção (1/2 - padrão: 1): ").strip()
+                print("3. Federado (Google + DuckDuckGo)")
+                option = input("Digite sua opção (1/2/3 - padrão: 1): ").strip()
 
                 if not option or option == '1':
                     return "GOOGLE"
                 elif option == '2':
                     return "DUCKDUCKGO"
+                elif option == '3':
+                    return "FEDERATED"
                 else:
-                    print("[ERRO] Digite '1' para Google ou '2' para DuckDuckGo")
+                    print("[ERRO] Digite '1' para Google, '2' para DuckDuckGo ou '3' para Federado")
             except:
                 print("[ERRO] Entrada inválida")
 
@@ -0,0 +1,27 @@
+"""
+Modelo para ponto de retomada da coleta
+"""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class CollectionCheckpointModel:
+    """Posição da coleta dentro de um termo (página atual e links já tratados)"""
+    termo_id: int
+    term: str
+    engine: str
+    page: int = 0  # Índice da página em andamento (0 = primeira)
+    links: List[str] = field(default_factory=list)  # Links colhidos da página, na ordem do ranking
+    done: List[str] = field(default_factory=list)  # Links já tratados (salvos ou descartados)
+    saved_at: float = 0.0
+
+    @property
+    def last_rank(self) -> int:
+        """Maior posição do ranking já tratada na página (0 = nenhuma)"""
+        done = set(self.done)
+        return max((rank for rank, link in enumerate(self.links, 1) if link in done), default=0)
+
+    def pending_links(self) -> List[str]:
+        done = set(self.done)
+        return [link for link in self.links if link not in done]
@@ -14,6 +14,7 @@ class CollectionStatsModel:
     terms_completed: int = 0
     terms_failed: int = 0
     start_time: float = 0.0
+    near_duplicates: int = 0  # Visitas com contatos reaproveitados (SimHash)
 
     def update(self, term_result: TermResultModel) -> None:
         """Atualiza estatísticas com resultado de um termo"""
@@ -2,6 +2,7 @@
 Entidade Company - Representa uma empresa coletada
 """
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -15,3 +16,6 @@ class CompanyModel:
     address: str = ""
     phone: str = ""
     html_content: str = ""
+    final_url: str = ""  # URL após redirecionamentos (driver.current_url)
+    fingerprint: Optional[int] = None  # SimHash do texto visível
+    duplicate_of: str = ""  # Domínio de conteúdo quase idêntico (contatos reaproveitados)
@@ -0,0 +1,19 @@
+"""
+Modelo para resultado do crawl raso de páginas de contato
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .address_model import AddressModel
+
+
+@dataclass
+class ContactCrawlResultModel:
+    """Contatos encontrados nas páginas internas (contato, sobre...) de um site"""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    address: Optional[AddressModel] = None
+    pages_fetched: int = 0
+    bytes_fetched: int = 0
+    elapsed_seconds: float = 0.0
+    stopped_early: bool = False  # E-mail, telefone e CEP completos antes do fim do orçamento
@@ -0,0 +1,29 @@
+"""
+Modelo para payload compacto de contatos extraído no navegador
+"""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class DomContactPayloadModel:
+    """Dados de contato coletados do DOM via JavaScript (sem transferir page_source)"""
+    title: str = ""
+    site_name: str = ""  # og:site_name
+    mailto: List[str] = field(default_factory=list)
+    tel: List[str] = field(default_factory=list)
+    json_ld: List[str] = field(default_factory=list)
+    microdata: List[List[str]] = field(default_factory=list)  # [itemprop, valor]
+    links: List[List[str]] = field(default_factory=list)  # [href, texto] de links internos de contato
+    address_blocks: List[str] = field(default_factory=list)
+    text_contacts: List[str] = field(default_factory=list)  # Linhas do texto visível com e-mail/telefone/CEP
+    footer_text: str = ""
+    html_window: str = ""  # Janela de HTML bruto para arquivamento
+    html_length: int = 0  # Tamanho do HTML completo (não transferido)
+
+    @property
+    def payload_size(self) -> int:
+        """Caracteres efetivamente transferidos pelo WebDriver"""
+        return (len(self.title) + len(self.site_name) + len(self.footer_text) + len(self.html_window)
+                + sum(len(v) for v in self.mailto + self.tel + self.json_ld + self.address_blocks + self.text_contacts)
+                + sum(len(a) + len(b) for a, b in self.microdata + self.links))
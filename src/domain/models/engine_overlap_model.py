@@ -0,0 +1,30 @@
+"""
+Modelo para sobreposição de resultados entre motores de busca
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class EngineOverlapModel:
+    """Domínios únicos por motor em um termo (busca federada)"""
+    term: str
+    google: int = 0
+    duckduckgo: int = 0
+    both: int = 0
+
+    @property
+    def google_only(self) -> int:
+        return self.google - self.both
+
+    @property
+    def duckduckgo_only(self) -> int:
+        return self.duckduckgo - self.both
+
+    @property
+    def union(self) -> int:
+        return self.google + self.duckduckgo - self.both
+
+    @property
+    def overlap_pct(self) -> float:
+        """Jaccard: fração da união encontrada pelos dois motores"""
+        return round(self.both / self.union * 100, 1) if self.union else 0.0
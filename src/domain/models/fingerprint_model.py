@@ -0,0 +1,18 @@
+"""
+Modelo para fingerprint de conteúdo de empresa (detecção de quase-duplicatas)
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from .address_model import AddressModel
+
+
+@dataclass
+class FingerprintModel:
+    """Fingerprint SimHash e contatos reaproveitáveis de uma empresa"""
+    domain: str
+    fingerprint: Optional[int]
+    emails: str = ""  # String com e-mails separados por ;
+    phones: str = ""  # String com telefones separados por ;
+    name: str = ""
+    address: Optional[AddressModel] = None  # Endereço reaproveitado pela quase-duplicata
@@ -0,0 +1,14 @@
+"""
+Modelo para histórico de latência por host
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class HostLatencyModel:
+    """Latência média móvel (EWMA) e falhas de carregamento de um host"""
+    ewma_ms: float = 0.0
+    samples: int = 0
+    failures: int = 0  # Timeouts consecutivos (zera no primeiro carregamento bem-sucedido)
+    timeouts_total: int = 0
+    lost_ms: int = 0  # Tempo total gasto em carregamentos que atingiram o timeout
@@ -0,0 +1,16 @@
+"""
+Modelo para resultado da detecção de página pronta
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class PageReadinessModel:
+    """Motivo e tempo até a página ser considerada pronta para extração"""
+    reason: str  # complete | contacts | stable | timeout
+    elapsed_ms: int = 0
+    nodes: int = 0  # Elementos no DOM no momento da decisão
+
+    @property
+    def timed_out(self) -> bool:
+        return self.reason == 'timeout'
@@ -0,0 +1,13 @@
+"""
+Modelo para página de resultados em cache
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class SerpCacheEntryModel:
+    """Links colhidos de uma página de resultados (motor, termo, página)"""
+    links: List[str] = field(default_factory=list)
+    saved_at: float = 0.0  # time.time() da coleta
+    sources: Dict[str, str] = field(default_factory=dict)  # link -> motor(es) de origem (busca federada)
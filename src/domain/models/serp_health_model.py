@@ -0,0 +1,20 @@
+"""
+Modelo para diagnóstico de saúde da página de resultados
+"""
+from dataclasses import dataclass
+
+# Status que indicam bloqueio do motor (abrem o circuito imediatamente)
+BLOCKED_STATUSES = ('captcha', 'rate_limited')
+
+
+@dataclass
+class SerpHealthModel:
+    """Estado da SERP após a busca (ok, captcha, rate_limited, empty ou unknown)"""
+    status: str
+    detail: str = ""
+    results: int = 0
+    http_status: int = 0
+
+    @property
+    def blocked(self) -> bool:
+        return self.status in BLOCKED_STATUSES
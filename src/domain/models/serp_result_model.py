@@ -0,0 +1,12 @@
+"""
+Modelo para resultado de página de busca (SERP)
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class SerpResultModel:
+    """Resultado orgânico coletado da página de resultados"""
+    url: str
+    title: str = ""
+    rank: int = 0  # Posição na página (1 = primeiro resultado)
@@ -0,0 +1,13 @@
+"""
+Modelo para seletores CSS de resultados por motor de busca
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class SerpSelectorModel:
+    """Seletores de um layout de SERP (container do resultado, link e título)"""
+    container: str
+    link: str = ""  # Vazio: âncora que envolve o container
+    title: str = ""
+    exclude_href: str = ""  # Trecho de href ignorado (ex: links internos do motor)
@@ -0,0 +1,24 @@
+"""
+Modelo para contatos extraídos de dados estruturados (JSON-LD, microdata, mailto:, tel:)
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from .address_model import AddressModel
+
+
+@dataclass
+class StructuredContactModel:
+    """Contatos exatos publicados pelo site em marcação estruturada"""
+    name: str = ""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    address: Optional[AddressModel] = None
+    sources: Set[str] = field(default_factory=set)  # json_ld, microdata, mailto, tel
+
+    def has_address(self) -> bool:
+        return bool(self.address and self.address.is_valid() and self.address.cep)
+
+    def is_sufficient(self) -> bool:
+        """E-mail, telefone e endereço com CEP: dispensa extração heurística"""
+        return bool(self.emails and self.phones and self.has_address())
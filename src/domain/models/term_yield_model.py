@@ -0,0 +1,35 @@
+"""
+Modelo para rendimento de termos de busca (novas empresas por página/minuto)
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class TermYieldModel:
+    """Rendimento acumulado de um termo, combinação categoria x tipo de localização ou categoria"""
+    runs: int = 0  # Termos processados
+    pages: int = 0  # Páginas de resultados lidas
+    visits: int = 0  # Sites abertos no navegador
+    new_companies: int = 0  # Empresas novas salvas
+    emails: int = 0  # E-mails novos coletados
+    seconds: float = 0.0  # Tempo de navegador gasto
+
+    @property
+    def new_per_page(self) -> float:
+        return self.new_companies / self.pages if self.pages else 0.0
+
+    @property
+    def emails_per_visit(self) -> float:
+        return self.emails / self.visits if self.visits else 0.0
+
+    @property
+    def new_per_minute(self) -> float:
+        return self.new_companies / (self.seconds / 60) if self.seconds else 0.0
+
+    def add(self, other: 'TermYieldModel') -> None:
+        self.runs += other.runs
+        self.pages += other.pages
+        self.visits += other.visits
+        self.new_companies += other.new_companies
+        self.emails += other.emails
+        self.seconds = round(self.seconds + other.seconds, 1)
@@ -0,0 +1,14 @@
+"""
+Modelo para classificação de URLs (normalização + blacklist)
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class UrlClassificationModel:
+    """Resultado da classificação de uma URL"""
+    url: str
+    host: str
+    domain: str  # Domínio registrável (ex: empresa.com.br)
+    blacklisted: bool = False
+    matched_pattern: str = ""
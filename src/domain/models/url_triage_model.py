@@ -0,0 +1,24 @@
+"""
+Modelo para triagem de URL antes da abertura no navegador
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+# Veredictos que liberam a URL para o navegador
+VISIT_VERDICTS = ('html', 'unknown')
+
+
+@dataclass
+class UrlTriageModel:
+    """Resultado da pré-verificação HTTP (DNS, HEAD/GET parcial, redirecionamentos)"""
+    url: str
+    verdict: str  # html | unknown | document | non_html | too_large | dead_host | http_error | blacklisted
+    final_url: str = ""
+    status: int = 0
+    content_type: str = ""
+    content_length: Optional[int] = None
+    reason: str = ""
+
+    @property
+    def should_visit(self) -> bool:
+        return self.verdict in VISIT_VERDICTS
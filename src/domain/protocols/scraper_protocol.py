@@ -1,7 +1,7 @@
 """
 Protocols para scrapers
 """
-from typing import Protocol, List
+from typing import Iterator, Protocol, List
 
 from ..models.company_model import CompanyModel
 
@@ -21,6 +21,10 @@ class ScraperProtocol(Protocol):
         """Extrai dados da empresa"""
         ...
 
+    def extract_companies(self, urls: List[str], max_emails: int) -> Iterator[CompanyModel]:
+        """Extrai várias empresas (na ordem em que as páginas ficam prontas)"""
+        ...
+
     def go_to_next_page(self) -> bool:
         """Vai para próxima página (opcional)"""
         ...
@@ -1,17 +1,61 @@
 """
 Domain Service para enriquecimento de endereços via CEP
 """
-from typing import Optional, List, Tuple
+import re
+import threading
+from typing import Dict, Optional, List, Tuple
 
 from ..models.address_model import AddressModel
+from ...infrastructure.utils.single_flight import SingleFlight
 
 
 class AddressEnrichmentService:
     """Domain Service responsável por enriquecer endereços usando CEP"""
     
+    # Consultas ao ViaCEP compartilhadas entre instâncias/threads: uma por CEP em andamento + resultados do processo
+    _cep_flight = SingleFlight()
+    _cep_results: Dict[str, dict] = {}
+    _cep_lock = threading.Lock()
+    _cep_memo_hits = 0
+    
     def __init__(self):
         pass
     
+    @staticmethod
+    def normalize_cep(cep: str) -> Optional[str]:
+        """CEP com exatamente 8 dígitos (pontuação removida); None se faltar ou sobrar dígito"""
+        cep_clean = re.sub(r'\D', '', cep or '')
+        return cep_clean if len(cep_clean) == 8 else None
+    
+    def fetch_cep_data(self, cep: str) -> Optional[dict]:
+        """Dados do ViaCEP com no máximo uma consulta por CEP (concorrentes aguardam a mesma consulta)
+
+        None = CEP inexistente; falha transitória (timeout, conexão, HTTP 5xx/429) levanta a exceção
+        """
+        cep_clean = self.normalize_cep(cep)
+        if not cep_clean:
+            return None
+        
+        cls = AddressEnrichmentService
+        with cls._cep_lock:
+            if cep_clean in cls._cep_results:
+                cls._cep_memo_hits += 1
+                return cls._cep_results[cep_clean]
+        
+        data = cls._cep_flight.do(cep_clean, lambda: self._fetch_cep_data(cep_clean))
+        if data:
+            # Só respostas válidas ficam guardadas: falha de rede pode ser tentada de novo
+            with cls._cep_lock:
+                cls._cep_results[cep_clean] = data
+        return data
+    
+    @classmethod
+    def get_cep_lookup_stats(cls) -> Dict[str, int]:
+        """Consultas feitas ao ViaCEP, chamadas que aguardaram consulta em andamento e acertos do cache"""
+        stats = cls._cep_flight.get_stats()
+        with cls._cep_lock:
+            return {'lookups': stats['executions'], 'coalesced': stats['shared'], 'memo_hits': cls._cep_memo_hits}
+    
     def enrich_address_with_cep(self, address: AddressModel) -> AddressModel:
         """
         Enriquece endereço com dados completos do CEP se disponível
@@ -26,7 +70,15 @@ class AddressEnrichmentService:
             return address
             
         # Buscar dados completos do CEP
-        cep_data = self._fetch_cep_data(address.cep)
+        try:
+            cep_data = self.fetch_cep_data(address.cep)
+        except Exception as e:
+            print(f"      ⚠️ ViaCEP indisponível: {str(e)[:50]}")
+            return address
+        return self.enrich_address_with_cep_data(address, cep_data)
+    
+    def enrich_address_with_cep_data(self, address: AddressModel, cep_data: Optional[dict]) -> AddressModel:
+        """Combina endereço com dados do ViaCEP já consultados (mesmo CEP para vários endereços)"""
         if not cep_data:
             return address
             
@@ -117,79 +169,62 @@ class AddressEnrichmentService:
             cep: CEP (8 dígitos ou com hífen)
             
         Returns:
-            Dados do CEP ou None se falhar
+            Dados do CEP ou None se inexistente (falha transitória levanta a exceção)
         """
-        try:
-            import requests
-            import re
-            
-            # Limpar CEP (remover caracteres não numéricos)
-            cep_clean = re.sub(r'\D', '', cep)
-            
-            # Tentar corrigir CEPs mal formatados
-            if len(cep_clean) < 8:
-                cep_clean = cep_clean.zfill(8)
-            elif len(cep_clean) > 8:
-                cep_clean = cep_clean[:8]
-            
-            # Validar CEP final
-            if len(cep_clean) != 8 or not cep_clean.isdigit():
-                print(f"      ❌ CEP inválido: {cep} (limpo: {cep_clean})")
-                return None
-                
-            print(f"      🔧 CEP processado: {cep} -> {cep_clean}")
-            
-            # Formatar CEP com hífen
-            cep_formatted = f"{cep_clean[:5]}-{cep_clean[5:]}"
+        # CEP com dígito faltando/sobrando não é completado (zeros à esquerda apontariam outro logradouro)
+        cep_clean = self.normalize_cep(cep)
+        if not cep_clean:
+            print(f"      ❌ CEP inválido: {cep}")
+            return None
+        
+        # Formatar CEP com hífen
+        cep_formatted = f"{cep_clean[:5]}-{cep_clean[5:]}"
+        
+        # Obter URL do ViaCEP da configuração
+        from ...infrastructure.config.config_manager import ConfigManager
+        config = ConfigManager()
+        base_url = config.get('geographic_discovery.apis.viacep.url', 'https://viacep.com.br/ws')
+        
+        # Tentar CEP original
+        data = self._try_viacep_request(base_url, cep_formatted)
+        if data:
+            return data
             
-            # Obter URL do ViaCEP da configuração
-            from ...infrastructure.config.config_manager import ConfigManager
-            config = ConfigManager()
-            base_url = config.get('geographic_discovery.apis.viacep.url', 'https://viacep.com.br/ws')
+        # Fallback: CEPs similares
+        print(f"      🔄 Tentando CEPs similares...")
+        similar_ceps = self._generate_similar_ceps(cep_clean)
+        
+        for similar_cep in similar_ceps[:2]:
+            similar_formatted = f"{similar_cep[:5]}-{similar_cep[5:]}"
+            print(f"      🔍 CEP similar: {similar_formatted}")
             
-            # Tentar CEP original
-            data = self._try_viacep_request(base_url, cep_formatted)
+            data = self._try_viacep_request(base_url, similar_formatted)
             if data:
+                print(f"      ✅ CEP similar funcionou: {data}")
                 return data
-                
-            # Fallback: CEPs similares
-            print(f"      🔄 Tentando CEPs similares...")
-            similar_ceps = self._generate_similar_ceps(cep_clean)
-            
-            for similar_cep in similar_ceps[:2]:
-                similar_formatted = f"{similar_cep[:5]}-{similar_cep[5:]}"
-                print(f"      🔍 CEP similar: {similar_formatted}")
-                
-                data = self._try_viacep_request(base_url, similar_formatted)
-                if data:
-                    print(f"      ✅ CEP similar funcionou: {data}")
-                    return data
-                else:
-                    print(f"      ❌ CEP similar falhou")
-            
-            return None
-            
-        except Exception:
-            return None
+            else:
+                print(f"      ❌ CEP similar falhou")
+        
+        return None
     
     def _try_viacep_request(self, base_url: str, cep_formatted: str) -> Optional[dict]:
-        """Tenta requisição no ViaCEP"""
-        try:
-            import requests
-            url = f"{base_url}/{cep_formatted}/json/"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code != 200:
-                return None
-                
-            data = response.json()
+        """Requisição no ViaCEP: None só para CEP inexistente ('erro': true ou 4xx);
+        timeout, conexão e HTTP 5xx/429 levantam requests.RequestException (tarefa volta à fila)"""
+        import requests
+        url = f"{base_url}/{cep_formatted}/json/"
+        response = requests.get(url, timeout=5)
+        
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+        if response.status_code != 200:
+            return None
             
-            if data.get('erro'):
-                return None
-                
-            return data
-        except Exception:
+        data = response.json()  # Resposta truncada/HTML de erro: ValueError (transitória)
+        
+        if data.get('erro'):
             return None
+            
+        return data
     
 
     
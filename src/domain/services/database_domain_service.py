@@ -1,7 +1,7 @@
 """
 Domain Service para operações de banco de dados
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ...infrastructure.repositories.access_repository import AccessRepository
 
@@ -34,13 +34,12 @@ class DatabaseDomainService:
     
     def save_company_data(self, termo_id: int, site_url: str, domain: str,
                           motor_busca: str, emails: list, telefones: list,
-                          nome_empresa: str = None, html_content: str = None) -> bool:
-        """Salva dados completos da empresa"""
+                          nome_empresa: str = None, html_content: str = None,
+                          fingerprint: str = None, address_model=None) -> Optional[int]:
+        """Salva dados completos da empresa; retorna ID_EMPRESA (None em caso de erro)"""
         try:
-            # Extrair endereço estruturado do HTML
-            address_model = None
-
-            if html_content:
+            # Extrair endereço estruturado do HTML (se ainda não extraído)
+            if address_model is None and html_content:
                 try:
                     from ...infrastructure.utils.address_extractor import AddressExtractor
                     address_model = AddressExtractor.extract_from_html(html_content)
@@ -51,6 +50,8 @@ class DatabaseDomainService:
             latitude, longitude, distancia_km = None, None, None
             empresa_id = self.repository.save_empresa(termo_id, site_url, domain, motor_busca,
                                                       address_model, latitude, longitude, distancia_km)
+            if fingerprint:
+                self.repository.update_empresa_fingerprint(empresa_id, fingerprint)
             
             # Criar tarefas de processamento se houver endereço
             if address_model and address_model.is_valid():
@@ -77,11 +78,15 @@ class DatabaseDomainService:
                 telefones_str = ';'.join([t['formatted'] for t in telefones]) + ';' if telefones else ''
                 self.repository.save_to_final_sheet(site_url, emails_str, telefones_str, None)
 
-            return True
+            return empresa_id
 
         except Exception:
-            return False
+            return None
     
+    def get_company_fingerprints(self) -> List[Dict]:
+        """Obtém fingerprints das empresas já extraídas"""
+        return self.repository.get_company_fingerprints()
+
     def update_term_status(self, termo_id: int, status: str) -> None:
         """Atualiza status do termo processado"""
         self.repository.update_term_status(termo_id, status)
@@ -94,6 +99,10 @@ class DatabaseDomainService:
         """Limpa termos de busca existentes"""
         self.repository.clear_search_terms()
     
+    def count_companies_within(self, max_distance_km: float) -> int:
+        """Conta empresas geolocalizadas até a distância informada"""
+        return self.repository.count_companies_within(max_distance_km)
+
     def save_dynamic_search_terms(self, terms: list) -> int:
         """Salva termos de busca gerados dinamicamente"""
         return self.repository.save_dynamic_search_terms(terms)
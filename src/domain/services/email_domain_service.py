@@ -5,9 +5,8 @@ import re
 from abc import ABC, abstractmethod
 from typing import List
 
-import tldextract
-
 from config.settings import SUSPICIOUS_EMAIL_DOMAINS
+from ...infrastructure.utils.domain_matcher import DomainNormalizer
 from ..models.company_model import CompanyModel
 from ..models.search_term_model import SearchTermModel
 
@@ -155,7 +154,6 @@ class EmailValidationService:
         import html
         # Sanitiza URL para prevenir XSS
         sanitized_url = html.escape(url.strip())
-        ext = tldextract.extract(sanitized_url)
-        if ext.domain and ext.suffix:
-            return f"{ext.domain}.{ext.suffix}"
-        return sanitized_url
+        # Normalizador pré-compilado (esquema/porta/www + sufixos públicos, com cache por host)
+        domain = DomainNormalizer.domain_from_url(sanitized_url)
+        return domain or sanitized_url
@@ -1,7 +1,7 @@
 """
 Domain Service para operações de geolocalização
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ...infrastructure.repositories.access_repository import AccessRepository
 from ...infrastructure.services.geolocation_service import GeolocationService
@@ -14,9 +14,10 @@ class GeolocationDomainService:
         self.repository = AccessRepository()
         self.geo_service = GeolocationService()
     
-    def get_pending_geolocation_tasks(self) -> List[Dict]:
-        """Obtém tarefas de geolocalização pendentes"""
-        return self.repository.get_pending_geolocation_tasks()
+    def get_pending_geolocation_tasks(self, empresa_id: Optional[int] = None,
+                                      limit: Optional[int] = None) -> List[Dict]:
+        """Obtém tarefas de geolocalização pendentes (opcional: de uma empresa; limit = tamanho do lote)"""
+        return self.repository.get_pending_geolocation_tasks(empresa_id, limit)
     
     def process_single_geolocation(self, tarefa: Dict) -> Dict[str, any]:
         """
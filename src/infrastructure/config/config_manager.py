@@ -106,6 +106,214 @@ class ConfigManager:
     def results_per_term_limit(self) -> int:
         return self.get('search.scraping.results_per_term_limit', 1200)
 
+    # Propriedades do agendador de ritmo
+    @property
+    def pacing_min_gap(self) -> float:
+        return self.get('search.scraping.pacing.min_gap_seconds', 0.2)
+
+    # Propriedades da pré-verificação de URLs
+    @property
+    def preflight_enabled(self) -> bool:
+        return self.get('search.scraping.preflight.enabled', True)
+
+    @property
+    def preflight_workers(self) -> int:
+        return self.get('search.scraping.preflight.workers', 8)
+
+    @property
+    def preflight_timeout(self) -> float:
+        return self.get('search.scraping.preflight.timeout_seconds', 4.0)
+
+    @property
+    def preflight_max_bytes(self) -> int:
+        return self.get('search.scraping.preflight.max_bytes', 5000000)
+
+    # Propriedades do crawl de páginas de contato
+    @property
+    def contact_crawl_enabled(self) -> bool:
+        return self.get('search.scraping.contact_crawl.enabled', True)
+
+    @property
+    def contact_crawl_max_pages(self) -> int:
+        return self.get('search.scraping.contact_crawl.max_pages', 3)
+
+    @property
+    def contact_crawl_time_budget(self) -> float:
+        return self.get('search.scraping.contact_crawl.time_budget_seconds', 4.0)
+
+    @property
+    def contact_crawl_max_bytes(self) -> int:
+        return self.get('search.scraping.contact_crawl.max_bytes', 600000)
+
+    @property
+    def contact_crawl_max_page_bytes(self) -> int:
+        return self.get('search.scraping.contact_crawl.max_page_bytes', 250000)
+
+    # Propriedades do perfil lean fetch (abas de empresas)
+    @property
+    def lean_fetch_enabled(self) -> bool:
+        return self.get('webdriver.lean_fetch.enabled', True)
+
+    @property
+    def lean_fetch_block_stylesheets(self) -> bool:
+        return self.get('webdriver.lean_fetch.block_stylesheets', True)
+
+    @property
+    def dom_extraction_enabled(self) -> bool:
+        return self.get('webdriver.dom_extraction.enabled', True)
+
+    @property
+    def dom_extraction_html_window(self) -> int:
+        return self.get('webdriver.dom_extraction.html_window_chars', 20000)
+
+    # Propriedades de carregamento de página (detector de página pronta)
+    @property
+    def page_load_strategy(self) -> str:
+        return self.get('webdriver.page_load.strategy', 'eager')
+
+    @property
+    def page_ready_max_wait(self) -> float:
+        return self.get('webdriver.page_load.max_wait_seconds', 5)
+
+    @property
+    def page_ready_stable_ms(self) -> int:
+        return self.get('webdriver.page_load.stable_ms', 400)
+
+    @property
+    def page_ready_poll_interval(self) -> float:
+        return self.get('webdriver.page_load.poll_interval_seconds', 0.1)
+
+    # Propriedades de timeout adaptativo por host
+    @property
+    def latency_ewma_alpha(self) -> float:
+        return self.get('webdriver.adaptive_timeout.ewma_alpha', 0.3)
+
+    @property
+    def latency_timeout_multiplier(self) -> float:
+        return self.get('webdriver.adaptive_timeout.multiplier', 2.5)
+
+    @property
+    def latency_min_timeout(self) -> float:
+        return self.get('webdriver.adaptive_timeout.min_seconds', 1.5)
+
+    @property
+    def latency_max_timeout(self) -> float:
+        return self.get('webdriver.adaptive_timeout.max_seconds', 10)
+
+    @property
+    def latency_defer_after_failures(self) -> int:
+        return self.get('webdriver.adaptive_timeout.defer_after_failures', 2)
+
+    # Propriedades do pool de abas
+    @property
+    def tab_pool_size(self) -> int:
+        return self.get('webdriver.tab_pool.size', 4)
+
+    # Propriedades do supervisor do WebDriver
+    @property
+    def driver_hot_standby(self) -> bool:
+        return self.get('webdriver.supervisor.hot_standby', True)
+
+    @property
+    def driver_standby_wait(self) -> float:
+        return self.get('webdriver.supervisor.standby_wait_seconds', 15)
+
+    @property
+    def driver_max_rss_mb(self) -> int:
+        return self.get('webdriver.supervisor.max_rss_mb', 2500)
+
+    @property
+    def driver_rss_growth_factor(self) -> float:
+        return self.get('webdriver.supervisor.rss_growth_factor', 3.0)
+
+    @property
+    def driver_max_window_handles(self) -> int:
+        return self.get('webdriver.supervisor.max_window_handles', 6)
+
+    # Propriedades do circuit breaker por motor
+    @property
+    def breaker_failure_threshold(self) -> int:
+        return self.get('search.circuit_breaker.failure_threshold', 3)
+
+    @property
+    def breaker_base_cooldown(self) -> float:
+        return self.get('search.circuit_breaker.base_cooldown_seconds', 120)
+
+    @property
+    def breaker_max_cooldown(self) -> float:
+        return self.get('search.circuit_breaker.max_cooldown_seconds', 3600)
+
+    @property
+    def breaker_max_wait(self) -> float:
+        return self.get('search.circuit_breaker.max_wait_seconds', 900)
+
+    # Propriedades do cache de páginas de resultados
+    @property
+    def serp_cache_enabled(self) -> bool:
+        return self.get('search.serp_cache.enabled', True)
+
+    @property
+    def serp_cache_ttl_hours(self) -> float:
+        return self.get('search.serp_cache.ttl_hours', 72)
+
+    # Propriedades da paginação adaptativa
+    @property
+    def pagination_cutoff_enabled(self) -> bool:
+        return self.get('search.pagination.adaptive', True)
+
+    @property
+    def pagination_min_new_ratio(self) -> float:
+        return self.get('search.pagination.min_new_ratio', 0.2)
+
+    @property
+    def pagination_max_first_page_overlap(self) -> float:
+        return self.get('search.pagination.max_first_page_overlap', 0.8)
+
+    @property
+    def pagination_overlap_window(self) -> int:
+        return self.get('search.pagination.overlap_window_terms', 20)
+
+    # Propriedades do plano de termos em anéis de distância
+    @property
+    def term_rings_enabled(self) -> bool:
+        return self.get('search.term_rings.enabled', True)
+
+    @property
+    def term_rings_width_km(self) -> float:
+        return self.get('search.term_rings.ring_km', 10)
+
+    @property
+    def term_rings_target_companies(self) -> int:
+        return self.get('search.term_rings.target_companies', 300)
+
+    @property
+    def term_rings_target_radius_km(self) -> float:
+        return self.get('search.term_rings.target_radius_km', 30)
+
+    # Propriedades do agendador de termos por rendimento
+    @property
+    def term_scheduler_enabled(self) -> bool:
+        return self.get('search.term_scheduler.enabled', True)
+
+    @property
+    def term_scheduler_prior_minutes(self) -> float:
+        return self.get('search.term_scheduler.prior_minutes', 5)
+
+    @property
+    def term_scheduler_distance_scale_km(self) -> float:
+        return self.get('search.term_scheduler.distance_scale_km', 30)
+
+    @property
+    def term_scheduler_retire_min_pages(self) -> int:
+        return self.get('search.term_scheduler.retire_min_pages', 6)
+
+    @property
+    def term_scheduler_retire_below(self) -> float:
+        return self.get('search.term_scheduler.retire_below_new_per_page', 0.2)
+
+    def engine_enabled(self, engine: str) -> bool:
+        return self.get(f'search.engines.{engine.lower()}.enabled', True)
+
     # Propriedades de retry
     @property
     def retry_max_attempts(self) -> int:
@@ -151,6 +359,40 @@ class ConfigManager:
     def complete_mode_threshold(self) -> int:
         return self.get('mode.complete_threshold', 1000)
 
+    # Propriedades do pipeline (coleta + CEP + geolocalização)
+    @property
+    def pipeline_queue_size(self) -> int:
+        return self.get('pipeline.queue_size', 50)
+
+    @property
+    def pipeline_backlog_batch_size(self) -> int:
+        return self.get('pipeline.backlog_batch_size', 10)
+
+    # Propriedades das filas de tarefas (CEP e geolocalização)
+    @property
+    def job_queue_visibility_timeout_minutes(self) -> float:
+        return self.get('job_queue.visibility_timeout_minutes', 15)
+
+    @property
+    def job_queue_max_attempts(self) -> int:
+        return self.get('job_queue.max_attempts', 5)
+
+    @property
+    def job_queue_backoff_base_minutes(self) -> float:
+        return self.get('job_queue.backoff_base_minutes', 5)
+
+    @property
+    def job_queue_backoff_max_minutes(self) -> float:
+        return self.get('job_queue.backoff_max_minutes', 720)
+
+    @property
+    def job_queue_ack_batch_size(self) -> int:
+        return self.get('job_queue.ack_batch_size', 20)
+
+    @property
+    def job_queue_claim_batch_size(self) -> int:
+        return self.get('job_queue.claim_batch_size', 50)
+
     # Propriedades de performance
     @property
     def performance_tracking_enabled(self) -> bool:
@@ -0,0 +1,148 @@
+"""
+Extração de contatos no navegador - script injetado retorna payload compacto do DOM
+"""
+import html
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from ..config.config_manager import ConfigManager
+from ...domain.models.dom_contact_payload_model import DomContactPayloadModel
+
+# Executado na aba da empresa; arguments[0] = tamanho da janela de HTML bruto
+DOM_EXTRACTION_SCRIPT = r"""
+const htmlWindow = arguments[0];
+const MAX_ITEMS = 20, MAX_TEXT = 600;
+const uniq = (values) => Array.from(new Set(values.filter(Boolean))).slice(0, MAX_ITEMS);
+const clean = (text) => (text || '').replace(/\s+/g, ' ').trim();
+const host = location.hostname.replace(/^www\d*\./, '');
+
+const hrefs = Array.from(document.querySelectorAll('a[href]'));
+const mailto = uniq(hrefs.filter(a => /^mailto:/i.test(a.getAttribute('href')))
+    .map(a => decodeURIComponent(a.getAttribute('href').slice(7).split('?')[0])));
+const tel = uniq(hrefs.filter(a => /^tel:/i.test(a.getAttribute('href')))
+    .map(a => decodeURIComponent(a.getAttribute('href').slice(4))));
+
+const contactWords = /contat|contact|fale|sobre|quem-somos|about|atendimento|localiza|onde-estamos|endereco|empresa/i;
+const links = [];
+const seenLinks = new Set();
+for (const a of hrefs) {
+    if (links.length >= MAX_ITEMS) break;
+    let url;
+    try { url = new URL(a.getAttribute('href'), location.href); } catch (e) { continue; }
+    const text = clean(a.textContent).slice(0, 80);
+    if (!/^https?:$/.test(url.protocol) || url.hostname.replace(/^www\d*\./, '') !== host) continue;
+    if (!contactWords.test(url.pathname + ' ' + text) || seenLinks.has(url.href)) continue;
+    seenLinks.add(url.href);
+    links.push([url.href, text]);
+}
+
+const jsonLd = Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
+    .map(s => s.textContent).filter(Boolean).slice(0, MAX_ITEMS);
+
+const microdata = Array.from(document.querySelectorAll('[itemprop]')).slice(0, 200)
+    .map(el => [el.getAttribute('itemprop'),
+                clean(el.getAttribute('content') || el.getAttribute('href') || (el.children.length ? '' : el.textContent))])
+    .filter(([name, value]) => value && /email|telephone|streetaddress|postalcode|addresslocality|addressregion|^name$/i.test(name))
+    .slice(0, MAX_ITEMS * 2);
+
+const cep = /\b\d{5}-?\d{3}\b/;
+const street = /\b(rua|r\.|av\.|avenida|alameda|travessa|rodovia|estrada|praça)\s/i;
+const addressBlocks = [];
+// Percorre os nós de texto uma vez; o bloco é o menor ancestral de layout (sem innerText em cada div)
+const blockSelector = 'address, p, li, td, dd, div, footer, section';
+const seenBlocks = new Set();
+const walker = document.body ? document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT) : null;
+let candidates = 0;
+for (let node = walker && walker.nextNode(); node && addressBlocks.length < 5 && candidates < 50; node = walker.nextNode()) {
+    const nodeText = node.nodeValue;
+    if (!nodeText || nodeText.length > 300 || !(cep.test(nodeText) || street.test(nodeText))) continue;
+    const parent = node.parentElement;
+    if (!parent || parent.closest('script, style, noscript')) continue;
+    candidates++;
+    const block = parent.closest(blockSelector) || parent;
+    if (seenBlocks.has(block)) continue;
+    seenBlocks.add(block);
+    let text = clean(block.textContent);
+    if (text.length > 300) text = clean(nodeText);
+    else text = clean(block.innerText || text);
+    if (text && !addressBlocks.includes(text)) addressBlocks.push(text);
+}
+
+const bodyText = document.body ? (document.body.innerText || '') : '';
+const contactLine = /@|\(?\d{2}\)?\s?9?\d{4}[-\s]?\d{4}|\b\d{5}-?\d{3}\b/;
+const textContacts = uniq(bodyText.split('\n').map(clean)
+    .filter(line => line.length <= 200 && contactLine.test(line)));
+
+const footer = document.querySelector('footer, #footer, .footer, #rodape, .rodape');
+const siteName = document.querySelector('meta[property="og:site_name"]');
+const fullHtml = document.documentElement ? document.documentElement.outerHTML : '';
+
+return {
+    title: document.title || '',
+    site_name: siteName ? siteName.getAttribute('content') || '' : '',
+    mailto: mailto,
+    tel: tel,
+    json_ld: jsonLd,
+    microdata: microdata,
+    links: links,
+    address_blocks: addressBlocks,
+    text_contacts: textContacts,
+    footer_text: footer ? clean(footer.innerText).slice(0, MAX_TEXT * 4) : '',
+    html_window: fullHtml.slice(0, htmlWindow),
+    html_length: fullHtml.length
+};
+"""
+
+
+class DomContactExtractor:
+    """Executa o extrator no navegador e monta documento compacto para os extratores Python"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.enabled: bool = config.dom_extraction_enabled
+        self.html_window: int = config.dom_extraction_html_window
+
+    def extract(self, driver) -> Optional[DomContactPayloadModel]:
+        """Payload compacto do DOM (None se desabilitado ou se o script falhar)"""
+        if not self.enabled:
+            return None
+        try:
+            data = driver.execute_script(DOM_EXTRACTION_SCRIPT, self.html_window)
+        except WebDriverException:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        return DomContactPayloadModel(
+            title=data.get('title') or '',
+            site_name=data.get('site_name') or '',
+            mailto=data.get('mailto') or [],
+            tel=data.get('tel') or [],
+            json_ld=data.get('json_ld') or [],
+            microdata=data.get('microdata') or [],
+            links=data.get('links') or [],
+            address_blocks=data.get('address_blocks') or [],
+            text_contacts=data.get('text_contacts') or [],
+            footer_text=data.get('footer_text') or '',
+            html_window=data.get('html_window') or '',
+            html_length=data.get('html_length') or 0
+        )
+
+    @staticmethod
+    def to_contact_document(payload: DomContactPayloadModel) -> str:
+        """Documento HTML mínimo com os dados do payload (entrada das regex/JSON-LD/crawler)"""
+        esc = html.escape
+        parts = [f"<title>{esc(payload.title)}</title>"]
+        if payload.site_name:
+            parts.append(f'<meta property="og:site_name" content="{esc(payload.site_name)}">')
+        parts.extend(f'<script type="application/ld+json">{block}</script>' for block in payload.json_ld)
+        parts.extend(f'<meta itemprop="{esc(name)}" content="{esc(value)}">' for name, value in payload.microdata)
+        parts.extend(f'<a href="mailto:{esc(email)}"></a>' for email in payload.mailto)
+        parts.extend(f'<a href="tel:{esc(phone)}"></a>' for phone in payload.tel)
+        parts.extend(f'<a href="{esc(href)}">{esc(text)}</a>' for href, text in payload.links)
+        parts.extend(f"<address>{esc(block)}</address>" for block in payload.address_blocks)
+        parts.extend(f"<p>{esc(line)}</p>" for line in payload.text_contacts)
+        if payload.footer_text:
+            parts.append(f"<footer>{esc(payload.footer_text)}</footer>")
+        return "\n".join(parts)
@@ -0,0 +1,164 @@
+"""
+Supervisor do WebDriver - instância reserva pré-aquecida e reciclagem por consumo de recursos
+"""
+import threading
+from typing import Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from .web_driver import WebDriverManager
+from ..config.config_manager import ConfigManager
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class DriverSupervisor:
+    """Mantém um navegador reserva pronto; em falha troca o driver ativo sem reinício a frio"""
+
+    def __init__(self, driver_manager: WebDriverManager, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.manager = driver_manager  # Mesmo objeto usado pelos scrapers: troca é transparente
+        self.hot_standby: bool = config.driver_hot_standby
+        self.standby_wait: float = config.driver_standby_wait
+        self.max_rss_mb: int = config.driver_max_rss_mb
+        self.rss_growth_factor: float = config.driver_rss_growth_factor
+        self.max_window_handles: int = config.driver_max_window_handles
+        self._standby: Optional[WebDriverManager] = None
+        self._warm_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._baseline_rss_mb: Optional[float] = None
+        self.swaps = 0
+        self.cold_starts = 0
+        self.recycles = 0
+
+    def start(self) -> bool:
+        """Inicia driver ativo e começa a aquecer o reserva em segundo plano"""
+        if not self.manager.start_driver():
+            return False
+        self._baseline_rss_mb = None
+        self._warm_standby()
+        return True
+
+    def failover(self) -> bool:
+        """Substitui o driver ativo (reserva se disponível, senão reinício a frio)"""
+        old_driver = self.manager.driver
+        if self._warm_thread:
+            self._warm_thread.join(timeout=self.standby_wait)
+
+        with self._lock:
+            standby, self._standby = self._standby, None
+
+        if standby and self._is_alive(standby.driver):
+            self.manager.driver = standby.driver
+            self.manager.wait = standby.wait
+            self.swaps += 1
+        else:
+            if standby:
+                self._dispose(standby.driver)
+            self.manager.driver = None
+            if not self.manager.start_driver():
+                self._dispose(old_driver)
+                return False
+            self.cold_starts += 1
+
+        self._dispose(old_driver)
+        self._baseline_rss_mb = None
+        self._warm_standby()
+        return True
+
+    def recycle_if_needed(self) -> Optional[str]:
+        """Recicla o driver se memória/abas cresceram além do limite; retorna o motivo"""
+        reason = self._recycle_reason()
+        if reason and self.failover():
+            self.recycles += 1
+            return reason
+        return None
+
+    def close(self) -> None:
+        """Fecha driver ativo e reserva"""
+        if self._warm_thread:
+            self._warm_thread.join(timeout=self.standby_wait)
+        with self._lock:
+            standby, self._standby = self._standby, None
+        if standby:
+            standby.close_driver()
+        self.manager.close_driver()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'swaps': self.swaps, 'cold_starts': self.cold_starts, 'recycles': self.recycles}
+
+    # ===== INTERNOS =====
+
+    def _warm_standby(self) -> None:
+        """Inicia navegador reserva em thread (custo do start_driver fica fora do fluxo)"""
+        if not self.hot_standby or (self._warm_thread and self._warm_thread.is_alive()):
+            return
+
+        def warm():
+            standby = WebDriverManager(self.manager.driver_path, self.manager.browser)
+            if standby.start_driver():
+                with self._lock:
+                    self._standby = standby
+
+        self._warm_thread = threading.Thread(target=warm, name="driver-standby", daemon=True)
+        self._warm_thread.start()
+
+    def _recycle_reason(self) -> Optional[str]:
+        driver = self.manager.driver
+        if not driver:
+            return None
+        try:
+            handles = len(driver.window_handles)
+        except WebDriverException:
+            return None  # Driver inativo: tratado pela verificação de saúde
+        if handles > self.max_window_handles:
+            return f"{handles} abas abertas"
+
+        rss = self._browser_rss_mb(driver)
+        if rss is None:
+            return None
+        if self._baseline_rss_mb is None:
+            self._baseline_rss_mb = rss
+            return None
+        if rss > self.max_rss_mb:
+            return f"memória {rss:.0f}MB"
+        if rss > self._baseline_rss_mb * self.rss_growth_factor:
+            return f"memória {rss:.0f}MB ({rss / self._baseline_rss_mb:.1f}x)"
+        return None
+
+    @staticmethod
+    def _browser_rss_mb(driver) -> Optional[float]:
+        """RSS do chromedriver + processos do navegador (requer psutil)"""
+        if not PSUTIL_AVAILABLE:
+            return None
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes if p.is_running()) / (1024 * 1024)
+        except (psutil.Error, AttributeError):
+            return None
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            return bool(driver) and driver.current_url is not None
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _dispose(driver) -> None:
+        """Encerra driver antigo em segundo plano (quit pode levar segundos)"""
+        if not driver:
+            return
+
+        def quit_driver():
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+        threading.Thread(target=quit_driver, name="driver-dispose", daemon=True).start()
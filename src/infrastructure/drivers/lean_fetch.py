@@ -0,0 +1,91 @@
+"""
+Perfil "lean fetch" - bloqueia recursos não utilizados nas abas de sites de empresas (via CDP)
+"""
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from ..config.config_manager import ConfigManager
+
+# Imagens, mídia e fontes (não usados na extração de contatos)
+BLOCKED_EXTENSIONS = [
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'bmp', 'ico', 'svg',
+    'mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a', 'mov', 'avi',
+    'woff', 'woff2', 'ttf', 'otf', 'eot'
+]
+STYLESHEET_EXTENSIONS = ['css']
+
+# Analytics, anúncios, chat e iframes de terceiros
+TRACKER_HOSTS = [
+    'google-analytics.com', 'googletagmanager.com', 'googleadservices.com', 'googlesyndication.com',
+    'doubleclick.net', 'connect.facebook.net', 'facebook.com/tr', 'hotjar.com', 'clarity.ms',
+    'tiktok.com', 'analytics.tiktok.com', 'snap.licdn.com', 'bat.bing.com', 'static.ads-twitter.com',
+    'youtube.com/embed', 'player.vimeo.com', 'maps.googleapis.com', 'maps.gstatic.com',
+    'fonts.googleapis.com', 'fonts.gstatic.com', 'use.typekit.net', 'cdn.onesignal.com',
+    'jivosite.com', 'tawk.to', 'zopim.com', 'rdstation.com.br', 'd335luupugsy2.cloudfront.net'
+]
+
+# Peso da página (Resource Timing API): bytes transferidos e tempo de carregamento
+# (recursos de terceiros sem Timing-Allow-Origin reportam 0 bytes - valor é um piso)
+PAGE_WEIGHT_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const r of resources) { bytes += r.transferSize || 0; }
+return {
+    bytes: bytes,
+    resources: resources.length,
+    load_ms: nav ? Math.round((nav.loadEventEnd || nav.domContentLoadedEventEnd || performance.now()) - nav.startTime) : 0
+};
+"""
+
+
+class LeanFetchProfile:
+    """Abre abas de empresas com bloqueio de imagens, mídia, fontes, CSS e rastreadores"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.enabled: bool = config.lean_fetch_enabled
+        self.block_stylesheets: bool = config.lean_fetch_block_stylesheets
+        self.blocked_patterns: List[str] = self._build_patterns()
+
+    def _build_patterns(self) -> List[str]:
+        """Padrões no formato do Network.setBlockedURLs (curinga '*')"""
+        extensions = BLOCKED_EXTENSIONS + (STYLESHEET_EXTENSIONS if self.block_stylesheets else [])
+        patterns = [f"*.{ext}" for ext in extensions] + [f"*.{ext}?*" for ext in extensions]
+        patterns += [f"*{host}*" for host in TRACKER_HOSTS]
+        return patterns
+
+    def apply(self, driver) -> bool:
+        """Ativa bloqueio na aba atual (CDP atua por aba: páginas de busca não são afetadas)"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_patterns})
+            return True
+        except (WebDriverException, AttributeError):
+            return False  # Navegador sem suporte a CDP: segue com perfil normal
+
+    def open_tab(self, driver, url: str, page_load_timeout: float) -> None:
+        """Abre URL em nova aba; com lean fetch o bloqueio é ativado antes da navegação"""
+        if not self.enabled:
+            driver.execute_script("window.open(arguments[0],'_blank');", url)
+            driver.switch_to.window(driver.window_handles[-1])
+            driver.set_page_load_timeout(page_load_timeout)
+            return
+
+        driver.execute_script("window.open('about:blank','_blank');")
+        driver.switch_to.window(driver.window_handles[-1])
+        driver.set_page_load_timeout(page_load_timeout)
+        self.apply(driver)
+        try:
+            driver.get(url)
+        except TimeoutException:
+            pass  # Timeout é esperado - conteúdo parcial é aproveitado
+
+    @staticmethod
+    def page_weight(driver) -> Dict[str, int]:
+        """Bytes transferidos, número de recursos e tempo de carregamento da aba atual"""
+        try:
+            return driver.execute_script(PAGE_WEIGHT_SCRIPT) or {}
+        except WebDriverException:
+            return {}
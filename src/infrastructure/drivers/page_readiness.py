@@ -0,0 +1,93 @@
+"""
+Detector de página pronta - substitui esperas fixas por sinais do próprio DOM
+"""
+import time
+from typing import Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from ..config.config_manager import ConfigManager
+from ...domain.models.page_readiness_model import PageReadinessModel
+
+# Sonda barata: estado do documento, número de elementos e presença de contatos
+# (links mailto:/tel:, JSON-LD ou e-mail/CEP/telefone no final do texto, onde fica o rodapé)
+READINESS_PROBE_SCRIPT = r"""
+const body = document.body;
+if (!body || location.href === 'about:blank') return {state: 'loading', nodes: 0, contacts: false};
+const nodes = document.getElementsByTagName('*').length;
+let contacts = !!document.querySelector('a[href^="mailto:"], a[href^="tel:"], script[type="application/ld+json"]');
+if (!contacts) {
+    const text = (body.textContent || '').slice(-20000);
+    contacts = /[\w.+-]+@[\w-]+\.[\w.]+|\b\d{5}-\d{3}\b|\(?\d{2}\)?\s?9?\d{4}-\d{4}/.test(text);
+}
+return {state: document.readyState, nodes: nodes, contacts: contacts};
+"""
+
+
+class PageReadinessDetector:
+    """Retorna assim que o DOM estabiliza ou contatos aparecem, com limite máximo de espera"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.max_wait: float = config.page_ready_max_wait
+        self.stable_seconds: float = config.page_ready_stable_ms / 1000
+        self.poll_interval: float = config.page_ready_poll_interval
+
+    def wait_until_ready(self, driver, max_wait: Optional[float] = None,
+                         accept_contacts: bool = True) -> PageReadinessModel:
+        """Aguarda load completo, contatos visíveis no DOM ou DOM estável (o que vier primeiro)"""
+        state = self.new_state(max_wait)
+        while True:
+            readiness = self.check(driver, state, accept_contacts)
+            if readiness:
+                return readiness
+            time.sleep(self.poll_interval)
+
+    def new_state(self, max_wait: Optional[float] = None) -> Dict:
+        """Estado de acompanhamento de uma aba (permite verificar várias abas intercaladas)"""
+        start = time.perf_counter()
+        return {'start': start, 'deadline': start + (max_wait if max_wait is not None else self.max_wait),
+                'last_nodes': -1, 'stable_since': start}
+
+    def check(self, driver, state: Dict, accept_contacts: bool = True) -> Optional[PageReadinessModel]:
+        """Uma sonda na aba atual; retorna o resultado se pronta (ou no limite), senão None"""
+        now = time.perf_counter()
+        probe = self._probe(driver)
+        nodes = probe.get('nodes', 0)
+        page_state = probe.get('state', 'loading')
+
+        reason = None
+        if page_state == 'complete' and accept_contacts:
+            reason = 'complete'
+        elif page_state != 'loading' and accept_contacts and probe.get('contacts'):
+            reason = 'contacts'
+        elif nodes and nodes == state['last_nodes'] and now - state['stable_since'] >= self.stable_seconds:
+            reason = 'stable'
+        elif nodes != state['last_nodes']:
+            state['last_nodes'] = nodes
+            state['stable_since'] = now
+
+        if reason is None and now >= state['deadline']:
+            reason = 'timeout'
+        if reason is None:
+            return None
+        return PageReadinessModel(reason=reason, elapsed_ms=int((now - state['start']) * 1000), nodes=max(nodes, 0))
+
+    def wait_for_settle(self, driver, max_wait: float = 1.0) -> PageReadinessModel:
+        """Após scroll: aguarda apenas o DOM parar de crescer (conteúdo lazy)"""
+        return self.wait_until_ready(driver, max_wait=max_wait, accept_contacts=False)
+
+    @staticmethod
+    def stop_loading(driver) -> None:
+        """Interrompe recursos ainda pendentes (a extração usa apenas o DOM atual)"""
+        try:
+            driver.execute_script("window.stop();")
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _probe(driver) -> dict:
+        try:
+            return driver.execute_script(READINESS_PROBE_SCRIPT) or {}
+        except WebDriverException:
+            return {}
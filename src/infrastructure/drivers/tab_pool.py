@@ -0,0 +1,113 @@
+"""
+Pool de abas - vários sites carregando ao mesmo tempo no mesmo navegador
+"""
+import time
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+from selenium.common.exceptions import WebDriverException
+
+from .lean_fetch import LeanFetchProfile
+from .page_readiness import PageReadinessDetector
+from ..storage.host_latency_tracker import HostLatencyTracker
+from ..utils.domain_matcher import DomainNormalizer
+from ...domain.models.page_readiness_model import PageReadinessModel
+
+T = TypeVar('T')
+
+
+class TabPool:
+    """Mantém até K abas carregando; entrega a primeira que ficar pronta e abre a próxima URL"""
+
+    def __init__(self, driver, lean_fetch: LeanFetchProfile, readiness: PageReadinessDetector, size: int,
+                 latency_tracker: Optional[HostLatencyTracker] = None):
+        self.driver = driver
+        self.lean_fetch = lean_fetch
+        self.readiness = readiness
+        self.size = max(1, size)
+        self.latency_tracker = latency_tracker
+
+    def run(self, urls: List[str], handler: Callable[[str, PageReadinessModel], T],
+            fallback: Callable[[str], T]) -> Iterator[T]:
+        """Processa URLs na ordem em que ficam prontas; handler roda com a aba pronta selecionada.
+        URLs cuja aba falhou (ao abrir ou ao sondar) são carregadas em série pelo fallback no final"""
+        home = self.driver.current_window_handle
+        queue = deque(urls)
+        tabs: Dict[str, Dict] = {}
+        failed: List[str] = []
+
+        try:
+            while queue or tabs:
+                while queue and len(tabs) < self.size:
+                    url = queue.popleft()
+                    handle = self._open(url, home)
+                    if not handle:
+                        failed.append(url)
+                    else:
+                        host = DomainNormalizer.extract_host(url)
+                        timeout = self.latency_tracker.timeout_for(host) if self.latency_tracker else None
+                        tabs[handle] = {'url': url, 'host': host, 'state': self.readiness.new_state(timeout)}
+
+                ready = self._next_ready(tabs, home, failed)
+                if not ready:
+                    time.sleep(self.readiness.poll_interval)
+                    continue
+
+                handle, tab, readiness = ready
+                del tabs[handle]
+                if self.latency_tracker:
+                    self.latency_tracker.record(tab['host'], readiness.elapsed_ms, readiness.timed_out)
+                try:
+                    result = handler(tab['url'], readiness)
+                finally:
+                    self._close(handle, home)
+                yield result
+        finally:
+            for handle in list(tabs):
+                self._close(handle, home)
+
+        for url in failed:
+            yield fallback(url)
+
+    def _open(self, url: str, home: str) -> Optional[str]:
+        """Nova aba com bloqueio de recursos; navegação sem esperar o carregamento (falha fecha a aba)"""
+        handle = None
+        try:
+            self.driver.switch_to.new_window('tab')
+            handle = self.driver.current_window_handle
+            if self.lean_fetch.enabled:
+                self.lean_fetch.apply(self.driver)
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            return handle
+        except WebDriverException as e:
+            print(f"    [DEBUG] Falha ao abrir aba: {str(e)[:50]}")
+            if handle:
+                self._close(handle, home)
+            return None
+
+    def _next_ready(self, tabs: Dict[str, Dict], home: str, failed: List[str]):
+        """Uma sonda por aba; retorna (handle, aba, prontidão) da primeira pronta"""
+        for handle, tab in list(tabs.items()):
+            try:
+                self.driver.switch_to.window(handle)
+            except WebDriverException:
+                # Aba fechada/travada: descarta a aba, a URL vai para o carregamento em série
+                del tabs[handle]
+                self._close(handle, home)
+                failed.append(tab['url'])
+                continue
+            readiness = self.readiness.check(self.driver, tab['state'])
+            if readiness:
+                return handle, tab, readiness
+        return None
+
+    def _close(self, handle: str, home: str) -> None:
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except WebDriverException:
+            pass
+        try:
+            self.driver.switch_to.window(home)
+        except WebDriverException:
+            pass
@@ -50,6 +50,9 @@ class WebDriverManager:
             else:
                 print("[INFO] Executando em modo visível")
 
+            # Estratégia de carregamento: "eager" retorna no DOMContentLoaded (detector decide quando extrair)
+            options.page_load_strategy = config.page_load_strategy
+
             # === ANTI-DETECÇÃO CRÍTICA ===
             options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
@@ -0,0 +1,57 @@
+"""
+Circuit breaker por motor de busca com resfriamento exponencial
+"""
+import time
+from typing import Dict, Optional
+
+from ..config.config_manager import ConfigManager
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Abre após falhas consecutivas (ou bloqueio explícito); reabre com tentativa única após o resfriamento"""
+
+    def __init__(self, name: str, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.name = name
+        self.failure_threshold: int = config.breaker_failure_threshold
+        self.base_cooldown: float = config.breaker_base_cooldown
+        self.max_cooldown: float = config.breaker_max_cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0  # Aberturas consecutivas (define o resfriamento exponencial)
+        self.opened_until = 0.0
+
+    def allow(self) -> bool:
+        """Motor pode ser usado? (após o resfriamento passa a meio-aberto: uma tentativa de teste)"""
+        if self.state == OPEN and time.monotonic() >= self.opened_until:
+            self.state = HALF_OPEN
+        return self.state != OPEN
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+
+    def record_failure(self, hard: bool = False) -> None:
+        """Falha comum conta para o limite; bloqueio (CAPTCHA/429) ou falha em meio-aberto abre na hora"""
+        self.failures += 1
+        if hard or self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self._trip()
+
+    def remaining_cooldown(self) -> float:
+        return max(0.0, self.opened_until - time.monotonic()) if self.state == OPEN else 0.0
+
+    def _trip(self) -> None:
+        self.trips += 1
+        cooldown = min(self.max_cooldown, self.base_cooldown * (2 ** (self.trips - 1)))
+        self.state = OPEN
+        self.failures = 0
+        self.opened_until = time.monotonic() + cooldown
+        print(f"[AVISO] Motor {self.name} pausado por {cooldown:.0f}s (abertura {self.trips})")
+
+    def get_stats(self) -> Dict:
+        return {'state': self.state, 'trips': self.trips, 'cooldown_seconds': round(self.remaining_cooldown())}
@@ -0,0 +1,169 @@
+"""
+Crawl raso de páginas de contato com orçamento de tempo e bytes por site
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Callable, List, Optional
+from urllib.parse import urljoin, urldefrag
+
+import requests
+
+from ..config.config_manager import ConfigManager
+from ..utils.address_extractor import AddressExtractor
+from ..utils.domain_matcher import DomainNormalizer
+from ...domain.models.contact_crawl_result_model import ContactCrawlResultModel
+
+LINK_PATTERN = re.compile(r'<a\b[^>]*?href\s*=\s*["\']([^"\'#][^"\']*)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+CEP_PATTERN = re.compile(r'\b\d{5}-?\d{3}\b')
+
+# Peso por palavra-chave no href/texto do link (maior = visitado primeiro)
+LINK_KEYWORDS = {
+    'contato': 10, 'contatos': 10, 'contact': 10, 'fale-conosco': 10, 'faleconosco': 10, 'fale conosco': 10,
+    'atendimento': 6, 'localizacao': 6, 'onde-estamos': 6, 'endereco': 6,
+    'sobre': 4, 'quem-somos': 4, 'a-empresa': 4, 'empresa': 3, 'about': 3,
+}
+SKIP_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.zip', '.doc', '.docx',
+                   '.xls', '.xlsx', '.mp4', '.mp3', '.css', '.js')
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+CHUNK_SIZE = 16384
+
+
+class ContactPageCrawler:
+    """Busca as páginas internas mais prováveis de conter contatos, em paralelo e com orçamento"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        self.config = config or ConfigManager()
+        self.enabled = self.config.contact_crawl_enabled
+        self.max_pages = self.config.contact_crawl_max_pages
+        self.time_budget = self.config.contact_crawl_time_budget
+        self.max_bytes = self.config.contact_crawl_max_bytes
+        self.max_page_bytes = self.config.contact_crawl_max_page_bytes
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'pt-BR,pt;q=0.9'})
+
+    def rank_links(self, base_url: str, html: str) -> List[str]:
+        """Links internos ordenados por probabilidade de conter contatos"""
+        base_domain = DomainNormalizer.domain_from_url(base_url)
+        base_page = urldefrag(base_url)[0].rstrip('/')
+        scored = {}
+
+        for href, text in LINK_PATTERN.findall(html or ""):
+            href = href.strip()
+            if href.lower().startswith(('mailto:', 'tel:', 'javascript:', 'whatsapp:')):
+                continue
+
+            absolute = urldefrag(urljoin(base_url, href))[0]
+            if not absolute.startswith('http') or absolute.rstrip('/') == base_page:
+                continue
+            if absolute.lower().split('?', 1)[0].endswith(SKIP_EXTENSIONS):
+                continue
+            if DomainNormalizer.domain_from_url(absolute) != base_domain:
+                continue
+
+            haystack = f"{absolute.lower()} {TAG_PATTERN.sub(' ', text).lower()}"
+            score = max((weight for keyword, weight in LINK_KEYWORDS.items() if keyword in haystack), default=0)
+            if score and score > scored.get(absolute, 0):
+                scored[absolute] = score
+
+        # Empate: URL mais curta primeiro (/contato antes de /blog/post-sobre-contato)
+        return sorted(scored, key=lambda link: (-scored[link], len(link)))[:self.max_pages]
+
+    def crawl(self, base_url: str, html: str, emails: List[str], phones: List[str], has_cep: bool,
+              email_extractor: Callable[[str], List[str]],
+              phone_extractor: Callable[[str], List[str]]) -> ContactCrawlResultModel:
+        """Completa e-mail/telefone/CEP a partir das páginas de contato (para ao completar os três)"""
+        result = ContactCrawlResultModel()
+        if not self.enabled or (emails and phones and has_cep):
+            return result
+
+        links = self.rank_links(base_url, html)
+        if not links:
+            return result
+
+        start = time.monotonic()
+        deadline = start + self.time_budget
+        stop_event = threading.Event()
+        byte_budget = _ByteBudget(self.max_bytes)
+        found_cep = has_cep
+
+        executor = ThreadPoolExecutor(max_workers=len(links), thread_name_prefix="contact-crawl")
+        futures = [executor.submit(self._fetch, link, deadline, stop_event, byte_budget) for link in links]
+        try:
+            for future in as_completed(futures, timeout=max(deadline - time.monotonic(), 0)):
+                page_html = future.result()
+                if not page_html:
+                    continue
+                result.pages_fetched += 1
+
+                result.emails.extend(e for e in email_extractor(page_html)
+                                     if e not in emails and e not in result.emails)
+                result.phones.extend(p for p in phone_extractor(page_html)
+                                     if p not in phones and p not in result.phones)
+
+                if not found_cep and CEP_PATTERN.search(page_html):
+                    address = AddressExtractor.extract_from_html(page_html)
+                    if address and address.is_valid():
+                        result.address = address
+                        found_cep = bool(address.cep)
+
+                if (emails or result.emails) and (phones or result.phones) and found_cep:
+                    result.stopped_early = True
+                    break
+        except FuturesTimeoutError:
+            pass
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        result.bytes_fetched = byte_budget.used
+        result.elapsed_seconds = time.monotonic() - start
+        return result
+
+    def _fetch(self, url: str, deadline: float, stop_event: threading.Event,
+               byte_budget: "_ByteBudget") -> str:
+        """Baixa página (streaming) respeitando prazo, limite por página e orçamento global"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or stop_event.is_set():
+            return ""
+
+        try:
+            with self.session.get(url, timeout=(min(remaining, 3.0), remaining), stream=True) as response:
+                if response.status_code != 200 or 'html' not in response.headers.get('Content-Type', 'text/html'):
+                    return ""
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if stop_event.is_set() or time.monotonic() > deadline:
+                        break
+                    if not byte_budget.consume(len(chunk)):
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_page_bytes:
+                        break
+
+                encoding = response.encoding or 'utf-8'
+                return b''.join(chunks).decode(encoding, errors='replace')
+        except Exception:
+            return ""
+
+
+class _ByteBudget:
+    """Orçamento de bytes compartilhado entre as threads de um site"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def consume(self, size: int) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += size
+            return True
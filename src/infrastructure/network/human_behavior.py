@@ -3,7 +3,7 @@ Simulador de Comportamento Humano para evitar detecção
 """
 import random
 import time
-from typing import Tuple
+from typing import Callable, Tuple
 
 
 class HumanBehaviorSimulator:
@@ -32,8 +32,8 @@ class HumanBehaviorSimulator:
         return max(0.5, reading_time * random.uniform(0.7, 1.3))
 
     @staticmethod
-    def scroll_behavior(driver) -> None:
-        """Simula scroll humano realista"""
+    def scroll_behavior(driver, pause: Callable[[float], None] = time.sleep) -> None:
+        """Simula scroll humano realista (pause: time.sleep ou agendador de ritmo)"""
         try:
             # Scroll gradual como humano
             total_scroll = random.randint(800, 2000)
@@ -42,12 +42,12 @@ class HumanBehaviorSimulator:
 
             for _ in range(steps):
                 driver.execute_script(f"window.scrollBy(0, {step_size});")
-                time.sleep(random.uniform(0.3, 0.8))
+                pause(random.uniform(0.3, 0.8))
 
             # Às vezes volta um pouco (comportamento humano)
             if random.random() < 0.3:
                 driver.execute_script(f"window.scrollBy(0, -{step_size});")
-                time.sleep(random.uniform(0.2, 0.5))
+                pause(random.uniform(0.2, 0.5))
 
         except Exception:
             pass
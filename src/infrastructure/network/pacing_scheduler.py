@@ -0,0 +1,80 @@
+"""
+Agendador de ritmo humano - pausas viram prazos "não antes de" e o intervalo executa trabalho útil
+"""
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from ..config.config_manager import ConfigManager
+
+
+class PacingScheduler:
+    """Ritmo de um navegador: a próxima ação só ocorre após not_before; tarefas pendentes rodam no intervalo"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.min_gap: float = config.pacing_min_gap  # Intervalo mínimo restante para iniciar uma tarefa
+        self.not_before: float = time.monotonic()
+        self._tasks: Deque[Tuple[str, Callable[[], None]]] = deque()
+        self.gap_seconds = 0.0  # Tempo total de pausas exigidas pelo ritmo
+        self.work_seconds = 0.0  # Parte das pausas ocupada por tarefas
+        self.overrun_seconds = 0.0  # Tarefas que ultrapassaram o prazo
+        self.tasks_run = 0
+
+    def schedule(self, delay: float) -> None:
+        """Próxima ação do navegador não antes de agora + delay"""
+        self.not_before = max(self.not_before, time.monotonic() + max(delay, 0.0))
+
+    def submit(self, task: Callable[[], None], name: str = "") -> None:
+        """Enfileira trabalho que não depende do navegador (extração, banco, CEP, geocodificação)"""
+        self._tasks.append((name, task))
+
+    def wait(self) -> None:
+        """Aguarda o prazo executando tarefas pendentes; dorme apenas o que sobrar"""
+        start = time.monotonic()
+        gap = self.not_before - start
+        if gap <= 0:
+            return
+        self.gap_seconds += gap
+
+        while self._tasks and self.not_before - time.monotonic() >= self.min_gap:
+            self._run_next()
+
+        now = time.monotonic()
+        self.work_seconds += min(now, self.not_before) - start
+        if now > self.not_before:
+            self.overrun_seconds += now - self.not_before
+        remaining = self.not_before - now
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def pace(self, delay: float) -> None:
+        """Substituto de time.sleep: agenda a pausa e aproveita o intervalo"""
+        self.schedule(delay)
+        self.wait()
+
+    def drain(self) -> None:
+        """Executa todas as tarefas pendentes imediatamente"""
+        while self._tasks:
+            self._run_next()
+
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def _run_next(self) -> None:
+        name, task = self._tasks.popleft()
+        try:
+            task()
+        except Exception as e:
+            print(f"[AVISO] Tarefa agendada falhou ({name}): {str(e)[:50]}")
+        self.tasks_run += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Pausas do ritmo humano e fração aproveitada com trabalho (utilização recuperada)"""
+        return {
+            'gap_seconds': round(self.gap_seconds, 1),
+            'work_seconds': round(self.work_seconds, 1),
+            'overrun_seconds': round(self.overrun_seconds, 1),
+            'tasks_run': self.tasks_run,
+            'utilization_pct': round(self.work_seconds / self.gap_seconds * 100, 1) if self.gap_seconds else 0.0
+        }
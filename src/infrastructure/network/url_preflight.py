@@ -0,0 +1,149 @@
+"""
+Pré-verificação de URLs (DNS + HEAD/GET parcial) antes de gastar tempo de navegador
+"""
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from ..config.config_manager import ConfigManager
+from ..utils.domain_matcher import DomainNormalizer, get_blacklist_matcher
+from ...domain.models.url_triage_model import UrlTriageModel
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+DOCUMENT_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods',
+                       '.zip', '.rar', '.7z', '.exe', '.msi', '.dwg', '.csv', '.txt', '.xml',
+                       '.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.mp3')
+HTML_TYPES = ('text/html', 'application/xhtml')
+# Servidores que recusam HEAD ou bloqueiam clientes HTTP simples: confirma com GET parcial
+HEAD_FALLBACK_STATUS = {400, 403, 405, 406, 429, 500, 501, 503}
+# Bloqueio anti-bot não significa site morto: navegador ainda pode abrir
+BROWSER_ONLY_STATUS = {401, 403, 429, 503}
+
+
+class UrlPreflight:
+    """Classifica links por tipo de conteúdo, tamanho e host final, em paralelo"""
+
+    def __init__(self, blacklist_hosts: Iterable[str] = (), config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.enabled: bool = config.preflight_enabled
+        self.workers: int = config.preflight_workers
+        self.timeout: float = config.preflight_timeout
+        self.max_bytes: int = config.preflight_max_bytes
+        self.matcher = get_blacklist_matcher(blacklist_hosts)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'pt-BR,pt;q=0.9',
+                                     'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8'})
+        self._dns_cache: Dict[str, bool] = {}
+        # getaddrinfo não tem timeout: roda em pool próprio e a espera é limitada
+        self._dns_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preflight-dns")
+        self._lock = threading.Lock()
+        self.verdicts: Dict[str, int] = {}
+
+    def triage(self, urls: List[str]) -> List[UrlTriageModel]:
+        """Triagem concorrente; retorna na mesma ordem da entrada (sem resposta no prazo = 'unknown')"""
+        if not urls:
+            return []
+        if not self.enabled:
+            return [UrlTriageModel(url=url, verdict='unknown', final_url=url) for url in urls]
+
+        results: Dict[int, UrlTriageModel] = {}
+        deadline = time.monotonic() + self.timeout * 2
+        executor = ThreadPoolExecutor(max_workers=min(self.workers, len(urls)), thread_name_prefix="preflight")
+        futures = {executor.submit(self.check, url): i for i, url in enumerate(urls)}
+        try:
+            for future in as_completed(futures, timeout=max(deadline - time.monotonic(), 0)):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        triaged = [results.get(i) or UrlTriageModel(url=url, verdict='unknown', final_url=url, reason='prazo')
+                   for i, url in enumerate(urls)]
+        with self._lock:
+            for item in triaged:
+                self.verdicts[item.verdict] = self.verdicts.get(item.verdict, 0) + 1
+        return triaged
+
+    def check(self, url: str) -> UrlTriageModel:
+        """Classifica uma URL (extensão, DNS, HEAD, GET parcial, host final)"""
+        path = DomainNormalizer.split_url(url)[1].lower().split('?', 1)[0]
+        if path.endswith(DOCUMENT_EXTENSIONS):
+            return UrlTriageModel(url=url, verdict='document', final_url=url, reason=path.rsplit('.', 1)[-1])
+
+        host = DomainNormalizer.extract_host(url)
+        if not self._resolves(host):
+            return UrlTriageModel(url=url, verdict='dead_host', final_url=url, reason='dns')
+
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in HEAD_FALLBACK_STATUS or not response.headers.get('Content-Type'):
+                response.close()
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True,
+                                            stream=True, headers={'Range': 'bytes=0-0'})
+            response.close()
+        except requests.exceptions.ConnectionError:
+            return UrlTriageModel(url=url, verdict='dead_host', final_url=url, reason='conexão')
+        except requests.exceptions.RequestException as e:
+            # Timeout/SSL: sem conclusão, o navegador decide
+            return UrlTriageModel(url=url, verdict='unknown', final_url=url, reason=type(e).__name__)
+
+        return self._classify(url, response)
+
+    def _classify(self, url: str, response: requests.Response) -> UrlTriageModel:
+        final_url = response.url or url
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        result = UrlTriageModel(url=url, verdict='html', final_url=final_url, status=response.status_code,
+                                content_type=content_type, content_length=self._content_length(response))
+
+        if final_url != url and self.matcher.is_blacklisted(final_url):
+            result.verdict, result.reason = 'blacklisted', DomainNormalizer.extract_host(final_url)
+        elif response.status_code >= 400 and response.status_code not in BROWSER_ONLY_STATUS:
+            result.verdict, result.reason = 'http_error', str(response.status_code)
+        elif response.status_code >= 400:
+            result.verdict, result.reason = 'unknown', str(response.status_code)
+        elif content_type and not content_type.startswith(HTML_TYPES):
+            result.verdict, result.reason = 'non_html', content_type
+        elif result.content_length and result.content_length > self.max_bytes:
+            result.verdict, result.reason = 'too_large', str(result.content_length)
+        return result
+
+    @staticmethod
+    def _content_length(response: requests.Response) -> Optional[int]:
+        """Tamanho total (Content-Range do GET parcial ou Content-Length)"""
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+            return int(content_range.rsplit('/', 1)[1])
+        length = response.headers.get('Content-Length', '')
+        return int(length) if length.isdigit() and response.status_code != 206 else None
+
+    def _resolves(self, host: str) -> bool:
+        """Resolução DNS com cache (hosts inexistentes não chegam ao navegador)"""
+        if not host:
+            return False
+        cached = self._dns_cache.get(host)
+        if cached is not None:
+            return cached
+        future = self._dns_executor.submit(socket.getaddrinfo, host, 443, proto=socket.IPPROTO_TCP)
+        try:
+            future.result(timeout=self.timeout)
+            resolves = True
+        except FuturesTimeoutError:
+            return True  # DNS lento não é host morto: não guarda no cache, o HTTP decide
+        except socket.gaierror:
+            resolves = False
+        except OSError:
+            resolves = True  # Falha local (não do host): deixa o HTTP decidir
+        with self._lock:
+            self._dns_cache[host] = resolves
+        return resolves
+
+    def get_stats(self) -> Dict[str, int]:
+        """Quantidade de URLs por veredicto (acumulado no processo)"""
+        with self._lock:
+            return dict(self.verdicts)
@@ -1,17 +1,24 @@
 """
 Repositório para acesso ao banco Access - Substitui JSON
 """
+import dataclasses
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 import pyodbc
 
+from .job_queue import JobQueue
+from ..utils.address_canonicalizer import AddressCanonicalizer
+
 
 class AccessRepository:
     """Repositório principal para banco Access"""
     
-    _connection = None  # Singleton de conexão
+    _local = threading.local()  # Conexão da thread atual (pyodbc não compartilha conexão entre threads)
+    _connections = []  # Todas as conexões abertas (fechadas em close_connection)
+    _connections_lock = threading.Lock()
     _instance = None
     
     def __new__(cls):
@@ -29,19 +36,32 @@ class AccessRepository:
         self.db_path = self.db_path.resolve()
         self.conn_str = f'DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={self.db_path};'
         self.logger = logging.getLogger(__name__)
+        self.geolocation_queue = JobQueue(self, 'TB_GEOLOCALIZACAO', 'ID_GEO')
+        self.cep_queue = JobQueue(self, 'TB_CEP_ENRICHMENT', 'ID_CEP_ENRICHMENT')
+        self._has_chave_canonica = None  # Detectado no primeiro save_endereco
         self._initialized = True
 
     def _get_connection(self):
-        """Obtém conexão singleton com o banco"""
-        if self._connection is None:
-            self._connection = pyodbc.connect(self.conn_str)
-        return self._connection
+        """Obtém conexão da thread atual (uma por thread, reaproveitada entre chamadas)"""
+        connection = getattr(AccessRepository._local, 'connection', None)
+        if connection is None:
+            connection = pyodbc.connect(self.conn_str)
+            AccessRepository._local.connection = connection
+            with AccessRepository._connections_lock:
+                AccessRepository._connections.append(connection)
+        return connection
     
     def close_connection(self):
-        """Fecha conexão singleton"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Fecha conexões de todas as threads (grava antes os acks pendentes das filas)"""
+        self.flush_job_acknowledgements()
+        with AccessRepository._connections_lock:
+            for connection in AccessRepository._connections:
+                try:
+                    connection.close()
+                except pyodbc.Error:
+                    pass
+            AccessRepository._connections = []
+            AccessRepository._local = threading.local()
 
     # ===== EMPRESAS =====
 
@@ -59,7 +79,7 @@ class AccessRepository:
             return False
 
     def save_endereco(self, address_model) -> int:
-        """Salva endereço estruturado e retorna ID"""
+        """Salva endereço estruturado e retorna ID (endereço canônico já existente é reaproveitado)"""
         if not address_model or not address_model.is_valid():
             return None
             
@@ -75,23 +95,47 @@ class AccessRepository:
                 cursor.close()
                 return None
             
-            # Verificar se endereço já existe (por logradouro + numero + complemento)
-            cursor.execute("""
-                           SELECT ID_ENDERECO FROM TB_ENDERECOS 
-                           WHERE LOGRADOURO = ? AND NUMERO = ? AND COMPLEMENTO = ? AND BAIRRO = ?
-                           """, (address_model.logradouro, address_model.numero, address_model.complemento, address_model.bairro))
-            existing = cursor.fetchone()
+            # Verificar se endereço já existe (chave canônica: abreviações, acentos, número/complemento normalizados)
+            chave = AddressCanonicalizer.canonical_key(address_model) if self._chave_canonica_enabled() else None
+            if chave:
+                cursor.execute("SELECT ID_ENDERECO FROM TB_ENDERECOS WHERE CHAVE_CANONICA = ?", (chave,))
+                existing = cursor.fetchone()
+            elif not self._has_chave_canonica:
+                # Banco não migrado: igualdade de campos (comportamento anterior)
+                cursor.execute("""
+                               SELECT ID_ENDERECO FROM TB_ENDERECOS 
+                               WHERE LOGRADOURO = ? AND NUMERO = ? AND COMPLEMENTO = ? AND BAIRRO = ?
+                               """, (address_model.logradouro, address_model.numero, address_model.complemento, address_model.bairro))
+                existing = cursor.fetchone()
+            else:
+                existing = None  # Sem logradouro: sem chave, não deduplica
             
             if existing:
                 cursor.close()
                 return existing[0]
             
             # Inserir novo endereço
-            cursor.execute("""
-                           INSERT INTO TB_ENDERECOS (LOGRADOURO, NUMERO, COMPLEMENTO, BAIRRO, CIDADE, ESTADO, CEP, DATA_CRIACAO)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, Date())
-                           """, (address_model.logradouro, address_model.numero, address_model.complemento, address_model.bairro, 
-                           address_model.cidade, address_model.estado, address_model.cep))
+            values = [address_model.logradouro, address_model.numero, address_model.complemento, address_model.bairro,
+                      address_model.cidade, address_model.estado, address_model.cep]
+            try:
+                if self._has_chave_canonica:
+                    cursor.execute("""
+                                   INSERT INTO TB_ENDERECOS (LOGRADOURO, NUMERO, COMPLEMENTO, BAIRRO, CIDADE, ESTADO, CEP,
+                                                             CHAVE_CANONICA, DATA_CRIACAO)
+                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, Date())
+                                   """, values + [chave])
+                else:
+                    cursor.execute("""
+                                   INSERT INTO TB_ENDERECOS (LOGRADOURO, NUMERO, COMPLEMENTO, BAIRRO, CIDADE, ESTADO, CEP, DATA_CRIACAO)
+                                   VALUES (?, ?, ?, ?, ?, ?, ?, Date())
+                                   """, values)
+            except pyodbc.IntegrityError:
+                # Outra thread inseriu o mesmo endereço canônico (índice único)
+                conn.rollback()
+                cursor.execute("SELECT ID_ENDERECO FROM TB_ENDERECOS WHERE CHAVE_CANONICA = ?", (chave,))
+                existing = cursor.fetchone()
+                cursor.close()
+                return existing[0] if existing else None
             
             cursor.execute("SELECT @@IDENTITY")
             endereco_id = cursor.fetchone()[0]
@@ -102,6 +146,87 @@ class AccessRepository:
             print(f"[AVISO] Erro ao salvar endereço: {e} - continuando sem endereço")
             return None
 
+    def _chave_canonica_enabled(self) -> bool:
+        """TB_ENDERECOS tem CHAVE_CANONICA (migrate_endereco_canonico.py executado)? Detectado uma vez"""
+        if self._has_chave_canonica is None:
+            self._has_chave_canonica = 'CHAVE_CANONICA' in self.get_table_columns('TB_ENDERECOS')
+            if not self._has_chave_canonica:
+                print("[AVISO] TB_ENDERECOS sem CHAVE_CANONICA - execute scripts/database/migrate_endereco_canonico.py")
+        return self._has_chave_canonica
+
+    def merge_enderecos(self, survivor: int, duplicates: List[int]) -> None:
+        """Funde endereços equivalentes no sobrevivente: empresas, uma tarefa por fila e coordenadas já calculadas"""
+        if not duplicates:
+            return
+        placeholders = ', '.join('?' for _ in duplicates)
+        self.execute_query(f"UPDATE TB_EMPRESAS SET ID_ENDERECO = ? WHERE ID_ENDERECO IN ({placeholders})",
+                           [survivor] + duplicates)
+
+        # Uma tarefa por endereço: mantém a concluída, depois a do sobrevivente, depois a mais antiga
+        for table, id_column in [('TB_CEP_ENRICHMENT', 'ID_CEP_ENRICHMENT'), ('TB_GEOLOCALIZACAO', 'ID_GEO')]:
+            ids = [survivor] + duplicates
+            tasks = self.fetch_all(f"""
+                SELECT {id_column}, ID_ENDERECO, STATUS_PROCESSAMENTO FROM {table}
+                WHERE ID_ENDERECO IN ({', '.join('?' for _ in ids)}) ORDER BY {id_column}
+            """, ids)
+            if not tasks:
+                continue
+            keep = sorted(tasks, key=lambda t: (t[2] != 'CONCLUIDO', t[1] != survivor, t[0]))[0][0]
+            self.execute_query(f"UPDATE {table} SET ID_ENDERECO = ? WHERE {id_column} = ?", [survivor, keep])
+            for task_id, _, _ in tasks:
+                if task_id != keep:
+                    self.execute_query(f"DELETE FROM {table} WHERE {id_column} = ?", [task_id])
+
+        self.execute_query(f"DELETE FROM TB_ENDERECOS WHERE ID_ENDERECO IN ({placeholders})", duplicates)
+
+        # Coordenadas já calculadas passam para todas as empresas do endereço
+        geo = self.fetch_one("""
+            SELECT LATITUDE, LONGITUDE, DISTANCIA_KM FROM TB_GEOLOCALIZACAO
+            WHERE ID_ENDERECO = ? AND STATUS_PROCESSAMENTO = 'CONCLUIDO'
+        """, [survivor])
+        if geo:
+            self.execute_query("""
+                UPDATE TB_EMPRESAS SET LATITUDE = ?, LONGITUDE = ?, DISTANCIA_KM = ? WHERE ID_ENDERECO = ?
+            """, [geo[0], geo[1], geo[2], survivor])
+
+    def _update_endereco_fields(self, endereco_id: int, address) -> int:
+        """Grava campos corrigidos recalculando CHAVE_CANONICA; chave de outro endereço funde nele. Retorna o ID final"""
+        values = [address.logradouro, address.numero, address.complemento, address.bairro,
+                  address.cidade, address.estado]
+        if not self._chave_canonica_enabled():
+            self.execute_query("""
+                UPDATE TB_ENDERECOS
+                SET LOGRADOURO = ?, NUMERO = ?, COMPLEMENTO = ?, BAIRRO = ?, CIDADE = ?, ESTADO = ?
+                WHERE ID_ENDERECO = ?
+            """, values + [endereco_id])
+            return endereco_id
+
+        # CEP não é reescrito: chave usa o gravado
+        row = self.fetch_one("SELECT CEP FROM TB_ENDERECOS WHERE ID_ENDERECO = ?", [endereco_id])
+        if not row:
+            return endereco_id
+        chave = AddressCanonicalizer.canonical_key(dataclasses.replace(address, cep=row[0] or ""))
+        for _ in range(2):
+            if chave:
+                existing = self.fetch_one("""
+                    SELECT ID_ENDERECO FROM TB_ENDERECOS WHERE CHAVE_CANONICA = ? AND ID_ENDERECO <> ?
+                """, [chave, endereco_id])
+                if existing:
+                    self.merge_enderecos(existing[0], [endereco_id])
+                    return existing[0]
+            try:
+                self.execute_query("""
+                    UPDATE TB_ENDERECOS
+                    SET LOGRADOURO = ?, NUMERO = ?, COMPLEMENTO = ?, BAIRRO = ?, CIDADE = ?, ESTADO = ?,
+                        CHAVE_CANONICA = ?
+                    WHERE ID_ENDERECO = ?
+                """, values + [chave, endereco_id])
+                return endereco_id
+            except pyodbc.IntegrityError:
+                # Outra thread gravou a mesma chave entre a busca e o UPDATE: funde na próxima volta
+                self._get_connection().rollback()
+        return endereco_id
+
     def save_empresa(self, termo_id: int, site_url: str, domain: str, motor_busca: str,
                      address_model = None, latitude: float = None, longitude: float = None,
                      distancia_km: float = None) -> int:
@@ -148,6 +273,54 @@ class AccessRepository:
         conn.commit()
         cursor.close()
 
+    def update_empresa_fingerprint(self, empresa_id: int, fingerprint: str) -> None:
+        """Grava fingerprint SimHash (hex) da empresa"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("UPDATE TB_EMPRESAS SET FINGERPRINT = ? WHERE ID_EMPRESA = ?", (fingerprint, empresa_id))
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar fingerprint (executar migrate_fingerprint.py?): {e}")
+
+    def get_company_fingerprints(self) -> List[Dict[str, Any]]:
+        """Fingerprints e contatos das empresas já extraídas (índice de quase-duplicatas)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("""
+                           SELECT emp.DOMINIO, emp.FINGERPRINT, emp.NOME_EMPRESA, p.EMAIL, p.TELEFONE,
+                                  end.LOGRADOURO, end.NUMERO, end.COMPLEMENTO, end.BAIRRO, end.CIDADE, end.ESTADO, end.CEP
+                           FROM (TB_EMPRESAS emp
+                           LEFT JOIN TB_PLANILHA p ON emp.SITE_URL = p.SITE)
+                           LEFT JOIN TB_ENDERECOS end ON emp.ID_ENDERECO = end.ID_ENDERECO
+                           WHERE emp.FINGERPRINT IS NOT NULL AND emp.FINGERPRINT <> ''
+                           """)
+            rows = cursor.fetchall()
+            cursor.close()
+
+            from src.domain.models.address_model import AddressModel
+            return [{
+                'dominio': row[0],
+                'fingerprint': row[1],
+                'nome_empresa': row[2] or '',
+                'emails': row[3] or '',
+                'telefones': row[4] or '',
+                'address_model': AddressModel(
+                    logradouro=row[5] or "",
+                    numero=row[6] or "",
+                    complemento=row[7] or "",
+                    bairro=row[8] or "",
+                    cidade=row[9] or "",
+                    estado=row[10] or "",
+                    cep=row[11] or ""
+                ) if row[5] or row[11] else None
+            } for row in rows]
+        except Exception as e:
+            self.logger.error(f"Erro ao carregar fingerprints: {e}")
+            return []
+
     # ===== E-MAILS =====
 
     def is_email_collected(self, email: str) -> bool:
@@ -265,6 +438,13 @@ class AccessRepository:
             cursor.execute("DELETE FROM TB_TERMOS_BUSCA")
             conn.commit()
     
+    def count_companies_within(self, max_distance_km: float) -> int:
+        """Conta empresas geolocalizadas até a distância informada da referência"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM TB_EMPRESAS WHERE DISTANCIA_KM <= ?", max_distance_km)
+            return cursor.fetchone()[0]
+
     def save_dynamic_search_terms(self, terms: list) -> int:
         """Salva termos de busca gerados dinamicamente"""
         if not terms:
@@ -315,15 +495,17 @@ class AccessRepository:
             
             # Buscar e concatenar endereço da empresa
             cursor.execute("""
-                           SELECT e.LOGRADOURO, e.NUMERO, e.COMPLEMENTO, e.BAIRRO, e.CIDADE, e.ESTADO
+                           SELECT e.LOGRADOURO, e.NUMERO, e.COMPLEMENTO, e.BAIRRO, e.CIDADE, e.ESTADO, emp.DISTANCIA_KM
                            FROM TB_EMPRESAS emp 
                            LEFT JOIN TB_ENDERECOS e ON emp.ID_ENDERECO = e.ID_ENDERECO 
                            WHERE emp.SITE_URL = ?
                            """, site_url)
             endereco_result = cursor.fetchone()
+            if distancia_km is None and endereco_result:
+                distancia_km = endereco_result[6]  # Endereço compartilhado já geolocalizado
             
             if endereco_result and endereco_result[0]:  # Se tem logradouro
-                logr, num, complemento, bairro, cidade, estado = endereco_result
+                logr, num, complemento, bairro, cidade, estado = endereco_result[:6]
                 parts = []
                 if logr:
                     if num:
@@ -389,7 +571,7 @@ class AccessRepository:
     # ===== GEOLOCALIZACAO =====
 
     def create_geolocation_task(self, empresa_id: int, endereco_id: int):
-        """Cria tarefa de geolocalização usando ID do endereço"""
+        """Cria tarefa de geolocalização usando ID do endereço (uma por endereço, compartilhada entre empresas)"""
         if not endereco_id:
             return
             
@@ -397,32 +579,52 @@ class AccessRepository:
             cursor = conn.cursor()
             
             # Verificar se já existe tarefa para este endereço
-            cursor.execute("SELECT ID_GEO FROM TB_GEOLOCALIZACAO WHERE ID_ENDERECO = ?", endereco_id)
+            cursor.execute("""
+                           SELECT ID_GEO, STATUS_PROCESSAMENTO, LATITUDE, LONGITUDE, DISTANCIA_KM
+                           FROM TB_GEOLOCALIZACAO WHERE ID_ENDERECO = ?
+                           """, endereco_id)
             existing = cursor.fetchone()
             
-            if not existing:
+            if existing and existing[1] == 'CONCLUIDO':
+                # Endereço já geolocalizado: empresa nova recebe as coordenadas sem nova consulta
+                cursor.execute("""
+                               UPDATE TB_EMPRESAS SET LATITUDE = ?, LONGITUDE = ?, DISTANCIA_KM = ?
+                               WHERE ID_EMPRESA = ?
+                               """, existing[2], existing[3], existing[4], empresa_id)
+                conn.commit()
+            elif not existing:
                 cursor.execute("""
                                INSERT INTO TB_GEOLOCALIZACAO (ID_EMPRESA, ID_ENDERECO, STATUS_PROCESSAMENTO, TENTATIVAS)
                                VALUES (?, ?, 'PENDENTE', 0)
                                """, empresa_id, endereco_id)
                 conn.commit()
 
-    def get_pending_geolocation_tasks(self) -> List[Dict[str, Any]]:
-        """Obtém tarefas de geolocalização pendentes com dados estruturados"""
+    def get_pending_geolocation_tasks(self, empresa_id: Optional[int] = None,
+                                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Reserva tarefas de geolocalização elegíveis com dados estruturados (empresa_id opcional; limit = TOP n)"""
+        self.geolocation_queue.recover_expired()
+        if empresa_id is None and not limit:
+            limit = self.geolocation_queue.claim_batch_size  # Sem filtro: reserva só um lote
+        ready, ready_params = self.geolocation_queue.ready_condition('g')
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                           SELECT g.ID_GEO, g.ID_EMPRESA, g.ID_ENDERECO, emp.SITE_URL,
+            cursor.execute(f"""
+                           SELECT {f'TOP {int(limit)} ' if limit else ''}g.ID_GEO, g.ID_EMPRESA, g.ID_ENDERECO, emp.SITE_URL,
                                   end.LOGRADOURO, end.NUMERO, end.COMPLEMENTO, end.BAIRRO, end.CIDADE, end.ESTADO, end.CEP
                            FROM (TB_GEOLOCALIZACAO g 
                            INNER JOIN TB_EMPRESAS emp ON g.ID_EMPRESA = emp.ID_EMPRESA)
                            INNER JOIN TB_ENDERECOS end ON g.ID_ENDERECO = end.ID_ENDERECO
-                           WHERE g.STATUS_PROCESSAMENTO = 'PENDENTE'
+                           WHERE {ready}
+                           {'AND g.ID_EMPRESA = ?' if empresa_id is not None else ''}
                            ORDER BY g.ID_GEO
-                           """)
+                           """, *ready_params, *([empresa_id] if empresa_id is not None else []))
+            rows = cursor.fetchall()
             
+            claimed = set(self.geolocation_queue.claim([row[0] for row in rows]))
             tasks = []
-            for row in cursor.fetchall():
+            for row in rows:
+                if row[0] not in claimed:
+                    continue
                 # Criar AddressModel a partir dos dados
                 from src.domain.models.address_model import AddressModel
                 address = AddressModel(
@@ -455,26 +657,24 @@ class AccessRepository:
                            UPDATE TB_GEOLOCALIZACAO
                            SET LATITUDE = ?, LONGITUDE = ?, DISTANCIA_KM = ?,
                                STATUS_PROCESSAMENTO = 'CONCLUIDO', DATA_PROCESSAMENTO = Date(),
-                               TENTATIVAS = TENTATIVAS + 1
+                               VISIVEL_ATE = NULL
                            WHERE ID_GEO = ?
                            """, latitude, longitude, distancia_km, id_geo)
             
-            # Obter ID da empresa
-            cursor.execute("SELECT ID_EMPRESA FROM TB_GEOLOCALIZACAO WHERE ID_GEO = ?", id_geo)
-            empresa_id = cursor.fetchone()[0]
+            # Obter endereço da tarefa
+            cursor.execute("SELECT ID_ENDERECO FROM TB_GEOLOCALIZACAO WHERE ID_GEO = ?", id_geo)
+            endereco_id = cursor.fetchone()[0]
             
-            # Replicar para TB_EMPRESAS
+            # Replicar para todas as empresas do endereço (TB_EMPRESAS)
             cursor.execute("""
                            UPDATE TB_EMPRESAS
                            SET LATITUDE = ?, LONGITUDE = ?, DISTANCIA_KM = ?
-                           WHERE ID_EMPRESA = ?
-                           """, latitude, longitude, distancia_km, empresa_id)
+                           WHERE ID_ENDERECO = ?
+                           """, latitude, longitude, distancia_km, endereco_id)
             
             # Replicar distância para TB_PLANILHA
-            cursor.execute("SELECT SITE_URL FROM TB_EMPRESAS WHERE ID_EMPRESA = ?", empresa_id)
-            site_result = cursor.fetchone()
-            if site_result:
-                site_url = site_result[0]
+            cursor.execute("SELECT SITE_URL FROM TB_EMPRESAS WHERE ID_ENDERECO = ?", endereco_id)
+            for (site_url,) in cursor.fetchall():
                 cursor.execute("""
                                UPDATE TB_PLANILHA
                                SET DISTANCIA_KM = ?
@@ -488,17 +688,9 @@ class AccessRepository:
         self.update_geolocation_success(id_geo, latitude, longitude, distancia_km)
         print(f"      📋 Dados replicados: TB_EMPRESAS + TB_PLANILHA")
 
-    def update_geolocation_error(self, id_geo: int, erro_descricao: str):
-        """Atualiza erro na geolocalização"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           UPDATE TB_GEOLOCALIZACAO
-                           SET STATUS_PROCESSAMENTO = 'ERRO', DATA_PROCESSAMENTO = Date(),
-                               TENTATIVAS = TENTATIVAS + 1, ERRO_DESCRICAO = ?
-                           WHERE ID_GEO = ?
-                           """, erro_descricao, id_geo)
-            conn.commit()
+    def update_geolocation_error(self, id_geo: int, erro_descricao: str, permanent: bool = False) -> str:
+        """Registra erro na geolocalização (reagendada com backoff ou dead letter); retorna o novo status"""
+        return self.geolocation_queue.nack(id_geo, erro_descricao, permanent)
 
     def update_planilha_distance_by_empresa(self, empresa_id: int, distancia_km: float):
         """Atualiza distância na planilha baseado no ID da empresa (método legado)"""
@@ -532,10 +724,10 @@ class AccessRepository:
             cursor.execute("SELECT COUNT(*) FROM TB_GEOLOCALIZACAO WHERE STATUS_PROCESSAMENTO = 'CONCLUIDO'")
             geocodificadas = cursor.fetchone()[0]
             
-            cursor.execute("SELECT COUNT(*) FROM TB_GEOLOCALIZACAO WHERE STATUS_PROCESSAMENTO = 'PENDENTE'")
+            cursor.execute("SELECT COUNT(*) FROM TB_GEOLOCALIZACAO WHERE STATUS_PROCESSAMENTO IN ('PENDENTE', 'PROCESSANDO')")
             pendentes = cursor.fetchone()[0]
             
-            cursor.execute("SELECT COUNT(*) FROM TB_GEOLOCALIZACAO WHERE STATUS_PROCESSAMENTO = 'ERRO'")
+            cursor.execute("SELECT COUNT(*) FROM TB_GEOLOCALIZACAO WHERE STATUS_PROCESSAMENTO IN ('ERRO', 'DESCARTADO')")
             erros = cursor.fetchone()[0]
             
             cursor.close()
@@ -785,15 +977,15 @@ class AccessRepository:
     # ===== CEP ENRICHMENT =====
     
     def create_cep_enrichment_task(self, empresa_id: int, endereco_id: int):
-        """Cria tarefa de enriquecimento CEP"""
+        """Cria tarefa de enriquecimento CEP (uma por endereço, compartilhada entre empresas)"""
         if not endereco_id:
             return
             
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            # Verificar se já existe tarefa para esta empresa
-            cursor.execute("SELECT ID_CEP_ENRICHMENT FROM TB_CEP_ENRICHMENT WHERE ID_EMPRESA = ?", empresa_id)
+            # Verificar se já existe tarefa para este endereço
+            cursor.execute("SELECT ID_CEP_ENRICHMENT FROM TB_CEP_ENRICHMENT WHERE ID_ENDERECO = ?", endereco_id)
             existing = cursor.fetchone()
             
             if not existing:
@@ -803,22 +995,32 @@ class AccessRepository:
                                """, empresa_id, endereco_id)
                 conn.commit()
     
-    def get_pending_cep_enrichment_tasks(self) -> List[Dict[str, Any]]:
-        """Obtém tarefas de enriquecimento CEP pendentes"""
+    def get_pending_cep_enrichment_tasks(self, empresa_id: Optional[int] = None,
+                                         limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Reserva tarefas de enriquecimento CEP elegíveis (opcional: de uma empresa; limit = TOP n)"""
+        self.cep_queue.recover_expired()
+        if empresa_id is None and not limit:
+            limit = self.cep_queue.claim_batch_size  # Sem filtro: reserva só um lote
+        ready, ready_params = self.cep_queue.ready_condition('c')
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                           SELECT c.ID_CEP_ENRICHMENT, c.ID_EMPRESA, c.ID_ENDERECO, emp.SITE_URL,
+            cursor.execute(f"""
+                           SELECT {f'TOP {int(limit)} ' if limit else ''}c.ID_CEP_ENRICHMENT, c.ID_EMPRESA, c.ID_ENDERECO, emp.SITE_URL,
                                   end.LOGRADOURO, end.NUMERO, end.COMPLEMENTO, end.BAIRRO, end.CIDADE, end.ESTADO, end.CEP
                            FROM (TB_CEP_ENRICHMENT c 
                            INNER JOIN TB_EMPRESAS emp ON c.ID_EMPRESA = emp.ID_EMPRESA)
                            INNER JOIN TB_ENDERECOS end ON c.ID_ENDERECO = end.ID_ENDERECO
-                           WHERE c.STATUS_PROCESSAMENTO = 'PENDENTE'
+                           WHERE {ready}
+                           {'AND c.ID_EMPRESA = ?' if empresa_id is not None else ''}
                            ORDER BY c.ID_CEP_ENRICHMENT
-                           """)
+                           """, *ready_params, *([empresa_id] if empresa_id is not None else []))
+            rows = cursor.fetchall()
             
+            claimed = set(self.cep_queue.claim([row[0] for row in rows]))
             tasks = []
-            for row in cursor.fetchall():
+            for row in rows:
+                if row[0] not in claimed:
+                    continue
                 from src.domain.models.address_model import AddressModel
                 address = AddressModel(
                     logradouro=row[4] or "",
@@ -841,28 +1043,20 @@ class AccessRepository:
             return tasks
     
     def update_cep_enrichment_success(self, id_cep_enrichment: int):
-        """Atualiza sucesso do enriquecimento CEP"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           UPDATE TB_CEP_ENRICHMENT
-                           SET STATUS_PROCESSAMENTO = 'CONCLUIDO', DATA_PROCESSAMENTO = Date(),
-                               TENTATIVAS = TENTATIVAS + 1
-                           WHERE ID_CEP_ENRICHMENT = ?
-                           """, id_cep_enrichment)
-            conn.commit()
+        """Confirma enriquecimento CEP (ack em lote - ver flush_job_acknowledgements)"""
+        self.cep_queue.ack(id_cep_enrichment)
     
-    def update_cep_enrichment_error(self, id_cep_enrichment: int, erro_descricao: str):
-        """Atualiza erro no enriquecimento CEP"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           UPDATE TB_CEP_ENRICHMENT
-                           SET STATUS_PROCESSAMENTO = 'ERRO', DATA_PROCESSAMENTO = Date(),
-                               TENTATIVAS = TENTATIVAS + 1, ERRO_DESCRICAO = ?
-                           WHERE ID_CEP_ENRICHMENT = ?
-                           """, erro_descricao, id_cep_enrichment)
-            conn.commit()
+    def update_cep_enrichment_error(self, id_cep_enrichment: int, erro_descricao: str, permanent: bool = False) -> str:
+        """Registra erro no enriquecimento CEP (reagendado com backoff ou dead letter); retorna o novo status"""
+        return self.cep_queue.nack(id_cep_enrichment, erro_descricao, permanent)
+
+    def flush_job_acknowledgements(self) -> None:
+        """Grava acks pendentes das filas de tarefas"""
+        for job_queue in (self.cep_queue, self.geolocation_queue):
+            try:
+                job_queue.flush()
+            except pyodbc.Error as e:
+                self.logger.warning(f"Falha ao gravar acks de {job_queue.table}: {e}")
     
     def get_cep_enrichment_stats(self) -> Dict[str, int]:
         """Obtém estatísticas de enriquecimento CEP"""
@@ -873,10 +1067,10 @@ class AccessRepository:
             cursor.execute("SELECT COUNT(*) FROM TB_CEP_ENRICHMENT WHERE STATUS_PROCESSAMENTO = 'CONCLUIDO'")
             concluidos = cursor.fetchone()[0]
             
-            cursor.execute("SELECT COUNT(*) FROM TB_CEP_ENRICHMENT WHERE STATUS_PROCESSAMENTO = 'PENDENTE'")
+            cursor.execute("SELECT COUNT(*) FROM TB_CEP_ENRICHMENT WHERE STATUS_PROCESSAMENTO IN ('PENDENTE', 'PROCESSANDO')")
             pendentes = cursor.fetchone()[0]
             
-            cursor.execute("SELECT COUNT(*) FROM TB_CEP_ENRICHMENT WHERE STATUS_PROCESSAMENTO = 'ERRO'")
+            cursor.execute("SELECT COUNT(*) FROM TB_CEP_ENRICHMENT WHERE STATUS_PROCESSAMENTO IN ('ERRO', 'DESCARTADO')")
             erros = cursor.fetchone()[0]
             
             cursor.close()
@@ -896,25 +1090,15 @@ class AccessRepository:
     
     # ===== ADDRESS ENRICHMENT =====
     
-    def update_endereco_corrected(self, endereco_id: int, corrected_address) -> None:
-        """Atualiza endereço corrigido na TB_ENDERECOS"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE TB_ENDERECOS 
-                SET LOGRADOURO = ?, NUMERO = ?, COMPLEMENTO = ?, BAIRRO = ?, CIDADE = ?, ESTADO = ?
-                WHERE ID_ENDERECO = ?
-            """, 
-                corrected_address.logradouro,
-                corrected_address.numero,
-                corrected_address.complemento,
-                corrected_address.bairro,
-                corrected_address.cidade,
-                corrected_address.estado,
-                endereco_id
-            )
-            conn.commit()
-    
+    def update_endereco_corrected(self, endereco_id: int, corrected_address) -> int:
+        """Atualiza endereço corrigido na TB_ENDERECOS; retorna o ID final (fundido se virou duplicado)"""
+        return self._update_endereco_fields(endereco_id, corrected_address)
+
+    def update_enderecos_corrected(self, corrected: List[Tuple[int, Any]]) -> None:
+        """Atualiza vários endereços corrigidos da TB_ENDERECOS: [(endereco_id, address)]"""
+        for endereco_id, address in corrected:
+            self._update_endereco_fields(endereco_id, address)
+
     def update_endereco_enriched(self, empresa_id: int, enriched_address) -> None:
         """Atualiza endereço enriquecido na TB_ENDERECOS e cria tarefa de geolocalização"""
         with self._get_connection() as conn:
@@ -926,22 +1110,10 @@ class AccessRepository:
             if not result:
                 return
             endereco_id = result[0]
+            cursor.close()
             
-            # Atualizar TB_ENDERECOS
-            cursor.execute("""
-                UPDATE TB_ENDERECOS 
-                SET LOGRADOURO = ?, NUMERO = ?, COMPLEMENTO = ?, BAIRRO = ?, CIDADE = ?, ESTADO = ?
-                WHERE ID_ENDERECO = ?
-            """, 
-                enriched_address.logradouro,
-                enriched_address.numero,
-                enriched_address.complemento,
-                enriched_address.bairro,
-                enriched_address.cidade,
-                enriched_address.estado,
-                endereco_id
-            )
-            conn.commit()
+            # Atualizar TB_ENDERECOS (chave recalculada; fundido se virou duplicado de outro endereço)
+            endereco_id = self._update_endereco_fields(endereco_id, enriched_address)
             
             # Criar tarefas de enriquecimento CEP e geolocalização
             self.create_cep_enrichment_task(empresa_id, endereco_id)
@@ -963,6 +1135,13 @@ class AccessRepository:
                 cursor.execute(query)
             return cursor.fetchall()
     
+    def get_table_columns(self, table: str) -> set:
+        """Nomes das colunas da tabela (maiúsculas)"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT * FROM {table} WHERE 1 = 0")
+            return {desc[0].upper() for desc in cursor.description}
+    
     def fetch_one(self, query: str, params: list = None) -> tuple:
         """Executa SELECT e retorna uma linha como tupla"""
         with self._get_connection() as conn:
@@ -0,0 +1,153 @@
+"""
+Fila de tarefas durável sobre as tabelas de controle (TB_CEP_ENRICHMENT, TB_GEOLOCALIZACAO)
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from ..config.config_manager import ConfigManager
+
+PENDING = 'PENDENTE'
+PROCESSING = 'PROCESSANDO'
+DONE = 'CONCLUIDO'
+DEAD_LETTER = 'DESCARTADO'
+LEGACY_ERROR = 'ERRO'  # Status antigo (antes da fila) - convertido pela migração
+# Colunas usadas pela fila (bancos anteriores a migrate_job_queue.py não têm as duas últimas)
+REQUIRED_COLUMNS = {'TENTATIVAS': 'LONG', 'PROXIMA_TENTATIVA': 'DATE', 'VISIVEL_ATE': 'DATE'}
+
+
+class JobQueue:
+    """Reserva com prazo de visibilidade, tentativas com backoff exponencial, dead letter e ack em lote
+
+    Tarefa reservada fica PROCESSANDO até VISIVEL_ATE; se o processo cair antes do ack/nack,
+    volta a ser elegível quando o prazo vence (entrega ao menos uma vez).
+    """
+
+    def __init__(self, repository, table: str, id_column: str, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.repository = repository
+        self.table = table
+        self.id_column = id_column
+        self.visibility_timeout = timedelta(minutes=config.job_queue_visibility_timeout_minutes)
+        self.max_attempts: int = config.job_queue_max_attempts
+        self.backoff_base_minutes: float = config.job_queue_backoff_base_minutes
+        self.backoff_max_minutes: float = config.job_queue_backoff_max_minutes
+        self.ack_batch_size: int = config.job_queue_ack_batch_size
+        self.claim_batch_size: int = config.job_queue_claim_batch_size
+        self._pending_acks: List[int] = []
+        self._lock = threading.Lock()
+        self._schema_lock = threading.Lock()
+        self._schema_checked = False
+
+    def ensure_schema(self) -> None:
+        """Verifica as colunas da fila uma vez por processo; ausentes são criadas (falha na criação interrompe)"""
+        if self._schema_checked:
+            return
+        with self._schema_lock:
+            if self._schema_checked:
+                return
+            columns = self.repository.get_table_columns(self.table)
+            for column, column_type in REQUIRED_COLUMNS.items():
+                if column in columns:
+                    continue
+                try:
+                    self.repository.execute_query(f"ALTER TABLE {self.table} ADD COLUMN {column} {column_type}")
+                    if column == 'TENTATIVAS':
+                        self.repository.execute_query(f"UPDATE {self.table} SET TENTATIVAS = 0")
+                except Exception as e:
+                    raise RuntimeError(f"{self.table} sem a coluna {column} e a criação automática falhou ({e}); "
+                                       f"execute scripts/database/migrate_job_queue.py") from e
+                print(f"[MIGRAÇÃO] ✅ {self.table}.{column} adicionada automaticamente "
+                      f"(status ERRO antigos: execute scripts/database/migrate_job_queue.py)")
+            self._schema_checked = True
+
+    def ready_condition(self, alias: str = '') -> Tuple[str, list]:
+        """Predicado SQL (e parâmetros) das tarefas elegíveis: pendentes no prazo ou com reserva vencida"""
+        now = datetime.now()
+        a = f"{alias}." if alias else ''
+        sql = (f"(({a}STATUS_PROCESSAMENTO = '{PENDING}' AND ({a}PROXIMA_TENTATIVA IS NULL OR {a}PROXIMA_TENTATIVA <= ?))"
+               f" OR ({a}STATUS_PROCESSAMENTO = '{PROCESSING}' AND {a}VISIVEL_ATE < ?))")
+        return sql, [now, now]
+
+    def recover_expired(self) -> int:
+        """Reservas vencidas que já esgotaram as tentativas vão para dead letter (tarefa que derruba o processo)"""
+        self.ensure_schema()
+        return self.repository.execute_query(f"""
+            UPDATE {self.table}
+            SET STATUS_PROCESSAMENTO = '{DEAD_LETTER}', DATA_PROCESSAMENTO = Date(), VISIVEL_ATE = NULL,
+                ERRO_DESCRICAO = 'Prazo de processamento expirado'
+            WHERE STATUS_PROCESSAMENTO = '{PROCESSING}' AND VISIVEL_ATE < ? AND TENTATIVAS >= ?
+        """, [datetime.now(), self.max_attempts])
+
+    def claim(self, job_ids: List[int]) -> List[int]:
+        """Reserva as tarefas (condicional: só as ainda elegíveis); a tentativa é contada na reserva"""
+        claimed = []
+        for job_id in job_ids:
+            condition, params = self.ready_condition()
+            updated = self.repository.execute_query(f"""
+                UPDATE {self.table}
+                SET STATUS_PROCESSAMENTO = '{PROCESSING}', VISIVEL_ATE = ?, TENTATIVAS = TENTATIVAS + 1
+                WHERE {self.id_column} = ? AND {condition}
+            """, [datetime.now() + self.visibility_timeout, job_id] + params)
+            if updated == 1:
+                claimed.append(job_id)
+        return claimed
+
+    def ack(self, job_id: int) -> None:
+        """Confirma conclusão (gravada em lote a cada ack_batch_size; flush() grava o restante)"""
+        with self._lock:
+            self._pending_acks.append(job_id)
+            if len(self._pending_acks) < self.ack_batch_size:
+                return
+            batch, self._pending_acks = self._pending_acks, []
+        self._write_acks(batch)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._pending_acks = self._pending_acks, []
+        if batch:
+            self._write_acks(batch)
+
+    def _write_acks(self, job_ids: List[int]) -> None:
+        placeholders = ', '.join('?' for _ in job_ids)
+        self.repository.execute_query(f"""
+            UPDATE {self.table}
+            SET STATUS_PROCESSAMENTO = '{DONE}', DATA_PROCESSAMENTO = Date(), VISIVEL_ATE = NULL
+            WHERE {self.id_column} IN ({placeholders})
+        """, list(job_ids))
+
+    def nack(self, job_id: int, erro_descricao: str, permanent: bool = False) -> str:
+        """Registra falha: reagenda com backoff exponencial ou envia para dead letter; retorna o novo status"""
+        row = self.repository.fetch_one(f"SELECT TENTATIVAS FROM {self.table} WHERE {self.id_column} = ?", [job_id])
+        attempts = max((row[0] or 0) if row else 0, 1)
+
+        if permanent or attempts >= self.max_attempts:
+            self.repository.execute_query(f"""
+                UPDATE {self.table}
+                SET STATUS_PROCESSAMENTO = '{DEAD_LETTER}', DATA_PROCESSAMENTO = Date(), VISIVEL_ATE = NULL,
+                    PROXIMA_TENTATIVA = NULL, ERRO_DESCRICAO = ?
+                WHERE {self.id_column} = ?
+            """, [erro_descricao[:255], job_id])
+            return DEAD_LETTER
+
+        self.repository.execute_query(f"""
+            UPDATE {self.table}
+            SET STATUS_PROCESSAMENTO = '{PENDING}', DATA_PROCESSAMENTO = Date(), VISIVEL_ATE = NULL,
+                PROXIMA_TENTATIVA = ?, ERRO_DESCRICAO = ?
+            WHERE {self.id_column} = ?
+        """, [self.next_attempt_at(attempts), erro_descricao[:255], job_id])
+        return PENDING
+
+    def next_attempt_at(self, attempts: int) -> datetime:
+        """Backoff exponencial: base * 2^(tentativas-1), limitado a backoff_max_minutes"""
+        minutes = min(self.backoff_base_minutes * (2 ** (attempts - 1)), self.backoff_max_minutes)
+        return datetime.now() + timedelta(minutes=minutes)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Tarefas por status (ERRO legado conta como dead letter)"""
+        stats = {PENDING: 0, PROCESSING: 0, DONE: 0, DEAD_LETTER: 0}
+        for status, total in self.repository.fetch_all(
+                f"SELECT STATUS_PROCESSAMENTO, COUNT(*) FROM {self.table} GROUP BY STATUS_PROCESSAMENTO"):
+            key = DEAD_LETTER if status == LEGACY_ERROR else status
+            stats[key] = stats.get(key, 0) + total
+        return stats
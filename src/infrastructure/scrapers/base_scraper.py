@@ -0,0 +1,312 @@
+"""
+Base dos scrapers - extração dos sites das empresas comum ao Google e ao DuckDuckGo
+"""
+import re
+import time
+from typing import Iterator, List, Optional
+
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+from src.infrastructure.config.config_manager import ConfigManager
+from src.infrastructure.config.delay_config import get_scraper_delays
+from .serp_harvester import SerpHarvester
+from ..drivers.dom_contact_extractor import DomContactExtractor
+from ..drivers.lean_fetch import LeanFetchProfile
+from ..drivers.page_readiness import PageReadinessDetector
+from ..drivers.tab_pool import TabPool
+from ..network.contact_page_crawler import ContactPageCrawler
+from ..network.pacing_scheduler import PacingScheduler
+from ..network.retry_manager import RetryManager
+from ..storage.host_latency_tracker import HostLatencyTracker
+from ..utils.domain_matcher import DomainNormalizer
+from ..utils.html_utils import trim_html
+from ..utils.simhash import SimHasher, SimHashIndex
+from ..utils.structured_data_extractor import StructuredDataExtractor
+from ...domain.models.company_model import CompanyModel
+from ...domain.models.page_readiness_model import PageReadinessModel
+from ...domain.models.serp_result_model import SerpResultModel
+from ...domain.services.email_domain_service import EmailValidationService
+
+MAX_TITLE_LENGTH = 50
+MAX_HTML_LENGTH = 100000  # 100KB (início + rodapé)
+
+
+class BaseScraper:
+    """Abas das empresas, extração de contatos e quase-duplicatas; subclasses implementam a SERP do motor
+
+    Subclasses expõem o driver atual em self.driver
+    """
+
+    def __init__(self, engine: str):
+        self.validation_service = EmailValidationService()
+        self.delays = get_scraper_delays(engine)  # Delays específicos do motor
+        self.config = ConfigManager()  # Para acessar configurações de retry
+        self.fingerprint_index: Optional[SimHashIndex] = None  # Definido pelo serviço de coleta
+        self.contact_crawler = ContactPageCrawler(self.config)
+        self.lean_fetch = LeanFetchProfile(self.config)  # Bloqueio de recursos nas abas de empresas
+        self.dom_extractor = DomContactExtractor(self.config)
+        self.readiness = PageReadinessDetector(self.config)
+        self.tab_pool_size: int = self.config.tab_pool_size
+        self.pacer = PacingScheduler(self.config)  # Pausas de ritmo humano aproveitadas com tarefas pendentes
+        self.latency_tracker: Optional[HostLatencyTracker] = None  # Definido pelo serviço de coleta
+        self.serp_harvester = SerpHarvester(engine)
+        self.last_serp_results: List[SerpResultModel] = []  # Resultados da última coleta na SERP
+
+    @RetryManager.with_retry(max_attempts=2, base_delay=1.0, exceptions=(WebDriverException, TimeoutException))
+    def extract_company_data(self, url: str, max_emails: int) -> CompanyModel:
+        """Extrai dados da empresa usando sistema de abas"""
+        try:
+            print(f"    [INFO] Carregando site: {url}")
+
+            # Abre site em nova aba (mantém aba de pesquisa aberta)
+            readiness = self._open_and_wait(self.driver, url)
+            print(f"    [DEBUG] Página pronta: {readiness.reason} em {readiness.elapsed_ms}ms")
+            return self._extract_loaded_tab(url, max_emails, readiness)
+
+        except Exception as e:
+            print(f"    [ERRO] {str(e)[:50]}...")
+            return self._empty_company(url)
+        finally:
+            # Fecha aba atual e volta para aba de pesquisa
+            try:
+                if len(self.driver.window_handles) > 1:
+                    self.driver.close()
+                    self.driver.switch_to.window(self.driver.window_handles[0])
+                    print(f"    [INFO] Voltou para aba de pesquisa")
+            except Exception as e:
+                print(f"[DEBUG] Erro ao fechar aba: {str(e)[:30]}")
+
+    def extract_companies(self, urls: List[str], max_emails: int) -> Iterator[CompanyModel]:
+        """Extrai vários sites: pool de abas carregando em paralelo (sequencial se tamanho 1)"""
+        if self.tab_pool_size <= 1 or len(urls) <= 1:
+            for url in urls:
+                yield self.extract_company_data(url, max_emails)
+            return
+
+        pool = TabPool(self.driver, self.lean_fetch, self.readiness, self.tab_pool_size, self.latency_tracker)
+        yield from pool.run(urls, lambda url, readiness: self._extract_pooled_tab(url, max_emails, readiness),
+                            lambda url: self.extract_company_data(url, max_emails))
+
+    def _extract_pooled_tab(self, url: str, max_emails: int, readiness: PageReadinessModel) -> CompanyModel:
+        """Extração de uma aba do pool (erros não interrompem as demais abas)"""
+        print(f"    [INFO] Site pronto: {url} ({readiness.reason} em {readiness.elapsed_ms}ms)")
+        try:
+            return self._extract_loaded_tab(url, max_emails, readiness)
+        except Exception as e:
+            print(f"    [ERRO] {str(e)[:50]}...")
+            return self._empty_company(url)
+
+    def _empty_company(self, url: str) -> CompanyModel:
+        """Empresa sem dados (falha na extração)"""
+        return CompanyModel(name="", emails="", domain=self.validation_service.extract_domain_from_url(url),
+                            url=url, address="", phone="", html_content="")
+
+    def _extract_loaded_tab(self, url: str, max_emails: int, readiness: PageReadinessModel) -> CompanyModel:
+        """Extrai dados da aba atual (página já pronta segundo o detector)"""
+        driver = self.driver
+        if readiness.reason != 'complete':
+            self.readiness.stop_loading(driver)
+
+        # URL final (após redirecionamentos) para canonicalização do domínio
+        final_url = self._get_current_url()
+
+        # Conteúdo quase idêntico a site já extraído: reaproveita contatos sem scroll/extração
+        fingerprint = self._page_fingerprint()
+        duplicate = self._near_duplicate_company(url, final_url, fingerprint)
+        if duplicate:
+            return duplicate
+
+        print(f"    [DEBUG] Fazendo scroll...")
+        # Scroll único até o rodapé + espera apenas enquanto conteúdo lazy estiver sendo inserido
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.readiness.wait_for_settle(driver)
+
+        print(f"    [DEBUG] Capturando dados do DOM...")
+        # Extrator no navegador: payload compacto em vez do page_source inteiro
+        payload = self.dom_extractor.extract(driver)
+        if payload:
+            page_source = DomContactExtractor.to_contact_document(payload)
+            contact_source = page_source
+            html_content = payload.html_window  # Janela de HTML bruto para arquivamento
+            print(f"    [DEBUG] Payload DOM: {payload.payload_size} chars (HTML completo: {payload.html_length})")
+        else:
+            # Fallback: HTML completo (limitado para performance)
+            page_source = driver.page_source
+            html_content = trim_html(page_source, MAX_HTML_LENGTH)
+            contact_source = html_content
+            print(f"    [DEBUG] HTML capturado: {len(html_content)} chars")
+
+        # Caminho rápido: JSON-LD, microdata, mailto: e tel: (valores exatos publicados pelo site)
+        structured = StructuredDataExtractor.extract(page_source)
+        endereco_formatado = structured.address if structured.has_address() else None
+        email_list = structured.emails[:max_emails]
+        phone_list = structured.phones[:2]
+
+        if structured.is_sufficient():
+            print(f"    [DEBUG] Dados estruturados completos ({', '.join(sorted(structured.sources))})")
+        else:
+            if not endereco_formatado:
+                print(f"    [DEBUG] Extraindo endereço...")
+                try:
+                    from src.infrastructure.utils.address_extractor import AddressExtractor
+                    endereco_formatado = AddressExtractor.extract_from_html(contact_source)
+                    print(f"    [DEBUG] Endereço: {endereco_formatado.to_full_address()[:50] if endereco_formatado else 'Não encontrado'}")
+                except Exception as e:
+                    print(f"    [DEBUG] Erro na extração de endereço: {str(e)[:30]}")
+                    endereco_formatado = None
+
+            print(f"    [DEBUG] Extraindo emails...")
+            # Extrações otimizadas (complementam os dados estruturados)
+            email_list = (email_list + [e for e in self._extract_emails_fast(contact_source)
+                                        if e not in email_list])[:max_emails]
+            print(f"    [DEBUG] Emails: {len(email_list)} encontrados")
+
+            print(f"    [DEBUG] Extraindo telefones...")
+            phone_list = (phone_list + [p for p in self._extract_phones_fast(contact_source)
+                                        if p not in phone_list])[:2]
+            print(f"    [DEBUG] Telefones: {len(phone_list)} encontrados")
+
+            # Crawl raso nas páginas de contato se faltar e-mail, telefone ou CEP
+            crawl = self.contact_crawler.crawl(
+                final_url or url, page_source, email_list, phone_list,
+                bool(endereco_formatado and endereco_formatado.cep),
+                self._extract_emails_fast, self._extract_phones_fast
+            )
+            if crawl.pages_fetched:
+                email_list = (email_list + crawl.emails)[:max_emails]
+                phone_list = (phone_list + crawl.phones)[:2]
+                if crawl.address and not (endereco_formatado and endereco_formatado.is_valid()):
+                    endereco_formatado = crawl.address
+                print(f"    [DEBUG] Páginas de contato: {crawl.pages_fetched} "
+                      f"({crawl.bytes_fetched // 1024}KB, {crawl.elapsed_seconds:.1f}s)")
+
+        emails_string = self.validation_service.validate_and_join_emails(email_list)
+        phones_string = self.validation_service.validate_and_join_phones(phone_list)
+
+        print(f"    [DEBUG] Extraindo nome da empresa...")
+        name = self._get_company_name_fast(url)
+        domain = self.validation_service.extract_domain_from_url(url)
+        print(f"    [DEBUG] Nome: {name[:30]}... | Domain: {domain}")
+
+        return CompanyModel(
+            name=name,
+            emails=emails_string,
+            domain=domain,
+            url=url,
+            address=endereco_formatado or "",
+            phone=phones_string,
+            html_content=html_content,
+            final_url=final_url,
+            fingerprint=fingerprint
+        )
+
+    def _open_and_wait(self, driver, url: str) -> PageReadinessModel:
+        """Abre o site com timeout do host (histórico de latência) e aguarda página pronta"""
+        host = DomainNormalizer.extract_host(url)
+        page_timeout = self.latency_tracker.timeout_for(host) if self.latency_tracker else self.readiness.max_wait
+        start = time.perf_counter()
+        self.lean_fetch.open_tab(driver, url, page_load_timeout=page_timeout)
+
+        # Pronto quando o DOM estabiliza ou contatos aparecem (dentro do que restou do timeout)
+        remaining = max(0.2, page_timeout - (time.perf_counter() - start))
+        readiness = self.readiness.wait_until_ready(driver, max_wait=remaining)
+        if self.latency_tracker:
+            self.latency_tracker.record(host, int((time.perf_counter() - start) * 1000), readiness.timed_out)
+        return readiness
+
+    def _get_current_url(self) -> str:
+        """URL atual da aba (vazia se indisponível)"""
+        try:
+            return self.driver.current_url or ""
+        except Exception:
+            return ""
+
+    def _page_fingerprint(self) -> Optional[int]:
+        """SimHash do texto visível da aba atual"""
+        try:
+            text = self.driver.execute_script(
+                "return document.body ? document.body.innerText.slice(0, 100000) : '';")
+            return SimHasher.fingerprint(text or "")
+        except Exception:
+            return None
+
+    def _near_duplicate_company(self, url: str, final_url: str,
+                                fingerprint: Optional[int]) -> Optional[CompanyModel]:
+        """Monta empresa com contatos do site quase idêntico (None se não houver)"""
+        if self.fingerprint_index is None:
+            return None
+
+        domain = self.validation_service.extract_domain_from_url(url)
+        match = self.fingerprint_index.find_near_duplicate(fingerprint, exclude_domain=domain)
+        if not match:
+            return None
+
+        entry, distance = match
+        print(f"    [INFO] Conteúdo quase idêntico a {entry.domain} (distância {distance}) - reaproveitando contatos")
+        return CompanyModel(
+            name=self._get_company_name_fast(url) or entry.name,
+            emails=entry.emails,
+            domain=domain,
+            url=url,
+            phone=entry.phones,
+            address=entry.address or "",
+            final_url=final_url,
+            fingerprint=fingerprint,
+            duplicate_of=entry.domain
+        )
+
+    def _extract_emails_fast(self, html_content: str) -> List[str]:
+        """Extração ultra-rápida de e-mails"""
+        emails = set()
+
+        try:
+            # Regex otimizada
+            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+            found_emails = re.findall(email_pattern, html_content)
+
+            for email in found_emails:
+                email_lower = email.lower()
+                if (len(email_lower) > 5 and
+                        '.' in email_lower.split('@')[1] and
+                        not any(bad in email_lower for bad in ['sentry.io', 'example.com'])):
+                    emails.add(email_lower)
+                    if len(emails) >= 3:
+                        break
+
+        except Exception:
+            pass
+
+        return list(emails)
+
+    def _extract_phones_fast(self, html_content: str) -> List[str]:
+        """Extração ultra-rápida de telefones"""
+        phones = set()
+
+        try:
+            # Padrão otimizado para telefones brasileiros
+            phone_pattern = r'(?:\([1-9][1-9]\)\s?|[1-9][1-9]\s)[9][0-9]{4}[-\s]?[0-9]{4}|(?:\([1-9][1-9]\)\s?|[1-9][1-9]\s)[2-5][0-9]{3}[-\s]?[0-9]{4}'
+            found_phones = re.findall(phone_pattern, html_content)
+
+            for phone in found_phones:
+                clean_phone = re.sub(r'[^\d]', '', phone)
+                if len(clean_phone) in [10, 11] and clean_phone[:2] in ['11', '12', '13', '14', '15', '16', '17', '18',
+                                                                        '19', '21']:
+                    phones.add(phone)
+                    if len(phones) >= 2:
+                        break
+
+        except Exception:
+            pass
+
+        return list(phones)
+
+    def _get_company_name_fast(self, url: str) -> str:
+        """Extração rápida do nome da empresa"""
+        try:
+            title = self.driver.title or ""
+            if title.strip():
+                return title.strip()[:MAX_TITLE_LENGTH]
+        except Exception as e:
+            print(f"[DEBUG] Erro ao obter nome da empresa: {str(e)[:30]}")
+
+        return self.validation_service.extract_domain_from_url(url)
@@ -0,0 +1,174 @@
+"""
+Busca federada - Google e DuckDuckGo em navegadores separados, resultados mesclados por domínio
+"""
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from .serp_health import SerpHealthDetector
+from ...domain.models.company_model import CompanyModel
+from ...domain.models.engine_overlap_model import EngineOverlapModel
+from ...domain.models.serp_health_model import SerpHealthModel
+
+DEFAULT_OVERLAP_REPORT = "data/reports/engine_overlap.csv"
+ENGINE_ORDER = ("GOOGLE", "DUCKDUCKGO")
+
+
+class FederatedSearch:
+    """Executa a mesma busca nos dois motores em paralelo; extração usa o navegador principal"""
+
+    def __init__(self, scrapers: Dict[str, object], canonical_key: Callable[[str], str],
+                 primary: str = "GOOGLE", report_path: str = DEFAULT_OVERLAP_REPORT):
+        self.scrapers = scrapers  # Cada scraper com o próprio driver
+        self.primary = scrapers[primary]  # Abre as páginas das empresas
+        self.canonical_key = canonical_key
+        self.report_path = Path(report_path)
+        self.active_engines: List[str] = list(scrapers)
+        self.last_health = SerpHealthModel(status='unknown')
+        self._sources: Dict[str, Set[str]] = {}  # domínio -> motores que o retornaram
+        self._term_domains: Dict[str, Set[str]] = {engine: set() for engine in scrapers}
+        self.totals = EngineOverlapModel(term="TOTAL")
+        self._executor = ThreadPoolExecutor(max_workers=len(scrapers), thread_name_prefix="federated")
+
+    # ===== Interface do ScraperProtocol =====
+
+    def search(self, query: str) -> bool:
+        """Busca em paralelo; motores bloqueados ficam fora do termo atual"""
+        self._term_domains = {engine: set() for engine in self.scrapers}
+        results = self._run_all(list(self.scrapers), lambda scraper: scraper.search(query))
+
+        healths = {engine: SerpHealthDetector.check(self._driver_of(self.scrapers[engine]), engine)
+                   for engine in self.scrapers}
+        self.active_engines = [engine for engine in ENGINE_ORDER
+                               if engine in self.scrapers and results.get(engine) and not healths[engine].blocked]
+        for engine, health in healths.items():
+            if health.blocked:
+                print(f"    [AVISO] {engine} bloqueado na busca federada: {health.status}")
+
+        # Saúde combinada: ok se algum motor respondeu; senão o diagnóstico do primeiro motor
+        ok = [healths[engine] for engine in self.active_engines if healths[engine].status == 'ok']
+        self.last_health = ok[0] if ok else healths[next(iter(self.scrapers))]
+        return bool(self.active_engines)
+
+    def get_result_links(self, blacklist: List[str]) -> List[str]:
+        """Links dos motores intercalados por posição, sem repetir domínio canônico"""
+        per_engine = self._run_all(self.active_engines, lambda scraper: scraper.get_result_links(blacklist))
+        merged: List[str] = []
+        seen: Set[str] = set()
+        longest = max((len(links or []) for links in per_engine.values()), default=0)
+        for position in range(longest):
+            for engine in self.active_engines:
+                links = per_engine.get(engine) or []
+                if position >= len(links):
+                    continue
+                link = links[position]
+                domain = self.canonical_key(link)
+                if not domain:
+                    continue
+                self._sources.setdefault(domain, set()).add(engine)
+                self._term_domains[engine].add(domain)
+                if domain not in seen:
+                    seen.add(domain)
+                    merged.append(link)
+        return merged
+
+    def go_to_next_page(self) -> bool:
+        results = self._run_all(self.active_engines, lambda scraper: scraper.go_to_next_page())
+        self.active_engines = [engine for engine in self.active_engines if results.get(engine)]
+        return bool(self.active_engines)
+
+    def extract_company_data(self, url: str, max_emails: int) -> CompanyModel:
+        return self.primary.extract_company_data(url, max_emails)
+
+    def extract_companies(self, urls: List[str], max_emails: int) -> Iterator[CompanyModel]:
+        return self.primary.extract_companies(urls, max_emails)
+
+    # ===== Serviços compartilhados com os scrapers =====
+
+    @property
+    def pacer(self):
+        return self.primary.pacer
+
+    @property
+    def fingerprint_index(self):
+        return self.primary.fingerprint_index
+
+    @fingerprint_index.setter
+    def fingerprint_index(self, index) -> None:
+        for scraper in self.scrapers.values():
+            scraper.fingerprint_index = index
+
+    @property
+    def latency_tracker(self):
+        return self.primary.latency_tracker
+
+    @latency_tracker.setter
+    def latency_tracker(self, tracker) -> None:
+        for scraper in self.scrapers.values():
+            scraper.latency_tracker = tracker
+
+    # ===== Origem e sobreposição =====
+
+    def source_engine(self, url: str) -> str:
+        """Motor(es) que retornaram o domínio (ex: GOOGLE+DUCKDUCKGO)"""
+        engines = self._sources.get(self.canonical_key(url), set())
+        return "+".join(engine for engine in ENGINE_ORDER if engine in engines) or "FEDERADO"
+
+    def finish_term(self, term: str) -> EngineOverlapModel:
+        """Sobreposição do termo (acumula no total e grava linha no relatório CSV)"""
+        google = self._term_domains.get("GOOGLE", set())
+        duckduckgo = self._term_domains.get("DUCKDUCKGO", set())
+        overlap = EngineOverlapModel(term=term, google=len(google), duckduckgo=len(duckduckgo),
+                                     both=len(google & duckduckgo))
+        self.totals.google += overlap.google
+        self.totals.duckduckgo += overlap.duckduckgo
+        self.totals.both += overlap.both
+        self._append_report(overlap)
+        return overlap
+
+    def _append_report(self, overlap: EngineOverlapModel) -> None:
+        try:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            new_file = not self.report_path.exists()
+            with open(self.report_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, delimiter=';')
+                if new_file:
+                    writer.writerow(['data', 'termo', 'google', 'duckduckgo', 'ambos',
+                                     'so_google', 'so_duckduckgo', 'sobreposicao_pct'])
+                writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), overlap.term, overlap.google,
+                                 overlap.duckduckgo, overlap.both, overlap.google_only,
+                                 overlap.duckduckgo_only, overlap.overlap_pct])
+        except OSError as e:
+            print(f"[AVISO] Erro ao gravar relatório de sobreposição: {e}")
+
+    # ===== Internos =====
+
+    def sync_driver(self, driver) -> None:
+        """GoogleScraper guarda referência direta ao driver principal"""
+        google = self.scrapers.get("GOOGLE")
+        if google is not None:
+            google.driver = driver
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _run_all(self, engines: List[str], action: Callable) -> Dict[str, object]:
+        """Executa a ação em cada motor ao mesmo tempo (drivers independentes)"""
+        futures = {engine: self._executor.submit(action, self.scrapers[engine]) for engine in engines}
+        results = {}
+        for engine, future in futures.items():
+            try:
+                results[engine] = future.result()
+            except Exception as e:
+                print(f"    [AVISO] {engine}: {str(e)[:50]}")
+                results[engine] = None
+        return results
+
+    @staticmethod
+    def _driver_of(scraper) -> Optional[object]:
+        driver = getattr(scraper, 'driver', None)
+        if driver is None and getattr(scraper, 'driver_manager', None) is not None:
+            driver = scraper.driver_manager.driver
+        return driver
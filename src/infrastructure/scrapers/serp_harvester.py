@@ -0,0 +1,76 @@
+"""
+Coleta de links da SERP em uma única chamada ao navegador
+"""
+from typing import Dict, List
+
+from selenium.common.exceptions import WebDriverException
+
+from ...domain.models.serp_result_model import SerpResultModel
+from ...domain.models.serp_selector_model import SerpSelectorModel
+
+# Registro de seletores por motor (em ordem de preferência; o primeiro layout com resultados é usado)
+SERP_SELECTORS: Dict[str, List[SerpSelectorModel]] = {
+    "GOOGLE": [
+        SerpSelectorModel(container="div.g", link="a[href]", title="h3", exclude_href="google.com"),
+        SerpSelectorModel(container="div.tF2Cxc", link="a[href]", title="h3", exclude_href="google.com"),
+        SerpSelectorModel(container="h3", link="", title="h3", exclude_href="google.com"),
+    ],
+    "DUCKDUCKGO": [
+        SerpSelectorModel(container="[data-testid='result']", link="a[data-testid='result-title-a']"),
+        SerpSelectorModel(container="article", link="h2 a[href]"),
+    ],
+}
+
+# arguments[0] = lista de layouts [{container, link, title, exclude_href}]
+HARVEST_SCRIPT = r"""
+const layouts = arguments[0];
+const visible = (el) => !!(el && el.getClientRects().length);
+for (const layout of layouts) {
+    const results = [];
+    const seen = new Set();
+    for (const container of document.querySelectorAll(layout.container)) {
+        if (!visible(container)) continue;
+        // Sem seletor de link: âncora que envolve o container (ex: <a><h3>) ou a primeira interna
+        const link = layout.link ? container.querySelector(layout.link)
+            : (container.closest('a[href]') || container.querySelector('a[href]'));
+        if (!link || !visible(link)) continue;
+        const href = link.href || '';
+        if (!href.startsWith('http') || seen.has(href)) continue;
+        if (layout.exclude_href && href.includes(layout.exclude_href)) continue;
+        seen.add(href);
+        const titleEl = layout.title ? (container.matches(layout.title) ? container : container.querySelector(layout.title)) : link;
+        results.push({url: href, title: ((titleEl || link).innerText || '').trim().slice(0, 200), rank: results.length + 1});
+    }
+    if (results.length) return results;
+}
+return [];
+"""
+
+
+class SerpHarvester:
+    """Retorna URLs, títulos e posições dos resultados com um único execute_script"""
+
+    def __init__(self, engine: str):
+        self.engine = engine
+        self.layouts = [vars(selector) for selector in SERP_SELECTORS.get(engine, [])]
+
+    def harvest(self, driver) -> List[SerpResultModel]:
+        """Resultados visíveis da página atual (lista vazia em caso de falha)"""
+        if not self.layouts:
+            return []
+        try:
+            data = driver.execute_script(HARVEST_SCRIPT, self.layouts) or []
+        except WebDriverException:
+            return []
+        return [SerpResultModel(url=item.get('url', ''), title=item.get('title', ''), rank=item.get('rank', 0))
+                for item in data if isinstance(item, dict) and item.get('url')]
+
+    def count_results(self, driver) -> int:
+        """Quantidade de containers de resultado do layout principal"""
+        if not self.layouts:
+            return 0
+        try:
+            return driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", self.layouts[0]['container']) or 0
+        except WebDriverException:
+            return 0
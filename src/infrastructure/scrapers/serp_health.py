@@ -0,0 +1,58 @@
+"""
+Detecção de bloqueio na SERP (CAPTCHA, HTTP 429, página sem resultados)
+"""
+from selenium.common.exceptions import WebDriverException
+
+from .serp_harvester import SERP_SELECTORS
+from ...domain.models.serp_health_model import SerpHealthModel
+
+# Marcadores de interstícios de bloqueio (URL ou texto visível, em minúsculas)
+BLOCK_URL_MARKERS = ('/sorry/', 'google.com/sorry', 'recaptcha', '/challenge', 'anomaly')
+BLOCK_TEXT_MARKERS = (
+    'unusual traffic', 'tráfego incomum', 'not a robot', 'não sou um robô', 'não é um robô',
+    'captcha', 'bots use duckduckgo too', 'select all squares', 'selecione todas as imagens',
+    'too many requests', 'our systems have detected',
+)
+
+# arguments[0] = seletor de container de resultados do motor
+SERP_HEALTH_SCRIPT = r"""
+const nav = performance.getEntriesByType('navigation')[0];
+const body = document.body;
+return {
+    url: location.href,
+    title: document.title || '',
+    http_status: nav && nav.responseStatus ? nav.responseStatus : 0,
+    text: body ? (body.innerText || '').slice(0, 4000).toLowerCase() : '',
+    results: arguments[0] ? document.querySelectorAll(arguments[0]).length : 0,
+    captcha_frame: !!document.querySelector('iframe[src*="recaptcha"], iframe[src*="hcaptcha"], #captcha-form, form#challenge-form')
+};
+"""
+
+
+class SerpHealthDetector:
+    """Classifica a página atual do motor após a busca"""
+
+    @staticmethod
+    def check(driver, engine: str) -> SerpHealthModel:
+        layouts = SERP_SELECTORS.get(engine, [])
+        selector = ", ".join(layout.container for layout in layouts[:2])
+        try:
+            data = driver.execute_script(SERP_HEALTH_SCRIPT, selector) or {}
+        except WebDriverException as e:
+            return SerpHealthModel(status='unknown', detail=str(e)[:50])
+
+        url = str(data.get('url', '')).lower()
+        text = f"{data.get('title', '')} {data.get('text', '')}".lower()
+        http_status = int(data.get('http_status') or 0)
+        results = int(data.get('results') or 0)
+
+        if http_status == 429:
+            return SerpHealthModel(status='rate_limited', detail='HTTP 429', results=results, http_status=http_status)
+        if data.get('captcha_frame') or any(marker in url for marker in BLOCK_URL_MARKERS):
+            return SerpHealthModel(status='captcha', detail=url[:80], results=results, http_status=http_status)
+        marker = next((m for m in BLOCK_TEXT_MARKERS if m in text), None)
+        if marker and results == 0:
+            return SerpHealthModel(status='captcha', detail=marker, results=results, http_status=http_status)
+        if results == 0:
+            return SerpHealthModel(status='empty', detail='sem resultados', http_status=http_status)
+        return SerpHealthModel(status='ok', results=results, http_status=http_status)
@@ -0,0 +1,89 @@
+"""
+Checkpoint da coleta - retomada no termo, página e link exatos após interrupção
+"""
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+from .json_file_store import JsonFileStore
+from ...domain.models.collection_checkpoint_model import CollectionCheckpointModel
+
+DEFAULT_CHECKPOINT = "data/cache/collection_checkpoint.json"
+DEFAULT_DEFERRED = "data/cache/deferred_sites.json"
+
+
+class CollectionCheckpoint:
+    """Termo em andamento gravado a cada página/link (arquivo pequeno, escrita atômica)
+
+    Sites adiados (hosts lentos) ficam em arquivo próprio: sobrevivem ao fim do termo até serem visitados
+    """
+
+    def __init__(self, cache_path: str = DEFAULT_CHECKPOINT, deferred_path: str = DEFAULT_DEFERRED):
+        self.store = JsonFileStore(cache_path, "checkpoint da coleta")
+        self.deferred_store = JsonFileStore(deferred_path, "sites adiados")
+        self.current: Optional[CollectionCheckpointModel] = None
+        self._lock = threading.Lock()
+        self.resumed: Optional[CollectionCheckpointModel] = self._load()
+        self.deferred: List[Dict] = self.deferred_store.load(
+            lambda data: [site for site in data if isinstance(site, dict) and site.get('link')], default=[])
+
+    def _load(self) -> Optional[CollectionCheckpointModel]:
+        """Checkpoint deixado pela execução anterior (None se terminou normalmente)"""
+        return self.store.load(lambda data: CollectionCheckpointModel(**data))
+
+    def resume_point(self, termo_id: int) -> Optional[CollectionCheckpointModel]:
+        """Posição salva do termo (consumida uma única vez)"""
+        if self.resumed and self.resumed.termo_id == termo_id:
+            resumed, self.resumed = self.resumed, None
+            return resumed
+        return None
+
+    def start_term(self, termo_id: int, term: str, engine: str) -> None:
+        with self._lock:
+            self.current = CollectionCheckpointModel(termo_id=termo_id, term=term, engine=engine)
+
+    def start_page(self, page: int, links: List[str], done: Optional[List[str]] = None) -> None:
+        """Página colhida: grava links antes de qualquer visita"""
+        with self._lock:
+            if not self.current:
+                return
+            self.current.page = page
+            self.current.links = list(links)
+            self.current.done = list(done or [])
+        self.save()
+
+    def mark_done(self, links: List[str]) -> None:
+        """Links tratados na página atual (empresa salva, duplicada ou descartada)"""
+        with self._lock:
+            if not self.current or not links:
+                return
+            self.current.done.extend(link for link in links if link not in self.current.done)
+        self.save()
+
+    def finish_term(self) -> None:
+        """Termo concluído: remove o checkpoint"""
+        with self._lock:
+            self.current = None
+            self.store.delete()
+
+    def add_deferred(self, site: Dict) -> None:
+        """Site adiado gravado antes do termo terminar (link, domain, term, termo_id)"""
+        with self._lock:
+            if any(d['link'] == site['link'] for d in self.deferred):
+                return
+            self.deferred.append(site)
+            self.deferred_store.save(self.deferred, indent=None, sort_keys=False)
+
+    def clear_deferred(self) -> None:
+        """Sites adiados processados: remove o arquivo"""
+        with self._lock:
+            self.deferred = []
+            self.deferred_store.delete()
+
+    def save(self) -> None:
+        with self._lock:
+            if not self.current:
+                return
+            self.current.saved_at = time.time()
+            self.store.save(asdict(self.current), indent=None, sort_keys=False)
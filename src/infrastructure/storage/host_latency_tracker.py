@@ -0,0 +1,92 @@
+"""
+Histórico de latência por host - timeouts adaptativos e fila de sites lentos
+"""
+import threading
+from dataclasses import asdict
+from typing import Dict, Optional
+
+from .json_file_store import JsonFileStore
+from ..config.config_manager import ConfigManager
+from ...domain.models.host_latency_model import HostLatencyModel
+
+DEFAULT_LATENCY_CACHE = "data/cache/host_latency.json"
+
+
+class HostLatencyTracker:
+    """EWMA de carregamento + contagem de timeouts por host, persistidos em JSON entre execuções"""
+
+    def __init__(self, cache_path: str = DEFAULT_LATENCY_CACHE, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.store = JsonFileStore(cache_path, "histórico de latência")
+        self.alpha: float = config.latency_ewma_alpha
+        self.multiplier: float = config.latency_timeout_multiplier
+        self.min_timeout: float = config.latency_min_timeout
+        self.max_timeout: float = config.latency_max_timeout
+        self.default_timeout: float = config.page_ready_max_wait
+        self.defer_after: int = config.latency_defer_after_failures
+        self._hosts: Dict[str, HostLatencyModel] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Totais da execução atual (relatório de tempo perdido)
+        self.run_timeouts = 0
+        self.run_lost_ms = 0
+        self._load()
+
+    def _load(self) -> None:
+        self._hosts = self.store.load(lambda data: {str(host): HostLatencyModel(**values)
+                                                    for host, values in data.items() if isinstance(values, dict)}, {})
+
+    def timeout_for(self, host: str) -> float:
+        """Timeout do host: EWMA x multiplicador, limitado a [min, max]; sem histórico usa o padrão"""
+        entry = self._hosts.get(host)
+        if not entry or not entry.samples:
+            return self.default_timeout
+        if entry.failures:
+            return self.max_timeout  # Último carregamento estourou: usa o limite máximo
+        timeout = entry.ewma_ms / 1000 * self.multiplier
+        return round(min(self.max_timeout, max(self.min_timeout, timeout)), 2)
+
+    def record(self, host: str, elapsed_ms: int, timed_out: bool) -> None:
+        """Registra carregamento (timeouts entram na média com o tempo gasto até o limite)"""
+        if not host:
+            return
+        with self._lock:
+            entry = self._hosts.setdefault(host, HostLatencyModel())
+            entry.ewma_ms = (float(elapsed_ms) if not entry.samples
+                             else self.alpha * elapsed_ms + (1 - self.alpha) * entry.ewma_ms)
+            entry.samples += 1
+            if timed_out:
+                entry.failures += 1
+                entry.timeouts_total += 1
+                entry.lost_ms += int(elapsed_ms)
+                self.run_timeouts += 1
+                self.run_lost_ms += int(elapsed_ms)
+            else:
+                entry.failures = 0
+            self._dirty = True
+
+    def should_defer(self, host: str) -> bool:
+        """Host com timeouts consecutivos: processar depois, fora do fluxo principal"""
+        entry = self._hosts.get(host)
+        return bool(entry and entry.failures >= self.defer_after)
+
+    def report(self, top: int = 5) -> Dict:
+        """Timeouts e tempo perdido (execução atual e histórico) + hosts mais lentos"""
+        with self._lock:
+            slowest = sorted(self._hosts.items(), key=lambda item: item[1].lost_ms, reverse=True)[:top]
+            return {
+                'hosts': len(self._hosts),
+                'run_timeouts': self.run_timeouts,
+                'run_seconds_lost': round(self.run_lost_ms / 1000, 1),
+                'total_seconds_lost': round(sum(e.lost_ms for e in self._hosts.values()) / 1000, 1),
+                'slowest_hosts': ", ".join(f"{host} ({entry.lost_ms / 1000:.0f}s)"
+                                           for host, entry in slowest if entry.lost_ms)
+            }
+
+    def save(self) -> None:
+        with self._lock:
+            if self._dirty and self.store.save({host: asdict(entry) for host, entry in self._hosts.items()}):
+                self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._hosts)
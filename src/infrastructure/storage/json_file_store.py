@@ -0,0 +1,47 @@
+"""
+Arquivo JSON de cache/histórico - leitura tolerante a arquivo corrompido e escrita atômica
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+class JsonFileStore:
+    """Um arquivo JSON em data/cache; label identifica o arquivo nas mensagens de aviso"""
+
+    def __init__(self, path: str, label: str):
+        self.path = Path(path)
+        self.label = label
+
+    def load(self, parse: Optional[Callable[[Any], Any]] = None, default: Any = None) -> Any:
+        """Conteúdo convertido por parse (default se o arquivo não existe ou é inválido)"""
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return parse(data) if parse else data
+        except Exception as e:
+            print(f"[AVISO] {self.label[:1].upper()}{self.label[1:]} ignorado: {e}")
+        return default
+
+    def save(self, data: Any, indent: Optional[int] = 2, sort_keys: bool = True) -> bool:
+        """Grava via arquivo temporário + os.replace (leitor nunca vê arquivo pela metade)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=indent, sort_keys=sort_keys)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"[AVISO] Erro ao salvar {self.label}: {e}")
+            return False
+
+    def delete(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[AVISO] Erro ao remover {self.label}: {e}")
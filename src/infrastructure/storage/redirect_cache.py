@@ -0,0 +1,58 @@
+"""
+Cache de redirecionamentos (domínio de origem -> domínio canônico)
+"""
+import threading
+from typing import Dict, Optional
+
+from .json_file_store import JsonFileStore
+
+DEFAULT_REDIRECT_CACHE = "data/cache/redirects.json"
+MAX_REDIRECT_HOPS = 10
+
+
+class RedirectCache:
+    """Persiste redirecionamentos observados em JSON (data/cache/redirects.json)"""
+
+    def __init__(self, cache_path: str = DEFAULT_REDIRECT_CACHE):
+        self.store = JsonFileStore(cache_path, "cache de redirecionamentos")
+        self._redirects: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        self._redirects = self.store.load(lambda data: {str(k): str(v) for k, v in data.items()}, {})
+
+    def resolve(self, domain: str) -> str:
+        """Segue cadeia de redirecionamentos até o domínio canônico"""
+        current = domain
+        for _ in range(MAX_REDIRECT_HOPS):
+            target = self._redirects.get(current)
+            if not target or target == current or target == domain:
+                break
+            current = target
+        return current
+
+    def get(self, domain: str) -> Optional[str]:
+        """Destino direto registrado para o domínio (sem seguir cadeia)"""
+        return self._redirects.get(domain)
+
+    def record(self, source_domain: str, canonical_domain: str) -> bool:
+        """Registra redirecionamento; retorna True se for novo ou alterado"""
+        if not source_domain or not canonical_domain or source_domain == canonical_domain:
+            return False
+
+        with self._lock:
+            if self._redirects.get(source_domain) == canonical_domain:
+                return False
+            self._redirects[source_domain] = canonical_domain
+            self._dirty = True
+        return True
+
+    def save(self) -> None:
+        with self._lock:
+            if self._dirty and self.store.save(self._redirects):
+                self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._redirects)
@@ -0,0 +1,95 @@
+"""
+Cache de páginas de resultados - reexecuções reaproveitam links sem abrir o motor de busca
+"""
+import threading
+import time
+import unicodedata
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional
+
+from .json_file_store import JsonFileStore
+from ..config.config_manager import ConfigManager
+from ...domain.models.serp_cache_entry_model import SerpCacheEntryModel
+
+DEFAULT_SERP_CACHE = "data/cache/serp_cache.json"
+
+
+class SerpCache:
+    """Links por (motor, termo normalizado, página) com validade (TTL), persistidos em JSON"""
+
+    def __init__(self, cache_path: str = DEFAULT_SERP_CACHE, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.store = JsonFileStore(cache_path, "cache de resultados")
+        self.enabled: bool = config.serp_cache_enabled
+        self.ttl_seconds: float = config.serp_cache_ttl_hours * 3600
+        self._entries: Dict[str, SerpCacheEntryModel] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.pages_replayed = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Carrega cache do disco descartando entradas vencidas"""
+        entries = self.store.load(lambda data: {key: SerpCacheEntryModel(**values) for key, values in data.items()
+                                                if isinstance(values, dict)}, {})
+        self._entries = {key: entry for key, entry in entries.items() if self._is_fresh(entry)}
+        self._dirty = len(self._entries) != len(entries)
+
+    @staticmethod
+    def normalize_term(term: str) -> str:
+        """Minúsculas, sem acentos e sem espaços repetidos"""
+        decomposed = unicodedata.normalize('NFKD', term or '')
+        return ' '.join(''.join(c for c in decomposed if not unicodedata.combining(c)).lower().split())
+
+    def _key(self, engine: str, term: str, page: int) -> str:
+        return f"{engine}|{self.normalize_term(term)}|{page}"
+
+    def _is_fresh(self, entry: SerpCacheEntryModel) -> bool:
+        return time.time() - entry.saved_at < self.ttl_seconds
+
+    def find_engine(self, term: str, engines: Iterable[str]) -> Optional[str]:
+        """Primeiro motor com a 1ª página do termo ainda válida (None = buscar no navegador)"""
+        if not self.enabled:
+            return None
+        for engine in engines:
+            entry = self._entries.get(self._key(engine, term, 1))
+            if entry and self._is_fresh(entry):
+                self.hits += 1
+                return engine
+        self.misses += 1
+        return None
+
+    def get(self, engine: str, term: str, page: int) -> Optional[List[str]]:
+        """Links da página em cache (None = ausente ou vencida)"""
+        entry = self._entries.get(self._key(engine, term, page))
+        if not entry or not self._is_fresh(entry):
+            return None
+        self.pages_replayed += 1
+        return list(entry.links)
+
+    def get_sources(self, engine: str, term: str, page: int) -> Dict[str, str]:
+        """Motor de origem de cada link da página (entradas sem origem gravada: o próprio motor)"""
+        entry = self._entries.get(self._key(engine, term, page))
+        if not entry:
+            return {}
+        return {link: entry.sources.get(link, engine) for link in entry.links}
+
+    def put(self, engine: str, term: str, page: int, links: List[str],
+            sources: Optional[Dict[str, str]] = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[self._key(engine, term, page)] = SerpCacheEntryModel(
+                links=list(links), saved_at=time.time(), sources=dict(sources or {}))
+            self._dirty = True
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'term_hits': self.hits, 'term_misses': self.misses,
+                'pages_replayed': self.pages_replayed}
+
+    def save(self) -> None:
+        with self._lock:
+            if self._dirty and self.store.save({key: asdict(entry) for key, entry in self._entries.items()}):
+                self._dirty = False
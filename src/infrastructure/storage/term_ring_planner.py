@@ -0,0 +1,86 @@
+"""
+Plano de busca em anéis de distância - termos gerados do CEP de referência para fora, anel a anel
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+from .json_file_store import JsonFileStore
+from ..config.config_manager import ConfigManager
+
+DEFAULT_RING_PLAN = "data/cache/term_rings.json"
+
+
+class TermRingPlanner:
+    """Localizações ordenadas por distância; cada anel só vira termo quando o anterior se esgota"""
+
+    def __init__(self, cache_path: str = DEFAULT_RING_PLAN, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.store = JsonFileStore(cache_path, "plano de anéis")
+        self.enabled: bool = config.term_rings_enabled
+        self.ring_km: float = config.term_rings_width_km
+        self._locations: List[Dict] = []
+        self._categories: List[str] = []
+        self._next_ring = 0
+        self._load()
+
+    def _load(self) -> None:
+        self._locations, self._categories, self._next_ring = self.store.load(
+            lambda data: (data.get('locations', []), data.get('categories', []), int(data.get('next_ring', 0))),
+            ([], [], 0))
+
+    def build(self, locations: dict, categories: List[str]) -> None:
+        """Novo plano com as cidades e bairros descobertos (substitui o anterior)"""
+        entries = [{'name': city['name'], 'tipo': 'CIDADE', 'cidade_pai': None,
+                    'distancia_km': city.get('distance_km') or 0.0}
+                   for city in locations.get('cities', [])]
+        entries += [{'name': hood['name'], 'tipo': 'BAIRRO', 'cidade_pai': hood.get('city'),
+                     'distancia_km': hood.get('distance_km') or 0.0}
+                    for hood in locations.get('neighborhoods', [])]
+        self._locations = sorted(entries, key=lambda e: e['distancia_km'])
+        self._categories = list(categories)
+        self._next_ring = 0
+        self.save()
+
+    def next_ring(self) -> Tuple[float, List[Dict]]:
+        """(raio externo em km, termos do próximo anel não vazio); lista vazia = plano esgotado"""
+        while not self.exhausted:
+            ring = self._next_ring
+            self._next_ring += 1
+            members = [e for e in self._locations if self._ring_of(e['distancia_km']) == ring]
+            if members:
+                self.save()
+                return (ring + 1) * self.ring_km, self._terms_for(members)
+        self.save()
+        return 0.0, []
+
+    @property
+    def exhausted(self) -> bool:
+        if not self._locations:
+            return True
+        return self._next_ring > self._ring_of(self._locations[-1]['distancia_km'])
+
+    @property
+    def rings_total(self) -> int:
+        return self._ring_of(self._locations[-1]['distancia_km']) + 1 if self._locations else 0
+
+    @property
+    def rings_emitted(self) -> int:
+        return self._next_ring
+
+    def _ring_of(self, distance_km: float) -> int:
+        return int(math.floor(distance_km / self.ring_km)) if self.ring_km else 0
+
+    def _terms_for(self, members: List[Dict]) -> List[Dict]:
+        """Termos "<categoria> <localização>" no formato de save_dynamic_search_terms"""
+        return [{
+            'termo': f"{categoria} {entry['name']}",
+            'localizacao': entry['name'],
+            'tipo_localizacao': entry['tipo'],
+            'cidade_pai': entry['cidade_pai'],
+            'distancia_km': entry['distancia_km'],
+            'status': 'PENDENTE'
+        } for entry in members for categoria in self._categories]
+
+    def save(self) -> None:
+        self.store.save({'locations': self._locations, 'categories': self._categories,
+                         'next_ring': self._next_ring, 'ring_km': self.ring_km}, sort_keys=False)
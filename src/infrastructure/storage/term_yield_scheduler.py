@@ -0,0 +1,140 @@
+"""
+Agendador de termos por rendimento - ordena pendentes por novas empresas esperadas por minuto
+"""
+import threading
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from .json_file_store import JsonFileStore
+from ..config.config_manager import ConfigManager
+from ...domain.models.term_yield_model import TermYieldModel
+
+DEFAULT_YIELD_CACHE = "data/cache/term_yield.json"
+GLOBAL_KEY = "*"
+# Taxa a priori (empresas novas/min) do nível global: sem histórico todos os termos empatam e a distância desempata
+COLD_START_RATE = 1.0
+
+
+class TermYieldScheduler:
+    """Rendimento por termo, categoria e categoria x tipo de localização (persistido em JSON)"""
+
+    def __init__(self, categories: List[str], cache_path: str = DEFAULT_YIELD_CACHE,
+                 config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.store = JsonFileStore(cache_path, "histórico de rendimento")
+        self.enabled: bool = config.term_scheduler_enabled
+        self.prior_minutes: float = config.term_scheduler_prior_minutes
+        self.distance_scale: float = config.term_scheduler_distance_scale_km
+        self.retire_min_pages: int = config.term_scheduler_retire_min_pages
+        self.retire_below: float = config.term_scheduler_retire_below
+        # Categoria mais longa primeiro ("elevadores residenciais" antes de "elevadores")
+        self.categories = sorted(set(categories), key=len, reverse=True)
+        self._stats: Dict[str, Dict[str, TermYieldModel]] = {'terms': {}, 'combos': {}, 'categories': {}}
+        self._distances: Dict[str, float] = {}  # localização -> km da referência
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        def parse(data: Dict) -> Tuple[Dict, Dict]:
+            stats = {level: {key: TermYieldModel(**values)
+                             for key, values in data.get(level, {}).items() if isinstance(values, dict)}
+                     for level in self._stats}
+            return stats, {str(k): float(v) for k, v in data.get('distances', {}).items()}
+
+        loaded = self.store.load(parse)
+        if loaded:
+            self._stats, self._distances = loaded
+
+    # ===== Classificação dos termos =====
+
+    def split_term(self, term: str) -> Tuple[str, str]:
+        """(categoria, localização) do termo gerado como "<categoria> <localização>" """
+        lowered = term.lower()
+        for category in self.categories:
+            if lowered.startswith(category.lower()):
+                return category, term[len(category):].strip()
+        return "", term
+
+    def register_distances(self, distances: Dict[str, float]) -> None:
+        """Distâncias das localizações descobertas (gravadas na geração dos termos)"""
+        with self._lock:
+            self._distances.update({name: float(km) for name, km in distances.items() if km is not None})
+            self._dirty = True
+
+    # ===== Registro =====
+
+    def record(self, term: str, location_type: str, sample: TermYieldModel) -> None:
+        """Soma o rendimento do termo nos níveis termo, combinação, categoria e global"""
+        category, _ = self.split_term(term)
+        with self._lock:
+            for level, key in (('terms', term), ('combos', self._combo(category, location_type)),
+                               ('categories', category), ('categories', GLOBAL_KEY)):
+                self._stats[level].setdefault(key, TermYieldModel()).add(sample)
+            self._dirty = True
+
+    # ===== Ordenação =====
+
+    def order(self, pending: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """(pendentes por prioridade, aposentados); termos no formato de get_pending_terms"""
+        if not self.enabled:
+            return pending, []
+        active, retired = [], []
+        for term in pending:
+            (retired if self._is_retired(term) else active).append(term)
+        # sorted é estável: empate mantém a ordem de inserção
+        return sorted(active, key=self.score, reverse=True), retired
+
+    def score(self, term: Dict) -> float:
+        """Novas empresas esperadas por minuto, descontada a distância até a referência"""
+        category, location = self.split_term(term['termo'])
+        global_rate = self._rate(self._stats['categories'].get(GLOBAL_KEY), COLD_START_RATE)
+        category_rate = self._rate(self._stats['categories'].get(category), global_rate)
+        rate = self._rate(self._stats['combos'].get(self._combo(category, term.get('tipo'))), category_rate)
+        rate = self._rate(self._stats['terms'].get(term['termo']), rate)  # Termo já rodou (ex: ficou pendente)
+        distance = self._distances.get(location, 0.0)
+        return rate / (1 + distance / self.distance_scale) if self.distance_scale else rate
+
+    def _rate(self, stats: Optional[TermYieldModel], prior: float) -> float:
+        """Taxa suavizada: poucos minutos observados ficam perto da taxa do nível acima (sempre > 0)"""
+        if not stats:
+            return prior
+        return (stats.new_companies + prior * self.prior_minutes) / (stats.seconds / 60 + self.prior_minutes)
+
+    def _is_retired(self, term: Dict) -> bool:
+        """Combinação com páginas suficientes e rendimento abaixo do mínimo"""
+        category, _ = self.split_term(term['termo'])
+        combo = self._stats['combos'].get(self._combo(category, term.get('tipo')))
+        return bool(combo and combo.pages >= self.retire_min_pages and combo.new_per_page < self.retire_below)
+
+    @staticmethod
+    def _combo(category: str, location_type: Optional[str]) -> str:
+        return f"{category}|{location_type or ''}"
+
+    # ===== Relatório e persistência =====
+
+    def report(self, top: int = 5) -> Dict:
+        """Rendimento global e melhores/piores combinações"""
+        with self._lock:
+            overall = self._stats['categories'].get(GLOBAL_KEY, TermYieldModel())
+            combos = sorted(((key, stats) for key, stats in self._stats['combos'].items() if stats.pages),
+                            key=lambda item: item[1].new_per_page, reverse=True)
+            describe = lambda items: ", ".join(f"{key} ({stats.new_per_page:.2f}/pág)" for key, stats in items)
+            return {
+                'terms': overall.runs,
+                'new_per_page': round(overall.new_per_page, 2),
+                'emails_per_visit': round(overall.emails_per_visit, 2),
+                'new_per_hour': round(overall.new_per_minute * 60, 1),
+                'best': describe(combos[:top]),
+                'worst': describe(combos[-top:][::-1]) if len(combos) > top else ""
+            }
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {level: {key: asdict(stats) for key, stats in entries.items()}
+                    for level, entries in self._stats.items()}
+            data['distances'] = self._distances
+            if self.store.save(data):
+                self._dirty = False
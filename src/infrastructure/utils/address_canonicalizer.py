@@ -0,0 +1,106 @@
+"""
+Canonicalização de endereços e chave única para deduplicação da TB_ENDERECOS
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Dict, Optional
+
+from ...domain.models.address_model import AddressModel
+from ...domain.services.address_enrichment_service import AddressEnrichmentService
+
+# Abreviações de tipo de logradouro, títulos e termos de bairro (já sem acento e sem ponto)
+STREET_ABBREVIATIONS: Dict[str, str] = {
+    'r': 'rua', 'av': 'avenida', 'avda': 'avenida', 'al': 'alameda', 'tv': 'travessa', 'trav': 'travessa',
+    'pc': 'praca', 'pca': 'praca', 'rod': 'rodovia', 'estr': 'estrada', 'lgo': 'largo',
+    'lg': 'largo', 'vd': 'viaduto', 'vl': 'vila', 'jd': 'jardim', 'jard': 'jardim', 'pq': 'parque',
+    'pque': 'parque', 'res': 'residencial', 'cond': 'condominio',
+    'dr': 'doutor', 'dra': 'doutora', 'prof': 'professor', 'profa': 'professora', 'eng': 'engenheiro',
+    'gal': 'general', 'gen': 'general', 'cel': 'coronel', 'pres': 'presidente', 'sen': 'senador',
+    'dep': 'deputado', 'cap': 'capitao', 'ten': 'tenente', 'maj': 'major', 'mal': 'marechal',
+    'brig': 'brigadeiro', 'cons': 'conselheiro', 'des': 'desembargador', 'pe': 'padre', 'gov': 'governador',
+    'vsc': 'visconde', 'sta': 'santa', 'sto': 'santo', 'sra': 'senhora', 'min': 'ministro', 'arq': 'arquiteto'
+}
+COMPLEMENT_ABBREVIATIONS: Dict[str, str] = {
+    'cj': 'conjunto', 'cjto': 'conjunto', 'conj': 'conjunto', 'sl': 'sala', 'sls': 'salas', 'and': 'andar',
+    'bl': 'bloco', 'blc': 'bloco', 'ap': 'apartamento', 'apto': 'apartamento', 'apt': 'apartamento',
+    'lj': 'loja', 'gal': 'galpao', 'galp': 'galpao', 'pav': 'pavimento', 'fds': 'fundos',
+    'esq': 'esquina'
+}
+# Nome do estado (sem acento) -> sigla; siglas passam direto
+UF_CODES: Dict[str, str] = {
+    'acre': 'ac', 'alagoas': 'al', 'amapa': 'ap', 'amazonas': 'am', 'bahia': 'ba', 'ceara': 'ce',
+    'distrito federal': 'df', 'espirito santo': 'es', 'goias': 'go', 'maranhao': 'ma', 'mato grosso': 'mt',
+    'mato grosso do sul': 'ms', 'minas gerais': 'mg', 'para': 'pa', 'paraiba': 'pb', 'parana': 'pr',
+    'pernambuco': 'pe', 'piaui': 'pi', 'rio de janeiro': 'rj', 'rio grande do norte': 'rn',
+    'rio grande do sul': 'rs', 'rondonia': 'ro', 'roraima': 'rr', 'santa catarina': 'sc', 'sao paulo': 'sp',
+    'sergipe': 'se', 'tocantins': 'to'
+}
+ORDINAL_PATTERN = re.compile(r'(\d+)\s*(?:o|a|º|ª)\b')
+NUMBER_PATTERN = re.compile(r'(\d+)\s*-?\s*([a-z]?)\b')
+THOUSANDS_PATTERN = re.compile(r'(?<=\d)\.(?=\d{3}\b)')
+NO_NUMBER_PATTERN = re.compile(r'^(?:s\s*n|sem\s+numero|sn)$')
+
+
+class AddressCanonicalizer:
+    """Forma canônica (abreviações expandidas, sem acento, número/complemento normalizados) e chave única"""
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Minúsculas, sem acentos e sem pontuação (espaços simples)"""
+        decomposed = unicodedata.normalize('NFKD', (text or '').replace('º', 'o').replace('ª', 'a'))
+        plain = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+        return ' '.join(re.sub(r'[^a-z0-9/]+', ' ', plain).split())
+
+    @classmethod
+    def _expand(cls, text: str, abbreviations: Dict[str, str]) -> str:
+        return ' '.join(abbreviations.get(word, word) for word in cls.fold(text).replace('/', ' ').split())
+
+    @classmethod
+    def canonical_logradouro(cls, logradouro: str) -> str:
+        return cls._expand(logradouro, STREET_ABBREVIATIONS)
+
+    @classmethod
+    def canonical_estado(cls, estado: str) -> str:
+        """'São Paulo' / 'SP' -> 'sp'"""
+        folded = cls.fold(estado)
+        return UF_CODES.get(folded, folded)
+
+    @classmethod
+    def canonical_numero(cls, numero: str) -> str:
+        """'Nº 0123-A' -> '123a'; '3.477' -> '3477'; 's/n' -> 'sn'"""
+        text = cls.fold(THOUSANDS_PATTERN.sub('', numero or ''))
+        text = re.sub(r'^(?:numero|num|no|n)\s*(?=\d)', '', text)
+        if not text or NO_NUMBER_PATTERN.match(text.replace('/', ' ')):
+            return 'sn' if text else ''
+        match = NUMBER_PATTERN.search(text)
+        return f"{int(match.group(1))}{match.group(2)}" if match else text.replace('/', '')
+
+    @classmethod
+    def canonical_complemento(cls, complemento: str) -> str:
+        """'Cj. 12 - 3º and.' -> 'conjunto 12 3 andar' (ordinais sem sufixo, zeros à esquerda removidos)"""
+        text = ORDINAL_PATTERN.sub(r'\1', cls.fold(complemento))
+        words = cls._expand(text, COMPLEMENT_ABBREVIATIONS).split()
+        return ' '.join(str(int(word)) if word.isdigit() else word for word in words)
+
+    @classmethod
+    def canonical_form(cls, address: AddressModel) -> Optional[str]:
+        """Texto canônico do endereço (bairro fica de fora: varia entre sites para o mesmo prédio);
+        None sem logradouro - endereço incompleto não é deduplicado"""
+        logradouro = cls.canonical_logradouro(address.logradouro)
+        if not logradouro:
+            return None
+        return '|'.join([
+            cls.canonical_estado(address.estado),
+            cls.fold(address.cidade),
+            AddressEnrichmentService.normalize_cep(address.cep) or '',
+            logradouro,
+            cls.canonical_numero(address.numero),
+            cls.canonical_complemento(address.complemento)
+        ])
+
+    @classmethod
+    def canonical_key(cls, address: AddressModel) -> Optional[str]:
+        """Chave única da TB_ENDERECOS.CHAVE_CANONICA (SHA-1 da forma canônica, 40 caracteres; None sem logradouro)"""
+        form = cls.canonical_form(address)
+        return hashlib.sha1(form.encode('utf-8')).hexdigest() if form else None
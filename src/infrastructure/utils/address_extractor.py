@@ -4,6 +4,8 @@ Extrator e formatador de endereços - Responsabilidade única
 import re
 from typing import Optional
 
+from .html_utils import trim_html
+from .structured_data_extractor import StructuredDataExtractor
 from ...domain.models.address_model import AddressModel
 
 
@@ -45,9 +47,13 @@ class AddressExtractor:
         if not html_content:
             return None
 
-        # Limitar HTML para performance (primeiros 50KB)
-        if len(html_content) > 50000:
-            html_content = html_content[:50000]
+        # Caminho rápido: endereço publicado em JSON-LD/microdata (schema.org PostalAddress)
+        structured = StructuredDataExtractor.extract_address(html_content)
+        if structured:
+            return structured
+
+        # Limitar HTML para performance (50KB: início + rodapé)
+        html_content = trim_html(html_content, 50000)
 
         # Tentar extrair endereço estruturado
         address = cls._extract_structured_address(html_content)
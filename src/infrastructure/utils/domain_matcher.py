@@ -0,0 +1,228 @@
+"""
+Normalizador de domínios e matcher de blacklist pré-compilado
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import tldextract
+
+from ...domain.models.url_classification_model import UrlClassificationModel
+
+# Prefixos "www", "www2", "www3"... removidos do host
+WWW_PREFIX_PATTERN = re.compile(r'^www\d*\.')
+# Esquema opcional + autoridade (host) + resto (caminho, query, fragmento)
+URL_PATTERN = re.compile(r'^(?:[a-z][a-z0-9+.\-]*:)?(?://)?([^/?#]*)(.*)$', re.DOTALL)
+HOST_CACHE_SIZE = 65536
+TRIE_END = '$'
+
+
+class DomainNormalizer:
+    """Normaliza URLs/hosts e extrai domínio registrável (ciente de sufixos públicos)"""
+
+    # Usa snapshot da Public Suffix List embutido no tldextract (sem acesso à rede)
+    _extractor = tldextract.TLDExtract(suffix_list_urls=())
+
+    @staticmethod
+    def split_url(url: str) -> Tuple[str, str]:
+        """Separa URL em (host normalizado, resto em minúsculas: caminho + query)"""
+        match = URL_PATTERN.match(url.strip().lower())
+        authority, rest = match.group(1), match.group(2)
+        return DomainNormalizer.normalize_host(authority), rest
+
+    @staticmethod
+    def normalize_host(authority: str) -> str:
+        """Remove credenciais, porta, ponto final e prefixo www do host"""
+        # Caminho rápido: host simples (caso mais comum nos resultados de busca)
+        if not authority.startswith('www') and ':' not in authority and '@' not in authority \
+                and not authority.endswith('.'):
+            return authority
+
+        host = authority.rsplit('@', 1)[-1]
+
+        if host.startswith('['):  # IPv6 literal
+            return host.split(']', 1)[0] + ']'
+
+        host = host.split(':', 1)[0].rstrip('.')
+        return WWW_PREFIX_PATTERN.sub('', host)
+
+    @staticmethod
+    def extract_host(url: str) -> str:
+        """Extrai host normalizado da URL"""
+        return DomainNormalizer.split_url(url)[0]
+
+    @classmethod
+    @lru_cache(maxsize=HOST_CACHE_SIZE)
+    def registrable_domain(cls, host: str) -> str:
+        """Domínio registrável do host (ex: loja.empresa.com.br -> empresa.com.br)"""
+        if not host:
+            return ""
+        ext = cls._extractor(host)
+        if ext.domain and ext.suffix:
+            return f"{ext.domain}.{ext.suffix}"
+        return host
+
+    @classmethod
+    def domain_from_url(cls, url: str) -> str:
+        """Atalho: URL -> domínio registrável"""
+        return cls.registrable_domain(cls.extract_host(url))
+
+
+class HostSuffixTrie:
+    """Trie de labels invertidos para casar hosts por sufixo (alinhado a labels)"""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._root: Dict = {}
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        """Adiciona padrão de host (ex: 'uol.com.br', 'maps.google')"""
+        node = self._root
+        for label in reversed(pattern.strip('.').lower().split('.')):
+            node = node.setdefault(label, {})
+        node[TRIE_END] = pattern
+
+    def match(self, host: str) -> Optional[str]:
+        """Retorna padrão que casa com sequência contígua de labels do host"""
+        labels = host.split('.')
+        labels.reverse()
+
+        # Offset 0 = sufixo exato; offsets seguintes permitem padrões sem TLD (ex: 'maps.google')
+        for offset in range(len(labels)):
+            node = self._root
+            for label in labels[offset:]:
+                node = node.get(label)
+                if node is None:
+                    break
+                if TRIE_END in node:
+                    return node[TRIE_END]
+        return None
+
+
+class KeywordAutomaton:
+    """Autômato Aho-Corasick (compilado em DFA) para palavras-chave em URLs"""
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self._delta: List[Dict[str, int]] = []
+        self._output: List[Optional[str]] = []
+        self._build([k.lower() for k in keywords if k])
+
+    def _build(self, keywords: List[str]) -> None:
+        """Monta trie, links de falha e tabela de transição completa"""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Optional[str]] = [None]
+
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append(None)
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state] = output[state] or keyword
+
+        # Links de falha em BFS (estados rasos primeiro)
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                if output[child] is None:
+                    output[child] = output[fail[child]]
+
+        # DFA: cada estado herda transições do estado de falha (sem retrocesso em runtime)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        for state in order:
+            transitions = dict(delta[fail[state]])
+            transitions.update(goto[state])
+            delta[state] = transitions
+
+        self._delta = delta
+        self._output = output
+
+    def search(self, text: str) -> Optional[str]:
+        """Retorna a primeira palavra-chave encontrada no texto"""
+        delta = self._delta
+        output = self._output
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+
+class BlacklistMatcher:
+    """Matcher pré-compilado para BLACKLIST_HOSTS (hosts, palavras-chave do host e regras de caminho)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        patterns = [p.strip().lower() for p in patterns if p and p.strip()]
+
+        # Iniciados por '/' são regras de caminho (ex: '/forum'); com ponto são hosts;
+        # demais são palavras-chave procuradas apenas no host (ex: 'prefeitura')
+        self.path_patterns = [p for p in patterns if p.startswith('/')]
+        self.host_patterns = [p for p in patterns if '.' in p and not p.startswith('/')]
+        self.keyword_patterns = [p for p in patterns if '.' not in p and not p.startswith('/')]
+
+        self._host_trie = HostSuffixTrie(self.host_patterns)
+        self._keywords = KeywordAutomaton(self.keyword_patterns)
+        self._paths = KeywordAutomaton(self.path_patterns)
+        self._host_verdict = lru_cache(maxsize=HOST_CACHE_SIZE)(self._classify_host)
+
+    def _classify_host(self, host: str) -> Tuple[str, Optional[str]]:
+        """Domínio registrável + padrão casado para o host (resultado em cache)"""
+        matched = self._host_trie.match(host) or self._keywords.search(host)
+        return DomainNormalizer.registrable_domain(host), matched
+
+    def classify(self, url: str) -> UrlClassificationModel:
+        """Classifica uma URL (host, domínio registrável e blacklist)"""
+        authority, rest = URL_PATTERN.match(url.strip().lower()).groups()
+        host = DomainNormalizer.normalize_host(authority)
+        domain, matched = self._host_verdict(host)
+        if matched is None and rest and self.path_patterns:
+            matched = self._paths.search(rest)
+
+        return UrlClassificationModel(
+            url=url,
+            host=host,
+            domain=domain,
+            blacklisted=matched is not None,
+            matched_pattern=matched or ""
+        )
+
+    def classify_batch(self, urls: Iterable[str]) -> List[UrlClassificationModel]:
+        """Classifica lote de URLs em uma única chamada"""
+        classify = self.classify
+        return [classify(url) for url in urls]
+
+    def is_blacklisted(self, url: str) -> bool:
+        """Verifica se URL está na blacklist"""
+        authority, rest = URL_PATTERN.match(url.strip().lower()).groups()
+        if self._host_verdict(DomainNormalizer.normalize_host(authority))[1] is not None:
+            return True
+        return bool(rest) and bool(self.path_patterns) and self._paths.search(rest) is not None
+
+    def filter_allowed(self, urls: Iterable[str]) -> List[str]:
+        """Retorna apenas URLs fora da blacklist (mantém ordem)"""
+        return [url for url in urls if not self.is_blacklisted(url)]
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(patterns: Tuple[str, ...]) -> BlacklistMatcher:
+    return BlacklistMatcher(patterns)
+
+
+def get_blacklist_matcher(patterns: Iterable[str]) -> BlacklistMatcher:
+    """Obtém matcher compilado (reutilizado para a mesma lista de padrões)"""
+    return _cached_matcher(tuple(patterns))
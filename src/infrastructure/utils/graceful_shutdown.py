@@ -0,0 +1,42 @@
+"""
+Encerramento gracioso - SIGINT/SIGTERM pedem parada no próximo ponto seguro da coleta
+"""
+import signal
+import threading
+from typing import Callable, Dict, Optional
+
+
+class GracefulShutdown:
+    """1º sinal: termina o trabalho em andamento e grava pendências; 2º sinal: interrompe na hora"""
+
+    def __init__(self, on_request: Optional[Callable[[str], None]] = None):
+        self.requested = False
+        self.on_request = on_request
+        self._previous: Dict[int, object] = {}
+
+    def install(self) -> None:
+        """Registra os handlers (só é possível na thread principal)"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in (signal.SIGINT, getattr(signal, 'SIGTERM', None)):
+            if sig is None:
+                continue
+            try:
+                self._previous[sig] = signal.signal(sig, self._handle)
+            except (ValueError, OSError):
+                continue
+
+    def restore(self) -> None:
+        for sig, handler in self._previous.items():
+            try:
+                signal.signal(sig, handler)
+            except (ValueError, OSError, TypeError):
+                continue
+        self._previous = {}
+
+    def _handle(self, signum, frame) -> None:
+        if self.requested:
+            raise KeyboardInterrupt  # Segundo sinal: parada imediata
+        self.requested = True
+        if self.on_request:
+            self.on_request(signal.Signals(signum).name)
@@ -0,0 +1,14 @@
+"""
+Utilitários de HTML
+"""
+
+# Fração do limite reservada ao final do documento (rodapé com endereço/telefone)
+TAIL_RATIO = 0.4
+
+
+def trim_html(html: str, max_chars: int) -> str:
+    """Limita HTML mantendo início e fim do documento (rodapé costuma ter os contatos)"""
+    if not html or len(html) <= max_chars:
+        return html or ""
+    tail_chars = int(max_chars * TAIL_RATIO)
+    return html[:max_chars - tail_chars] + html[-tail_chars:]
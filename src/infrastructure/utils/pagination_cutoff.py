@@ -0,0 +1,66 @@
+"""
+Paginação adaptativa - encerra o termo quando as páginas deixam de trazer domínios novos
+"""
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Set
+
+from ..config.config_manager import ConfigManager
+
+
+class PaginationCutoff:
+    """Taxa de domínios novos por página + sobreposição da 1ª página com termos anteriores"""
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        config = config or ConfigManager()
+        self.enabled: bool = config.pagination_cutoff_enabled
+        self.min_new_ratio: float = config.pagination_min_new_ratio
+        self.max_overlap: float = config.pagination_max_first_page_overlap
+        self._recent_first_pages: Deque[Set[str]] = deque(maxlen=config.pagination_overlap_window)
+        self._term_seen: Set[str] = set()
+        self._page = 0
+        self._pages_planned = 0
+        self.pages_read = 0
+        self.pages_saved = 0
+        self.cutoffs_low_yield = 0
+        self.cutoffs_overlap = 0
+
+    def start_term(self, pages: int) -> None:
+        self._term_seen = set()
+        self._page = 0
+        self._pages_planned = pages
+
+    def should_continue(self, domains: Iterable[str], is_new: Callable[[str], bool]) -> bool:
+        """Registra a página lida; False = não buscar as próximas páginas do termo"""
+        self._page += 1
+        self.pages_read += 1
+        # DuckDuckGo acumula resultados na mesma página: só conta o que o termo ainda não viu
+        fresh = [d for d in dict.fromkeys(domains) if d and d not in self._term_seen]
+        self._term_seen.update(fresh)
+        if self._page == 1:
+            overlap = self._first_page_overlap(set(fresh))
+            self._recent_first_pages.append(set(fresh))
+        if not self.enabled or self._page >= self._pages_planned:
+            return True
+
+        if self._page == 1 and overlap >= self.max_overlap:
+            self.cutoffs_overlap += 1
+            return self._stop()
+        new_ratio = sum(1 for d in fresh if is_new(d)) / len(fresh) if fresh else 0.0
+        if new_ratio < self.min_new_ratio:
+            self.cutoffs_low_yield += 1
+            return self._stop()
+        return True
+
+    def _first_page_overlap(self, domains: Set[str]) -> float:
+        """Maior fração da 1ª página já retornada na 1ª página de um termo recente"""
+        if not domains:
+            return 0.0
+        return max((len(domains & previous) / len(domains) for previous in self._recent_first_pages), default=0.0)
+
+    def _stop(self) -> bool:
+        self.pages_saved += self._pages_planned - self._page
+        return False
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'pages_read': self.pages_read, 'pages_saved': self.pages_saved,
+                'cutoffs_low_yield': self.cutoffs_low_yield, 'cutoffs_overlap': self.cutoffs_overlap}
@@ -0,0 +1,121 @@
+"""
+Fingerprint SimHash de conteúdo visível e índice de quase-duplicatas
+"""
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...domain.models.fingerprint_model import FingerprintModel
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+# Textos curtos (páginas vazias, bloqueios, erros) colidem entre si e não são indexados
+MIN_TEXT_WORDS = 50
+# Distância de Hamming máxima para considerar quase-duplicata
+MAX_HAMMING_DISTANCE = 3
+# 4 bandas de 16 bits: distância <= 3 garante ao menos uma banda idêntica (pigeonhole)
+BAND_COUNT = 4
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+FINGERPRINT_MASK = (1 << FINGERPRINT_BITS) - 1
+
+
+class SimHasher:
+    """Calcula SimHash de 64 bits sobre shingles de palavras"""
+
+    @staticmethod
+    def _tokens(text: str) -> List[str]:
+        return WORD_PATTERN.findall(text.lower())
+
+    @staticmethod
+    def _hash(token: str) -> int:
+        return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    @classmethod
+    def fingerprint(cls, text: str) -> Optional[int]:
+        """SimHash do texto (None se texto curto demais para ser confiável)"""
+        words = cls._tokens(text)
+        if len(words) < MIN_TEXT_WORDS:
+            return None
+
+        # Shingles repetidos (menus, rodapés) contam com peso proporcional à frequência
+        weights: Dict[str, int] = {}
+        for i in range(len(words) - SHINGLE_SIZE + 1):
+            shingle = ' '.join(words[i:i + SHINGLE_SIZE])
+            weights[shingle] = weights.get(shingle, 0) + 1
+
+        vector = [0] * FINGERPRINT_BITS
+        for shingle, weight in weights.items():
+            value = cls._hash(shingle)
+            for bit in range(FINGERPRINT_BITS):
+                if value >> bit & 1:
+                    vector[bit] += weight
+                else:
+                    vector[bit] -= weight
+
+        result = 0
+        for bit in range(FINGERPRINT_BITS):
+            if vector[bit] > 0:
+                result |= 1 << bit
+        return result
+
+    @staticmethod
+    def hamming_distance(a: int, b: int) -> int:
+        return bin((a ^ b) & FINGERPRINT_MASK).count('1')
+
+    @staticmethod
+    def to_hex(fingerprint: Optional[int]) -> str:
+        """Formato persistido no banco (TEXT(16))"""
+        return f"{fingerprint:016x}" if fingerprint is not None else ""
+
+    @staticmethod
+    def from_hex(value: str) -> Optional[int]:
+        try:
+            return int(value, 16) if value else None
+        except (TypeError, ValueError):
+            return None
+
+
+class SimHashIndex:
+    """Índice em bandas para busca de fingerprints próximos (distância de Hamming)"""
+
+    def __init__(self, max_distance: int = MAX_HAMMING_DISTANCE, bands: int = BAND_COUNT):
+        self.max_distance = max_distance
+        self.bands = bands
+        self.band_bits = FINGERPRINT_BITS // bands
+        self._band_mask = (1 << self.band_bits) - 1
+        self._buckets: List[Dict[int, List[FingerprintModel]]] = [{} for _ in range(bands)]
+        self._size = 0
+
+    def _band_keys(self, fingerprint: int) -> Iterable[Tuple[int, int]]:
+        for band in range(self.bands):
+            yield band, (fingerprint >> (band * self.band_bits)) & self._band_mask
+
+    def add(self, entry: FingerprintModel) -> None:
+        """Indexa fingerprint de uma empresa já extraída"""
+        if entry.fingerprint is None:
+            return
+        for band, key in self._band_keys(entry.fingerprint):
+            self._buckets[band].setdefault(key, []).append(entry)
+        self._size += 1
+
+    def find_near_duplicate(self, fingerprint: Optional[int],
+                            exclude_domain: str = "") -> Optional[Tuple[FingerprintModel, int]]:
+        """Retorna (entrada mais próxima, distância) dentro do limite, ou None"""
+        if fingerprint is None:
+            return None
+
+        best: Optional[Tuple[FingerprintModel, int]] = None
+        for band, key in self._band_keys(fingerprint):
+            for entry in self._buckets[band].get(key, ()):
+                if exclude_domain and entry.domain == exclude_domain:
+                    continue
+                distance = SimHasher.hamming_distance(fingerprint, entry.fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (entry, distance)
+                    if distance == 0:
+                        return best
+        return best
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,237 @@
+"""
+Extrator de dados estruturados (JSON-LD schema.org, microdata, mailto: e tel:)
+"""
+import html as html_lib
+import json
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import unquote
+
+from ...domain.models.address_model import AddressModel
+from ...domain.models.structured_contact_model import StructuredContactModel
+
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]+type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+# Tag com itemprop + texto direto (sem casar até o fechamento: itemprops aninhados em "address")
+ITEMPROP_PATTERN = re.compile(r'<\w+([^>]*\bitemprop\s*=\s*["\'][\w\s]+["\'][^>]*)>([^<]*)', re.IGNORECASE)
+ITEMPROP_NAME_PATTERN = re.compile(r'\bitemprop\s*=\s*["\']([\w\s]+)["\']', re.IGNORECASE)
+CONTENT_ATTR_PATTERN = re.compile(r'\b(?:content|href)\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+MAILTO_PATTERN = re.compile(r'href\s*=\s*["\']mailto:([^"\'?]+)', re.IGNORECASE)
+TEL_PATTERN = re.compile(r'href\s*=\s*["\']tel:([^"\']+)', re.IGNORECASE)
+CEP_DIGITS_PATTERN = re.compile(r'\D')
+EMAIL_PATTERN = re.compile(r'^[a-z0-9._%+\-]+@[a-z0-9.\-]+\.[a-z]{2,}$')
+MAILTO_PREFIX_PATTERN = re.compile(r'^mailto:', re.IGNORECASE)
+NATIONAL_PREFIXES = ('0800', '0300', '0500')  # Números nacionais (sem DDD): mantêm o zero inicial
+
+MICRODATA_PROPS = {'email', 'telephone', 'streetaddress', 'postalcode', 'addresslocality', 'addressregion', 'name'}
+MAX_ITEMS = 5
+
+
+class StructuredDataExtractor:
+    """Caminho rápido: valores exatos publicados pelo site, antes das regex heurísticas"""
+
+    @classmethod
+    def extract(cls, html: str) -> StructuredContactModel:
+        """Extrai contatos de JSON-LD, microdata e links mailto:/tel:"""
+        result = StructuredContactModel()
+        if not html:
+            StructuredDataStats.record(result)
+            return result
+
+        lowered = html.lower()
+        if 'application/ld+json' in lowered:
+            cls._extract_json_ld(html, result)
+        if 'itemprop' in lowered:
+            cls._extract_microdata(html, result)
+        if 'mailto:' in lowered:
+            cls._add_emails(result, 'mailto', (unquote(m) for m in MAILTO_PATTERN.findall(html)))
+        if 'tel:' in lowered:
+            cls._add_phones(result, 'tel', (unquote(m) for m in TEL_PATTERN.findall(html)))
+
+        StructuredDataStats.record(result)
+        return result
+
+    @classmethod
+    def extract_address(cls, html: str) -> Optional[AddressModel]:
+        """Apenas endereço (JSON-LD/microdata), sem contabilizar estatísticas"""
+        if not html:
+            return None
+        result = StructuredContactModel()
+        lowered = html.lower()
+        if 'application/ld+json' in lowered:
+            cls._extract_json_ld(html, result)
+        if not result.address and 'itemprop' in lowered:
+            cls._extract_microdata(html, result)
+        return result.address if result.address and result.address.is_valid() else None
+
+    # ===== JSON-LD =====
+
+    @classmethod
+    def _extract_json_ld(cls, html: str, result: StructuredContactModel) -> None:
+        for block in JSON_LD_PATTERN.findall(html):
+            data = cls._parse_json(block.strip())
+            if data is None:
+                continue
+            for node in cls._walk(data):
+                cls._add_emails(result, 'json_ld', cls._as_list(node.get('email')))
+                cls._add_phones(result, 'json_ld', cls._as_list(node.get('telephone')))
+                if not result.name and node.get('address') and isinstance(node.get('name'), str):
+                    result.name = node['name'].strip()
+                if not result.has_address():
+                    for address in cls._as_list(node.get('address')):
+                        model = cls._postal_address(address)
+                        if model:
+                            result.address = model
+                            result.sources.add('json_ld')
+                            break
+
+    @staticmethod
+    def _parse_json(block: str) -> Any:
+        """JSON do bloco (alguns CMS escapam entidades HTML dentro do script)"""
+        for candidate in (block, html_lib.unescape(block)):
+            try:
+                return json.loads(candidate)
+            except (ValueError, TypeError):
+                continue
+        return None
+
+    @classmethod
+    def _walk(cls, data: Any) -> Iterable[Dict]:
+        """Percorre nós do JSON-LD (listas, @graph, objetos aninhados)"""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                yield node
+                stack.extend(v for k, v in node.items() if k != 'address' and isinstance(v, (list, dict)))
+
+    @staticmethod
+    def _as_list(value: Any) -> List:
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    @classmethod
+    def _postal_address(cls, address: Any) -> Optional[AddressModel]:
+        """schema.org PostalAddress -> AddressModel"""
+        if not isinstance(address, dict):
+            return None
+
+        street = str(address.get('streetAddress') or '').strip()
+        numero = ''
+        if ',' in street:
+            street, numero = [part.strip() for part in street.split(',', 1)]
+
+        model = AddressModel(
+            logradouro=street[:100],
+            numero=numero[:20],
+            bairro=str(address.get('addressNeighborhood') or address.get('neighborhood') or '').strip()[:50],
+            cidade=str(address.get('addressLocality') or '').strip()[:50],
+            estado=str(address.get('addressRegion') or '').strip()[:2].upper(),
+            cep=cls._clean_cep(address.get('postalCode'))
+        )
+        return model if model.logradouro or model.cep else None
+
+    # ===== MICRODATA =====
+
+    @classmethod
+    def _extract_microdata(cls, html: str, result: StructuredContactModel) -> None:
+        props: Dict[str, str] = {}
+        for attrs, text in ITEMPROP_PATTERN.findall(html):
+            content = CONTENT_ATTR_PATTERN.search(attrs)
+            value = html_lib.unescape(' '.join((content.group(1) if content else text).split()))
+            for name in ITEMPROP_NAME_PATTERN.search(attrs).group(1).lower().split():
+                if name not in MICRODATA_PROPS or not value:
+                    continue
+                if name == 'email':
+                    cls._add_emails(result, 'microdata', [value])
+                elif name == 'telephone':
+                    cls._add_phones(result, 'microdata', [value.replace('tel:', '')])
+                else:
+                    props.setdefault(name, value)
+
+        if not result.has_address() and (props.get('streetaddress') or props.get('postalcode')):
+            result.address = cls._postal_address({
+                'streetAddress': props.get('streetaddress', ''),
+                'addressLocality': props.get('addresslocality', ''),
+                'addressRegion': props.get('addressregion', ''),
+                'postalCode': props.get('postalcode', '')
+            })
+            if result.address:
+                result.sources.add('microdata')
+        if not result.name and props.get('name'):
+            result.name = props['name'][:100]
+
+    # ===== NORMALIZAÇÃO =====
+
+    @staticmethod
+    def _add_emails(result: StructuredContactModel, source: str, values: Iterable[Any]) -> None:
+        for value in values:
+            email = MAILTO_PREFIX_PATTERN.sub('', unquote(str(value).strip())).split('?', 1)[0].strip().lower()
+            if EMAIL_PATTERN.match(email) and email not in result.emails and len(result.emails) < MAX_ITEMS:
+                result.emails.append(email)
+                result.sources.add(source)
+
+    @staticmethod
+    def _add_phones(result: StructuredContactModel, source: str, values: Iterable[Any]) -> None:
+        for value in values:
+            digits = StructuredDataExtractor._normalize_phone(str(value))
+            if digits and digits not in result.phones and len(result.phones) < MAX_ITEMS:
+                result.phones.append(digits)
+                result.sources.add(source)
+
+    @staticmethod
+    def _normalize_phone(value: str) -> str:
+        """'+55 (11) 3333-4444' / '(011) 3333-4444' -> '1133334444'; '0800 123 4567' fica intacto"""
+        digits = re.sub(r'\D', '', value)
+        if digits.startswith(NATIONAL_PREFIXES):
+            return digits if len(digits) == 11 else ''
+        if digits.startswith('55') and len(digits) in (12, 13):
+            digits = digits[2:]  # Código do país
+        elif digits.startswith('0') and len(digits) in (11, 12):
+            digits = digits[1:]  # Zero de interurbano antes do DDD
+        return digits if len(digits) in (10, 11) else ''
+
+    @staticmethod
+    def _clean_cep(value: Any) -> str:
+        digits = CEP_DIGITS_PATTERN.sub('', str(value or ''))
+        return digits if len(digits) == 8 else ''
+
+
+class StructuredDataStats:
+    """Taxa de acerto por fonte do caminho estruturado (acumulado no processo)"""
+
+    SOURCES = ('json_ld', 'microdata', 'mailto', 'tel')
+    _lock = threading.Lock()
+    _pages = 0
+    _sufficient = 0
+    _hits: Dict[str, int] = {source: 0 for source in SOURCES}
+
+    @classmethod
+    def record(cls, result: StructuredContactModel) -> None:
+        with cls._lock:
+            cls._pages += 1
+            if result.is_sufficient():
+                cls._sufficient += 1
+            for source in result.sources:
+                cls._hits[source] = cls._hits.get(source, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, float]:
+        """Páginas analisadas, acertos por fonte (%) e % em que o caminho rápido bastou"""
+        with cls._lock:
+            pages = cls._pages
+            stats = {'pages': pages, 'sufficient_pct': round(cls._sufficient / pages * 100, 1) if pages else 0.0}
+            for source, hits in cls._hits.items():
+                stats[f'{source}_pct'] = round(hits / pages * 100, 1) if pages else 0.0
+            return stats
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._pages = 0
+            cls._sufficient = 0
+            cls._hits = {source: 0 for source in cls.SOURCES}
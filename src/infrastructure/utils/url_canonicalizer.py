@@ -0,0 +1,37 @@
+"""
+Chaves de deduplicação de domínio (domínio registrável + cache de redirecionamentos)
+"""
+from typing import Optional
+
+from .domain_matcher import DomainNormalizer
+from ..storage.redirect_cache import RedirectCache
+
+
+class UrlCanonicalizer:
+    """Gera chave de deduplicação (domínio registrável pós-redirect)"""
+
+    def __init__(self, redirect_cache: Optional[RedirectCache] = None):
+        self.redirect_cache = redirect_cache if redirect_cache is not None else RedirectCache()
+
+    def canonical_key(self, url: str) -> str:
+        """Chave de deduplicação: domínio registrável resolvido pelo cache de redirecionamentos"""
+        domain = DomainNormalizer.domain_from_url(url)
+        return self.redirect_cache.resolve(domain) if domain else domain
+
+    def record_redirect(self, requested_url: str, final_url: str) -> Optional[str]:
+        """Registra redirect se a URL final estiver em outro domínio; retorna domínio final"""
+        if not final_url or not final_url.startswith('http'):
+            return None
+
+        source = DomainNormalizer.domain_from_url(requested_url)
+        final = DomainNormalizer.domain_from_url(final_url)
+        if not source or not final:
+            return None
+
+        if source != final:
+            self.redirect_cache.record(source, final)
+        return final
+
+    def save(self) -> None:
+        """Persiste cache de redirecionamentos"""
+        self.redirect_cache.save()
@@ -0,0 +1,52 @@
+"""
+Testes da forma canônica e da chave única de endereços
+"""
+import pytest
+
+from src.domain.models.address_model import AddressModel
+from src.infrastructure.utils.address_canonicalizer import AddressCanonicalizer
+
+
+def address(**fields) -> AddressModel:
+    values = dict(logradouro="Rua Doutor Arnaldo", numero="123", bairro="Cerqueira César",
+                  cidade="São Paulo", estado="SP", cep="01246000")
+    values.update(fields)
+    return AddressModel(**values)
+
+
+class TestAddressCanonicalizer:
+    """Mesmo endereço escrito de formas diferentes gera a mesma chave"""
+
+    def test_forma_canonica(self):
+        assert AddressCanonicalizer.canonical_form(address()) == "sp|sao paulo|01246000|rua doutor arnaldo|123|"
+
+    def test_variacoes_geram_mesma_chave(self):
+        variant = address(logradouro="R. Dr. Arnaldo", numero="0123", estado="São Paulo", cep="01246-000")
+        assert AddressCanonicalizer.canonical_key(variant) == AddressCanonicalizer.canonical_key(address())
+        assert len(AddressCanonicalizer.canonical_key(variant)) == 40
+
+    def test_bairro_nao_entra_na_chave(self):
+        assert AddressCanonicalizer.canonical_key(address(bairro="Pinheiros")) == \
+            AddressCanonicalizer.canonical_key(address())
+
+    @pytest.mark.parametrize("fields", [{'numero': "124"}, {'cep': "01246001"}, {'complemento': "sala 2"}])
+    def test_campos_distintos_geram_chaves_distintas(self, fields):
+        assert AddressCanonicalizer.canonical_key(address(**fields)) != AddressCanonicalizer.canonical_key(address())
+
+    def test_sem_logradouro_sem_chave(self):
+        assert AddressCanonicalizer.canonical_form(address(logradouro="")) is None
+        assert AddressCanonicalizer.canonical_key(address(logradouro=" . ")) is None
+
+    @pytest.mark.parametrize("numero, expected", [
+        ("Nº 0123-A", "123a"), ("3.477", "3477"), ("s/n", "sn"), ("S/N", "sn"), ("", "")
+    ])
+    def test_canonical_numero(self, numero, expected):
+        assert AddressCanonicalizer.canonical_numero(numero) == expected
+
+    @pytest.mark.parametrize("estado, expected", [("São Paulo", "sp"), ("SP", "sp"), ("Rio de Janeiro", "rj")])
+    def test_canonical_estado(self, estado, expected):
+        assert AddressCanonicalizer.canonical_estado(estado) == expected
+
+    def test_canonical_complemento(self):
+        assert AddressCanonicalizer.canonical_complemento("Cj. 12 - 3º and.") == "conjunto 12 3 andar"
+        assert AddressCanonicalizer.canonical_complemento("Sala 05") == "sala 5"
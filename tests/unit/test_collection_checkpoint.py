@@ -0,0 +1,60 @@
+"""
+Testes do checkpoint da coleta e dos sites adiados
+"""
+import pytest
+
+from src.infrastructure.storage.collection_checkpoint import CollectionCheckpoint
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "checkpoint.json"), str(tmp_path / "deferred.json")
+
+
+class TestCollectionCheckpoint:
+    """Retomada no termo, página e link exatos"""
+
+    def _interrupted(self, paths) -> None:
+        checkpoint = CollectionCheckpoint(*paths)
+        checkpoint.start_term(7, "elevadores Moema", "GOOGLE")
+        checkpoint.start_page(1, ["https://a.com.br", "https://b.com.br", "https://c.com.br"])
+        checkpoint.mark_done(["https://b.com.br"])
+
+    def test_sem_checkpoint(self, paths):
+        assert CollectionCheckpoint(*paths).resume_point(7) is None
+
+    def test_resume_point_consumido_uma_vez(self, paths):
+        self._interrupted(paths)
+        checkpoint = CollectionCheckpoint(*paths)
+        assert checkpoint.resume_point(8) is None
+        resumed = checkpoint.resume_point(7)
+        assert (resumed.term, resumed.engine, resumed.page) == ("elevadores Moema", "GOOGLE", 1)
+        assert resumed.last_rank == 2
+        assert resumed.pending_links() == ["https://a.com.br", "https://c.com.br"]
+        assert checkpoint.resume_point(7) is None
+
+    def test_mark_done_sem_repetir(self, paths):
+        checkpoint = CollectionCheckpoint(*paths)
+        checkpoint.start_term(1, "elevadores", "GOOGLE")
+        checkpoint.start_page(0, ["https://a.com.br"])
+        checkpoint.mark_done(["https://a.com.br"])
+        checkpoint.mark_done(["https://a.com.br"])
+        assert checkpoint.current.done == ["https://a.com.br"]
+
+    def test_finish_term_remove_checkpoint(self, paths):
+        self._interrupted(paths)
+        checkpoint = CollectionCheckpoint(*paths)
+        checkpoint.start_term(7, "elevadores Moema", "GOOGLE")
+        checkpoint.finish_term()
+        assert CollectionCheckpoint(*paths).resume_point(7) is None
+
+    def test_sites_adiados_persistem(self, paths):
+        checkpoint = CollectionCheckpoint(*paths)
+        site = {'link': "https://lento.com.br", 'domain': "lento.com.br", 'term': "elevadores", 'termo_id': 7}
+        checkpoint.add_deferred(site)
+        checkpoint.add_deferred(dict(site))
+        checkpoint.finish_term()
+        assert CollectionCheckpoint(*paths).deferred == [site]
+
+        checkpoint.clear_deferred()
+        assert CollectionCheckpoint(*paths).deferred == []
@@ -0,0 +1,97 @@
+"""
+Testes do normalizador de domínios e do matcher de blacklist
+"""
+from src.infrastructure.utils.domain_matcher import (
+    BlacklistMatcher, DomainNormalizer, HostSuffixTrie, KeywordAutomaton, get_blacklist_matcher
+)
+
+PATTERNS = ['facebook.com', 'maps.google', 'prefeitura', '/forum']
+
+
+class TestDomainNormalizer:
+    """Host normalizado e domínio registrável"""
+
+    def test_split_url_normaliza_host_e_resto(self):
+        assert DomainNormalizer.split_url("HTTPS://WWW.Empresa.com.br:443/Contato?x=1") == \
+            ("empresa.com.br", "/contato?x=1")
+
+    def test_normalize_host_remove_credenciais_porta_www_e_ponto_final(self):
+        assert DomainNormalizer.normalize_host("user@www2.site.com.br.") == "site.com.br"
+        assert DomainNormalizer.normalize_host("site.com.br:8080") == "site.com.br"
+
+    def test_normalize_host_ipv6(self):
+        assert DomainNormalizer.normalize_host("[::1]:8080") == "[::1]"
+
+    def test_extract_host_sem_esquema(self):
+        assert DomainNormalizer.extract_host("www.empresa.com.br/contato") == "empresa.com.br"
+
+    def test_registrable_domain_com_sufixo_publico(self):
+        assert DomainNormalizer.registrable_domain("loja.empresa.com.br") == "empresa.com.br"
+        assert DomainNormalizer.domain_from_url("https://blog.exemplo.co.uk/x") == "exemplo.co.uk"
+
+    def test_registrable_domain_vazio(self):
+        assert DomainNormalizer.registrable_domain("") == ""
+
+
+class TestHostSuffixTrie:
+    """Casamento de host por sufixo alinhado a labels"""
+
+    def test_sufixo_alinhado_a_labels(self):
+        trie = HostSuffixTrie(['facebook.com'])
+        assert trie.match('m.facebook.com') == 'facebook.com'
+        assert trie.match('notfacebook.com') is None
+
+    def test_padrao_sem_tld(self):
+        assert HostSuffixTrie(['maps.google']).match('maps.google.com.br') == 'maps.google'
+
+
+class TestKeywordAutomaton:
+    """Aho-Corasick compilado em DFA"""
+
+    def test_primeira_palavra_encontrada(self):
+        assert KeywordAutomaton(['he', 'she', 'hers']).search('ushers') == 'she'
+
+    def test_sem_ocorrencia(self):
+        assert KeywordAutomaton(['forum']).search('/contato') is None
+
+    def test_sem_palavras(self):
+        assert KeywordAutomaton([]).search('qualquer') is None
+
+
+class TestBlacklistMatcher:
+    """Hosts, palavras-chave do host e regras de caminho"""
+
+    def setup_method(self):
+        self.matcher = BlacklistMatcher(PATTERNS)
+
+    def test_separa_tipos_de_padrao(self):
+        assert self.matcher.host_patterns == ['facebook.com', 'maps.google']
+        assert self.matcher.keyword_patterns == ['prefeitura']
+        assert self.matcher.path_patterns == ['/forum']
+
+    def test_host_na_blacklist(self):
+        assert self.matcher.is_blacklisted('https://m.facebook.com/page')
+        assert self.matcher.is_blacklisted('https://maps.google.com.br/x')
+        assert not self.matcher.is_blacklisted('https://notfacebook.com')
+
+    def test_palavra_chave_somente_no_host(self):
+        assert self.matcher.is_blacklisted('https://www.prefeitura.sp.gov.br')
+        assert not self.matcher.is_blacklisted('https://site.com.br/contato?q=prefeitura')
+
+    def test_regra_de_caminho(self):
+        assert self.matcher.is_blacklisted('https://site.com.br/forum/topic')
+        assert not self.matcher.is_blacklisted('https://site.com.br/')
+
+    def test_classify(self):
+        result = self.matcher.classify('https://www.Loja.Facebook.com/x')
+        assert result.host == 'loja.facebook.com'
+        assert result.domain == 'facebook.com'
+        assert result.blacklisted
+        assert result.matched_pattern == 'facebook.com'
+
+    def test_filter_allowed_mantem_ordem(self):
+        urls = ['https://b.com.br', 'https://facebook.com/x', 'https://a.com.br']
+        assert self.matcher.filter_allowed(urls) == ['https://b.com.br', 'https://a.com.br']
+
+    def test_matcher_reutilizado_para_mesma_lista(self):
+        assert get_blacklist_matcher(PATTERNS) is get_blacklist_matcher(list(PATTERNS))
@@ -0,0 +1,149 @@
+"""
+Testes da fila de tarefas durável (reserva, ack em lote, nack com backoff e dead letter)
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.repositories.job_queue import DEAD_LETTER, DONE, PENDING, PROCESSING, JobQueue
+
+TABLE = "TB_CEP_ENRICHMENT"
+ID_COLUMN = "ID_CEP_ENRICHMENT"
+
+
+class SqliteRepository:
+    """Repositório em memória com a mesma interface usada pela fila no AccessRepository"""
+
+    def __init__(self, with_queue_columns: bool = True):
+        self.conn = sqlite3.connect(":memory:")
+        queue_columns = ", TENTATIVAS LONG, PROXIMA_TENTATIVA DATE, VISIVEL_ATE DATE" if with_queue_columns else ""
+        self.conn.execute(f"""
+            CREATE TABLE {TABLE} ({ID_COLUMN} INTEGER PRIMARY KEY, STATUS_PROCESSAMENTO TEXT,
+                                  DATA_PROCESSAMENTO TEXT, ERRO_DESCRICAO TEXT{queue_columns})
+        """)
+
+    def execute_query(self, query, params=None):
+        cursor = self.conn.execute(query, params or [])
+        return cursor.rowcount
+
+    def fetch_one(self, query, params=None):
+        return self.conn.execute(query, params or []).fetchone()
+
+    def fetch_all(self, query, params=None):
+        return self.conn.execute(query, params or []).fetchall()
+
+    def get_table_columns(self, table):
+        return {row[1].upper() for row in self.conn.execute(f"PRAGMA table_info({table})")}
+
+    def insert(self, job_id, status=PENDING, attempts=0):
+        self.conn.execute(f"INSERT INTO {TABLE} ({ID_COLUMN}, STATUS_PROCESSAMENTO, TENTATIVAS) VALUES (?, ?, ?)",
+                          [job_id, status, attempts])
+
+    def row(self, job_id):
+        return self.fetch_one(f"SELECT STATUS_PROCESSAMENTO, TENTATIVAS, PROXIMA_TENTATIVA, VISIVEL_ATE, "
+                              f"ERRO_DESCRICAO FROM {TABLE} WHERE {ID_COLUMN} = ?", [job_id])
+
+
+def make_config() -> SimpleNamespace:
+    return SimpleNamespace(job_queue_visibility_timeout_minutes=10, job_queue_max_attempts=3,
+                           job_queue_backoff_base_minutes=1, job_queue_backoff_max_minutes=30,
+                           job_queue_ack_batch_size=2, job_queue_claim_batch_size=10)
+
+
+@pytest.fixture(autouse=True)
+def iso_datetimes():
+    sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+
+
+@pytest.fixture
+def repository():
+    repository = SqliteRepository()
+    for job_id in (1, 2, 3):
+        repository.insert(job_id)
+    return repository
+
+
+@pytest.fixture
+def queue(repository):
+    return JobQueue(repository, TABLE, ID_COLUMN, make_config())
+
+
+class TestJobQueue:
+    """Entrega ao menos uma vez com tentativas limitadas"""
+
+    def test_claim_reserva_e_conta_tentativa(self, queue, repository):
+        assert queue.claim([1, 2]) == [1, 2]
+        status, attempts, _, visible_until, _ = repository.row(1)
+        assert (status, attempts) == (PROCESSING, 1)
+        assert visible_until is not None
+
+    def test_claim_nao_repete_reserva_valida(self, queue):
+        assert queue.claim([1]) == [1]
+        assert queue.claim([1, 2]) == [2]
+
+    def test_claim_recupera_reserva_vencida(self, queue, repository):
+        queue.claim([1])
+        repository.execute_query(f"UPDATE {TABLE} SET VISIVEL_ATE = ? WHERE {ID_COLUMN} = 1",
+                                 [datetime.now() - timedelta(minutes=1)])
+        assert queue.claim([1]) == [1]
+        assert repository.row(1)[1] == 2
+
+    def test_ack_em_lote(self, queue, repository):
+        queue.claim([1, 2, 3])
+        queue.ack(1)
+        assert repository.row(1)[0] == PROCESSING
+        queue.ack(2)
+        assert (repository.row(1)[0], repository.row(2)[0]) == (DONE, DONE)
+        queue.ack(3)
+        assert repository.row(3)[0] == PROCESSING
+        queue.flush()
+        status, _, _, visible_until, _ = repository.row(3)
+        assert (status, visible_until) == (DONE, None)
+
+    def test_nack_reagenda_com_backoff(self, queue, repository):
+        queue.claim([1])
+        assert queue.nack(1, "timeout ViaCEP") == PENDING
+        status, _, next_attempt, visible_until, erro = repository.row(1)
+        assert (status, visible_until, erro) == (PENDING, None, "timeout ViaCEP")
+        assert next_attempt > datetime.now().isoformat(" ")
+        assert queue.claim([1]) == []  # Ainda dentro do backoff
+
+    def test_nack_apos_max_tentativas_vai_para_dead_letter(self, queue, repository):
+        repository.execute_query(f"UPDATE {TABLE} SET TENTATIVAS = 2 WHERE {ID_COLUMN} = 1")
+        queue.claim([1])
+        assert queue.nack(1, "falhou") == DEAD_LETTER
+        assert repository.row(1)[0] == DEAD_LETTER
+        assert queue.claim([1]) == []
+
+    def test_nack_permanente(self, queue, repository):
+        queue.claim([1])
+        assert queue.nack(1, "CEP inexistente", permanent=True) == DEAD_LETTER
+        assert repository.row(1)[2] is None
+
+    def test_next_attempt_at_exponencial_e_limitado(self, queue):
+        before = datetime.now()
+        assert queue.next_attempt_at(1) - before == pytest.approx(timedelta(minutes=1), abs=timedelta(seconds=1))
+        assert queue.next_attempt_at(3) - before == pytest.approx(timedelta(minutes=4), abs=timedelta(seconds=1))
+        assert queue.next_attempt_at(10) - before == pytest.approx(timedelta(minutes=30), abs=timedelta(seconds=1))
+
+    def test_recover_expired_descarta_reserva_esgotada(self, queue, repository):
+        queue.claim([1, 2])
+        repository.execute_query(f"UPDATE {TABLE} SET VISIVEL_ATE = ?, TENTATIVAS = 3 WHERE {ID_COLUMN} = 1",
+                                 [datetime.now() - timedelta(minutes=1)])
+        assert queue.recover_expired() == 1
+        assert repository.row(1)[0] == DEAD_LETTER
+        assert repository.row(2)[0] == PROCESSING
+
+    def test_ensure_schema_cria_colunas_ausentes(self):
+        repository = SqliteRepository(with_queue_columns=False)
+        repository.conn.execute(f"INSERT INTO {TABLE} ({ID_COLUMN}, STATUS_PROCESSAMENTO) VALUES (1, ?)", [PENDING])
+        JobQueue(repository, TABLE, ID_COLUMN, make_config()).ensure_schema()
+        assert {'TENTATIVAS', 'PROXIMA_TENTATIVA', 'VISIVEL_ATE'} <= repository.get_table_columns(TABLE)
+        assert repository.row(1)[1] == 0
+
+    def test_get_stats_conta_erro_legado_como_dead_letter(self, queue, repository):
+        repository.insert(4, status='ERRO')
+        queue.claim([1])
+        assert queue.get_stats() == {PENDING: 2, PROCESSING: 1, DONE: 0, DEAD_LETTER: 1}
@@ -0,0 +1,66 @@
+"""
+Testes da paginação adaptativa por taxa de domínios novos
+"""
+from types import SimpleNamespace
+
+from src.infrastructure.utils.pagination_cutoff import PaginationCutoff
+
+
+def make_config(enabled: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(pagination_cutoff_enabled=enabled, pagination_min_new_ratio=0.3,
+                           pagination_max_first_page_overlap=0.8, pagination_overlap_window=5)
+
+
+def page(prefix: str, count: int = 10):
+    return [f"{prefix}{i}.com.br" for i in range(count)]
+
+
+class TestPaginationCutoff:
+    """Encerra o termo quando as páginas deixam de trazer domínios novos"""
+
+    def test_continua_com_dominios_novos(self):
+        cutoff = PaginationCutoff(make_config())
+        cutoff.start_term(pages=5)
+        assert cutoff.should_continue(page("a"), lambda d: True)
+        assert cutoff.get_stats()['pages_saved'] == 0
+
+    def test_baixo_rendimento_encerra(self):
+        cutoff = PaginationCutoff(make_config())
+        cutoff.start_term(pages=5)
+        known = set(page("a")[:8])
+        assert not cutoff.should_continue(page("a"), lambda d: d not in known)
+        stats = cutoff.get_stats()
+        assert stats['cutoffs_low_yield'] == 1
+        assert stats['pages_saved'] == 4
+        assert stats['pages_read'] == 1
+
+    def test_ultima_pagina_sempre_continua(self):
+        cutoff = PaginationCutoff(make_config())
+        cutoff.start_term(pages=1)
+        assert cutoff.should_continue(page("a"), lambda d: False)
+        assert cutoff.get_stats()['pages_saved'] == 0
+
+    def test_primeira_pagina_repetida_encerra(self):
+        cutoff = PaginationCutoff(make_config())
+        cutoff.start_term(pages=3)
+        assert cutoff.should_continue(page("a"), lambda d: True)
+        cutoff.start_term(pages=3)
+        assert not cutoff.should_continue(page("a", 9) + ["novo.com.br"], lambda d: True)
+        assert cutoff.get_stats()['cutoffs_overlap'] == 1
+        assert cutoff.get_stats()['pages_saved'] == 2
+
+    def test_pagina_acumulada_conta_so_dominios_ineditos_do_termo(self):
+        cutoff = PaginationCutoff(make_config())
+        cutoff.start_term(pages=5)
+        assert cutoff.should_continue(page("a"), lambda d: True)
+        # DuckDuckGo: a 2ª "página" repete os 10 primeiros e traz 2 novos
+        fresh = {"b0.com.br", "b1.com.br"}
+        assert cutoff.should_continue(page("a") + sorted(fresh), lambda d: d in fresh)
+
+    def test_desabilitado_sempre_continua(self):
+        cutoff = PaginationCutoff(make_config(enabled=False))
+        cutoff.start_term(pages=5)
+        assert cutoff.should_continue(page("a"), lambda d: False)
+        cutoff.start_term(pages=5)
+        assert cutoff.should_continue(page("a"), lambda d: False)
+        assert cutoff.get_stats()['pages_saved'] == 0
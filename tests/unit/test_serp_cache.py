@@ -0,0 +1,74 @@
+"""
+Testes do cache de páginas de resultados
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.storage.serp_cache import SerpCache
+
+
+def make_config(enabled: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(serp_cache_enabled=enabled, serp_cache_ttl_hours=1)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "serp_cache.json")
+
+
+class TestSerpCache:
+    """Links por (motor, termo normalizado, página) com validade"""
+
+    def test_normalize_term(self):
+        assert SerpCache.normalize_term("  Elevadores   São  Paulo ") == "elevadores sao paulo"
+
+    def test_put_e_get_com_termo_normalizado(self, cache_path):
+        cache = SerpCache(cache_path, make_config())
+        cache.put("GOOGLE", "Elevadores São Paulo", 1, ["https://a.com.br"])
+        assert cache.get("GOOGLE", "elevadores sao paulo", 1) == ["https://a.com.br"]
+        assert cache.get("GOOGLE", "elevadores sao paulo", 2) is None
+        assert cache.get("DUCKDUCKGO", "elevadores sao paulo", 1) is None
+        assert cache.get_stats()['pages_replayed'] == 1
+
+    def test_entrada_vence_apos_ttl(self, cache_path, monkeypatch):
+        cache = SerpCache(cache_path, make_config())
+        cache.put("GOOGLE", "elevadores", 1, ["https://a.com.br"])
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 3599)
+        assert cache.get("GOOGLE", "elevadores", 1) == ["https://a.com.br"]
+        monkeypatch.setattr(time, "time", lambda: now + 3601)
+        assert cache.get("GOOGLE", "elevadores", 1) is None
+        assert cache.find_engine("elevadores", ["GOOGLE"]) is None
+
+    def test_find_engine(self, cache_path):
+        cache = SerpCache(cache_path, make_config())
+        cache.put("DUCKDUCKGO", "elevadores", 1, ["https://a.com.br"])
+        assert cache.find_engine("Elevadores", ["GOOGLE", "DUCKDUCKGO"]) == "DUCKDUCKGO"
+        assert cache.find_engine("escadas", ["GOOGLE", "DUCKDUCKGO"]) is None
+        stats = cache.get_stats()
+        assert (stats['term_hits'], stats['term_misses']) == (1, 1)
+
+    def test_carga_descarta_vencidas(self, cache_path, monkeypatch):
+        cache = SerpCache(cache_path, make_config())
+        cache.put("GOOGLE", "elevadores", 1, ["https://a.com.br"])
+        cache.save()
+        assert len(SerpCache(cache_path, make_config())._entries) == 1
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 7200)
+        assert SerpCache(cache_path, make_config()).get_stats()['entries'] == 0
+
+    def test_desabilitado(self, cache_path):
+        cache = SerpCache(cache_path, make_config(enabled=False))
+        cache.put("GOOGLE", "elevadores", 1, ["https://a.com.br"])
+        assert cache.get("GOOGLE", "elevadores", 1) is None
+        assert cache.find_engine("elevadores", ["GOOGLE"]) is None
+
+    def test_get_sources_usa_o_motor_por_padrao(self, cache_path):
+        cache = SerpCache(cache_path, make_config())
+        cache.put("GOOGLE", "elevadores", 1, ["https://a.com.br", "https://b.com.br"],
+                  sources={"https://b.com.br": "DUCKDUCKGO"})
+        assert cache.get_sources("GOOGLE", "elevadores", 1) == {
+            "https://a.com.br": "GOOGLE", "https://b.com.br": "DUCKDUCKGO"}
+        assert cache.get_sources("GOOGLE", "elevadores", 2) == {}
@@ -0,0 +1,69 @@
+"""
+Testes do SimHash de conteúdo e do índice de quase-duplicatas
+"""
+from src.domain.models.fingerprint_model import FingerprintModel
+from src.infrastructure.utils.simhash import MIN_TEXT_WORDS, SimHasher, SimHashIndex
+
+TEXT = ' '.join(f"elevadores manutencao preventiva item{i}" for i in range(30))
+
+
+class TestSimHasher:
+    """Fingerprint de 64 bits sobre shingles de palavras"""
+
+    def test_texto_curto_nao_gera_fingerprint(self):
+        assert SimHasher.fingerprint(' '.join(['palavra'] * (MIN_TEXT_WORDS - 1))) is None
+
+    def test_mesmo_texto_mesmo_fingerprint(self):
+        fingerprint = SimHasher.fingerprint(TEXT)
+        assert fingerprint is not None
+        assert fingerprint == SimHasher.fingerprint(TEXT.upper())
+
+    def test_texto_parecido_fica_proximo(self):
+        fingerprint = SimHasher.fingerprint(TEXT)
+        changed = SimHasher.fingerprint(TEXT.replace('item29', 'contato'))
+        other = SimHasher.fingerprint(' '.join(f"padaria pao frances bolo{i}" for i in range(30)))
+        assert SimHasher.hamming_distance(fingerprint, changed) <= 3
+        assert SimHasher.hamming_distance(fingerprint, other) > 3
+
+    def test_hamming_distance(self):
+        assert SimHasher.hamming_distance(0b1010, 0b0110) == 2
+
+    def test_hex_ida_e_volta(self):
+        fingerprint = SimHasher.fingerprint(TEXT)
+        assert len(SimHasher.to_hex(fingerprint)) == 16
+        assert SimHasher.from_hex(SimHasher.to_hex(fingerprint)) == fingerprint
+
+    def test_hex_invalido_ou_vazio(self):
+        assert SimHasher.to_hex(None) == ""
+        assert SimHasher.from_hex("") is None
+        assert SimHasher.from_hex("zz") is None
+
+
+class TestSimHashIndex:
+    """Busca por bandas com distância de Hamming limitada"""
+
+    def setup_method(self):
+        self.fingerprint = 0x0123456789ABCDEF
+        self.index = SimHashIndex()
+        self.index.add(FingerprintModel(domain="original.com.br", fingerprint=self.fingerprint))
+
+    def test_encontra_dentro_do_limite(self):
+        entry, distance = self.index.find_near_duplicate(self.fingerprint ^ 0b111)
+        assert entry.domain == "original.com.br"
+        assert distance == 3
+
+    def test_ignora_fora_do_limite(self):
+        assert self.index.find_near_duplicate(self.fingerprint ^ 0b1111) is None
+
+    def test_exclui_o_proprio_dominio(self):
+        assert self.index.find_near_duplicate(self.fingerprint, exclude_domain="original.com.br") is None
+
+    def test_prefere_a_entrada_mais_proxima(self):
+        self.index.add(FingerprintModel(domain="copia.com.br", fingerprint=self.fingerprint ^ 0b1))
+        entry, distance = self.index.find_near_duplicate(self.fingerprint ^ 0b11)
+        assert (entry.domain, distance) == ("copia.com.br", 1)
+
+    def test_fingerprint_none(self):
+        self.index.add(FingerprintModel(domain="vazio.com.br", fingerprint=None))
+        assert len(self.index) == 1
+        assert self.index.find_near_duplicate(None) is None
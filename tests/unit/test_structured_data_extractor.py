@@ -0,0 +1,83 @@
+"""
+Testes do extrator de dados estruturados (JSON-LD, microdata, mailto:, tel:)
+"""
+import pytest
+
+from src.infrastructure.utils.structured_data_extractor import StructuredDataExtractor
+
+MICRODATA_HTML = """
+<div itemscope itemtype="https://schema.org/LocalBusiness">
+  <span itemprop="name">ACME Elevadores</span>
+  <a itemprop="email" href="mailto:contato@acme.com.br">contato@acme.com.br</a>
+  <span itemprop="telephone">(11) 3333-4444</span>
+  <div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">
+    <span itemprop="streetAddress">Rua Augusta, 100</span>
+    <span itemprop="addressLocality">São Paulo</span>
+    <span itemprop="addressRegion">SP</span>
+    <meta itemprop="postalCode" content="01305-000">
+  </div>
+</div>
+"""
+
+JSON_LD_HTML = """
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [{"@type": "LocalBusiness", "name": "Beta Elevadores",
+ "email": "mailto:Vendas@Beta.com.br", "telephone": ["+55 11 98765-4321"],
+ "address": {"@type": "PostalAddress", "streetAddress": "Av. Paulista, 1000",
+             "addressLocality": "São Paulo", "addressRegion": "sp", "postalCode": "01310-100"}}]}
+</script>
+"""
+
+
+class TestNormalizePhone:
+    """Telefones normalizados para DDD + número"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("+55 (11) 3333-4444", "1133334444"),
+        ("+55 11 98765-4321", "11987654321"),
+        ("(011) 98765-4321", "11987654321"),
+        ("0800 123 4567", "08001234567"),
+        ("0800 123 456", ""),
+        ("123", ""),
+    ])
+    def test_normalize_phone(self, value, expected):
+        assert StructuredDataExtractor._normalize_phone(value) == expected
+
+
+class TestStructuredDataExtractor:
+    """Contatos e endereço publicados em marcação estruturada"""
+
+    def test_microdata(self):
+        result = StructuredDataExtractor.extract(MICRODATA_HTML)
+        assert result.name == "ACME Elevadores"
+        assert result.emails == ["contato@acme.com.br"]
+        assert result.phones == ["1133334444"]
+        assert (result.address.logradouro, result.address.numero) == ("Rua Augusta", "100")
+        assert (result.address.cidade, result.address.estado, result.address.cep) == ("São Paulo", "SP", "01305000")
+        assert "microdata" in result.sources
+        assert result.is_sufficient()
+
+    def test_json_ld(self):
+        result = StructuredDataExtractor.extract(JSON_LD_HTML)
+        assert result.name == "Beta Elevadores"
+        assert result.emails == ["vendas@beta.com.br"]
+        assert result.phones == ["11987654321"]
+        assert (result.address.logradouro, result.address.numero) == ("Av. Paulista", "1000")
+        assert (result.address.estado, result.address.cep) == ("SP", "01310100")
+        assert result.sources == {"json_ld"}
+
+    def test_mailto_e_tel(self):
+        result = StructuredDataExtractor.extract(
+            '<a href="mailto:sac@gama.com.br?subject=Oi">e-mail</a><a href="tel:+551140041234">ligar</a>')
+        assert result.emails == ["sac@gama.com.br"]
+        assert result.phones == ["1140041234"]
+        assert result.sources == {"mailto", "tel"}
+        assert not result.is_sufficient()
+
+    def test_html_vazio(self):
+        result = StructuredDataExtractor.extract("")
+        assert not result.emails and not result.phones and result.address is None
+
+    def test_extract_address(self):
+        assert StructuredDataExtractor.extract_address(MICRODATA_HTML).cep == "01305000"
+        assert StructuredDataExtractor.extract_address("<p>sem marcação</p>") is None
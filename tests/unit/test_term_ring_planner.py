@@ -0,0 +1,69 @@
+"""
+Testes do plano de busca em anéis de distância
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.storage.term_ring_planner import TermRingPlanner
+
+LOCATIONS = {
+    'cities': [{'name': 'São Paulo', 'distance_km': 0.0}],
+    'neighborhoods': [{'name': 'Santo Amaro', 'city': 'São Paulo', 'distance_km': 12.0},
+                      {'name': 'Moema', 'city': 'São Paulo', 'distance_km': 3.2}]
+}
+
+
+def make_config() -> SimpleNamespace:
+    return SimpleNamespace(term_rings_enabled=True, term_rings_width_km=5)
+
+
+@pytest.fixture
+def plan_path(tmp_path):
+    return str(tmp_path / "term_rings.json")
+
+
+class TestTermRingPlanner:
+    """Termos liberados anel a anel, do centro para fora"""
+
+    def test_aneis_em_ordem_pulando_vazios(self, plan_path):
+        planner = TermRingPlanner(plan_path, make_config())
+        planner.build(LOCATIONS, ['elevadores'])
+        assert planner.rings_total == 3
+
+        radius, terms = planner.next_ring()
+        assert radius == 5.0
+        assert [t['termo'] for t in terms] == ["elevadores São Paulo", "elevadores Moema"]
+        assert terms[1]['tipo_localizacao'] == 'BAIRRO'
+        assert terms[1]['cidade_pai'] == 'São Paulo'
+
+        radius, terms = planner.next_ring()  # Anel 5-10 km vazio
+        assert radius == 15.0
+        assert [t['termo'] for t in terms] == ["elevadores Santo Amaro"]
+        assert planner.exhausted
+
+        assert planner.next_ring() == (0.0, [])
+
+    def test_um_termo_por_categoria(self, plan_path):
+        planner = TermRingPlanner(plan_path, make_config())
+        planner.build({'cities': [{'name': 'Osasco', 'distance_km': 1.0}]}, ['elevadores', 'escadas rolantes'])
+        _, terms = planner.next_ring()
+        assert [t['termo'] for t in terms] == ["elevadores Osasco", "escadas rolantes Osasco"]
+        assert all(t['status'] == 'PENDENTE' for t in terms)
+
+    def test_retoma_do_anel_salvo(self, plan_path):
+        planner = TermRingPlanner(plan_path, make_config())
+        planner.build(LOCATIONS, ['elevadores'])
+        planner.next_ring()
+
+        reloaded = TermRingPlanner(plan_path, make_config())
+        assert reloaded.rings_emitted == 1
+        radius, terms = reloaded.next_ring()
+        assert radius == 15.0
+        assert [t['localizacao'] for t in terms] == ["Santo Amaro"]
+
+    def test_plano_vazio_esgotado(self, plan_path):
+        planner = TermRingPlanner(plan_path, make_config())
+        assert planner.exhausted
+        assert planner.rings_total == 0
+        assert planner.next_ring() == (0.0, [])
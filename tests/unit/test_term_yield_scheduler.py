@@ -0,0 +1,78 @@
+"""
+Testes do agendador de termos por rendimento
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.models.term_yield_model import TermYieldModel
+from src.infrastructure.storage.term_yield_scheduler import COLD_START_RATE, TermYieldScheduler
+
+CATEGORIES = ['elevadores', 'elevadores residenciais']
+
+
+def make_config(enabled: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(term_scheduler_enabled=enabled, term_scheduler_prior_minutes=10,
+                           term_scheduler_distance_scale_km=20, term_scheduler_retire_min_pages=6,
+                           term_scheduler_retire_below=0.2)
+
+
+def term(termo: str, tipo: str = 'BAIRRO') -> dict:
+    return {'termo': termo, 'tipo': tipo}
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    return TermYieldScheduler(CATEGORIES, str(tmp_path / "term_yield.json"), make_config())
+
+
+class TestTermYieldScheduler:
+    """Prioridade por empresas novas/minuto e aposentadoria de combinações improdutivas"""
+
+    def test_split_term_prefere_categoria_mais_longa(self, scheduler):
+        assert scheduler.split_term("Elevadores Residenciais Moema") == ("elevadores residenciais", "Moema")
+        assert scheduler.split_term("elevadores Moema") == ("elevadores", "Moema")
+        assert scheduler.split_term("escadas rolantes Moema") == ("", "escadas rolantes Moema")
+
+    def test_sem_historico_ordena_por_distancia(self, scheduler):
+        scheduler.register_distances({'Moema': 3.0, 'Santo Amaro': 12.0, 'Pinheiros': 20.0})
+        pending = [term("elevadores Pinheiros"), term("elevadores Santo Amaro"), term("elevadores Moema")]
+        ordered, retired = scheduler.order(pending)
+        assert [t['termo'] for t in ordered] == ["elevadores Moema", "elevadores Santo Amaro", "elevadores Pinheiros"]
+        assert retired == []
+        assert scheduler.score(term("elevadores Pinheiros")) == pytest.approx(COLD_START_RATE / 2)
+
+    def test_combinacao_produtiva_sobe(self, scheduler):
+        scheduler.record("elevadores Moema", 'CIDADE',
+                         TermYieldModel(runs=1, pages=3, new_companies=30, seconds=300))
+        ordered, _ = scheduler.order([term("elevadores Itaim", 'BAIRRO'), term("elevadores Osasco", 'CIDADE')])
+        assert ordered[0]['termo'] == "elevadores Osasco"
+
+    def test_rate_suavizado_pela_taxa_a_priori(self, scheduler):
+        assert scheduler._rate(None, 1.0) == 1.0
+        assert scheduler._rate(TermYieldModel(new_companies=0, seconds=600), 1.0) == pytest.approx(0.5)
+
+    def test_aposenta_combinacao_improdutiva(self, scheduler):
+        scheduler.record("elevadores Moema", 'BAIRRO', TermYieldModel(runs=1, pages=5, new_companies=0, seconds=60))
+        assert not scheduler._is_retired(term("elevadores Itaim"))
+        scheduler.record("elevadores Moema", 'BAIRRO', TermYieldModel(runs=1, pages=1, new_companies=1, seconds=60))
+        assert scheduler._is_retired(term("elevadores Itaim"))
+        assert not scheduler._is_retired(term("elevadores Osasco", 'CIDADE'))
+        assert not scheduler._is_retired(term("elevadores residenciais Itaim"))
+        ordered, retired = scheduler.order([term("elevadores Itaim"), term("elevadores Osasco", 'CIDADE')])
+        assert [t['termo'] for t in retired] == ["elevadores Itaim"]
+        assert [t['termo'] for t in ordered] == ["elevadores Osasco"]
+
+    def test_desabilitado_mantem_ordem(self, tmp_path):
+        scheduler = TermYieldScheduler(CATEGORIES, str(tmp_path / "term_yield.json"), make_config(enabled=False))
+        scheduler.record("elevadores Moema", 'BAIRRO', TermYieldModel(pages=10))
+        pending = [term("elevadores Moema"), term("elevadores Itaim")]
+        assert scheduler.order(pending) == (pending, [])
+
+    def test_persistencia(self, scheduler, tmp_path):
+        scheduler.register_distances({'Moema': 3.0})
+        scheduler.record("elevadores Moema", 'BAIRRO', TermYieldModel(runs=1, pages=2, new_companies=4, seconds=120))
+        scheduler.save()
+        reloaded = TermYieldScheduler(CATEGORIES, str(tmp_path / "term_yield.json"), make_config())
+        assert reloaded.score(term("elevadores Moema")) == pytest.approx(scheduler.score(term("elevadores Moema")))
+        assert reloaded.report()['terms'] == 1
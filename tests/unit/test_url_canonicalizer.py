@@ -0,0 +1,50 @@
+"""
+Testes da chave de deduplicação de domínio e do cache de redirecionamentos
+"""
+from src.infrastructure.storage.redirect_cache import RedirectCache
+from src.infrastructure.utils.url_canonicalizer import UrlCanonicalizer
+
+
+class TestUrlCanonicalizer:
+    """Domínio registrável resolvido pelos redirecionamentos observados"""
+
+    def _canonicalizer(self, tmp_path) -> UrlCanonicalizer:
+        return UrlCanonicalizer(RedirectCache(str(tmp_path / "redirects.json")))
+
+    def test_canonical_key_sem_redirect(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        assert canonicalizer.canonical_key("https://www.loja.empresa.com.br/contato") == "empresa.com.br"
+
+    def test_record_redirect_para_outro_dominio(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        assert canonicalizer.record_redirect("http://antigo.com.br/x", "https://www.novo.com.br/") == "novo.com.br"
+        assert canonicalizer.canonical_key("https://antigo.com.br/outra") == "novo.com.br"
+
+    def test_redirect_no_mesmo_dominio_nao_e_gravado(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        assert canonicalizer.record_redirect("http://empresa.com.br", "https://www.empresa.com.br/") == \
+            "empresa.com.br"
+        assert len(canonicalizer.redirect_cache) == 0
+
+    def test_url_final_invalida(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        assert canonicalizer.record_redirect("http://empresa.com.br", "about:blank") is None
+        assert canonicalizer.record_redirect("http://empresa.com.br", "") is None
+
+    def test_cadeia_de_redirects(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        canonicalizer.record_redirect("http://a.com.br", "http://b.com.br")
+        canonicalizer.record_redirect("http://b.com.br", "http://c.com.br")
+        assert canonicalizer.canonical_key("http://a.com.br") == "c.com.br"
+
+    def test_ciclo_nao_trava(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        canonicalizer.record_redirect("http://a.com.br", "http://b.com.br")
+        canonicalizer.record_redirect("http://b.com.br", "http://a.com.br")
+        assert canonicalizer.canonical_key("http://a.com.br") == "b.com.br"
+
+    def test_persistencia(self, tmp_path):
+        canonicalizer = self._canonicalizer(tmp_path)
+        canonicalizer.record_redirect("http://antigo.com.br", "http://novo.com.br")
+        canonicalizer.save()
+        assert self._canonicalizer(tmp_path).canonical_key("http://antigo.com.br") == "novo.com.br"